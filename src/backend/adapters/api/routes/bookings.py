@@ -72,8 +72,8 @@ def list_bookings(
         client=client,
         booking=booking,
         status=status,
-        date_from=date_from.isoformat() if date_from is not None else None,
-        date_to=date_to.isoformat() if date_to is not None else None,
+        date_from=date_from,
+        date_to=date_to,
         sort_by=sort_by,
         descending=descending,
     )
@@ -1,5 +1,5 @@
 """Documents API routes."""
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
 from typing import Annotated, Literal, NoReturn
 from uuid import UUID
@@ -53,6 +53,12 @@ def list_documents(
     party: Annotated[str | None, Query(description="Filter by client/provider name")] = None,
     booking: Annotated[str | None, Query(description="Filter by booking reference")] = None,
     limit: Annotated[int, Query(ge=1, le=500, description="Maximum results")] = 100,
+    cursor: Annotated[
+        datetime | None, Query(description="next_cursor from the previous page")
+    ] = None,
+    cursor_id: Annotated[
+        UUID | None, Query(description="next_cursor_id from the previous page")
+    ] = None,
     use_case: ListDocumentsUseCase = Depends(get_list_documents_use_case),
 ) -> ListDocumentsResponse:
     """List documents with optional status filtering."""
@@ -60,15 +66,20 @@ def list_documents(
         dto_request = ListDocumentsRequest(
             status=status,
             document_type=document_type,
-            date_from=date_from.isoformat() if date_from else None,
-            date_to=date_to.isoformat() if date_to else None,
+            date_from=date_from,
+            date_to=date_to,
             party=party,
             booking=booking,
             limit=limit,
+            cursor=cursor,
+            cursor_id=cursor_id,
         )
         documents = use_case.execute(dto_request)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    # A full page may have more behind it; a short one is the last
+    last = documents[-1] if len(documents) == limit else None
     return ListDocumentsResponse(
         documents=[
             DocumentListItem(
@@ -93,6 +104,8 @@ def list_documents(
             for doc in documents
         ],
         total=len(documents),
+        next_cursor=last.created_at if last else None,
+        next_cursor_id=last.id if last else None,
     )
 
 
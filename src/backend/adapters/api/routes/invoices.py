@@ -123,6 +123,8 @@ class InvoiceListItem(BaseModel):
     party_name: str | None
     booking_references: list[str]
     total_amount: Decimal
+    charge_count: int
+    charges_total: Decimal
 
 
 class ListInvoicesResponse(BaseModel):
@@ -130,6 +132,9 @@ class ListInvoicesResponse(BaseModel):
 
     invoices: list[InvoiceListItem]
     total: int
+    # Pass both back as cursor/cursor_id to fetch the next page; None on the last page
+    next_cursor: date | None = None
+    next_cursor_id: UUID | None = None
 
 
 @router.get("", response_model=ListInvoicesResponse, status_code=200)
@@ -143,6 +148,10 @@ def list_invoices(
         Query(description="Filter by invoice type"),
     ] = None,
     limit: Annotated[int, Query(ge=1, le=500, description="Maximum results")] = 100,
+    cursor: Annotated[date | None, Query(description="next_cursor from the previous page")] = None,
+    cursor_id: Annotated[
+        UUID | None, Query(description="next_cursor_id from the previous page")
+    ] = None,
     use_case: ListInvoicesUseCase = Depends(get_list_invoices_use_case),
 ) -> ListInvoicesResponse:
     """Search persisted invoices by number, party, date range, and type."""
@@ -151,15 +160,20 @@ def list_invoices(
             ListInvoicesRequest(
                 invoice_number=invoice_number,
                 party=party,
-                date_from=date_from.isoformat() if date_from else None,
-                date_to=date_to.isoformat() if date_to else None,
+                date_from=date_from,
+                date_to=date_to,
                 invoice_type=invoice_type,
                 limit=limit,
+                cursor=cursor,
+                cursor_id=cursor_id,
             )
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    # A full page may have more behind it; a short one is the last
+    last = items[-1] if len(items) == limit else None
+
     return ListInvoicesResponse(
         invoices=[
             InvoiceListItem(
@@ -170,10 +184,14 @@ def list_invoices(
                 party_name=item.party_name,
                 booking_references=item.booking_references,
                 total_amount=item.total_amount,
+                charge_count=item.charge_count,
+                charges_total=item.charges_total,
             )
             for item in items
         ],
         total=len(items),
+        next_cursor=last.invoice_date if last else None,
+        next_cursor_id=last.id if last else None,
     )
 
 
@@ -245,7 +263,7 @@ def confirm_document(
             ai_model=request.ai_model,
             raw_json=request.raw_json,
             overall_confidence=request.overall_confidence,
-            manually_edited_fields=request.manually_edited_fields,
+            manually_edited_fields=tuple(request.manually_edited_fields),
             invoice_number=request.invoice_number,
             invoice_date=(
                 request.invoice_date.isoformat()
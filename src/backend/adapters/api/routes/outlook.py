@@ -112,6 +112,7 @@ def outlook_callback(
         settings = settings_repo.get() or Settings.create()
         settings.set_outlook_configured(True, refresh_token=refresh_token)
         settings_repo.save(settings)
+        db.commit()
         return HTMLResponse(
             content=(
                 "<html><body><h2>Outlook connected successfully.</h2>"
@@ -134,11 +135,13 @@ def outlook_callback(
 @router.post("/disconnect", response_model=OutlookDisconnectResponse, status_code=200)
 def disconnect_outlook(
     settings_repo: Annotated[SettingsRepository, Depends(get_settings_repository)],
+    db: Session = Depends(get_db),
 ) -> OutlookDisconnectResponse:
     """Disconnect Outlook integration and clear stored refresh token."""
     settings = settings_repo.get() or Settings.create()
     settings.disconnect_outlook()
     settings_repo.save(settings)
+    db.commit()
     return OutlookDisconnectResponse(outlook_configured=settings.outlook_configured)
 
 
@@ -39,6 +39,9 @@ class ListDocumentsResponse(BaseModel):
 
     documents: list[DocumentListItem]
     total: int
+    # Pass both back as cursor/cursor_id to fetch the next page; None on the last page
+    next_cursor: datetime | None = None
+    next_cursor_id: UUID | None = None
 
 
 class ListDocumentsParams(BaseModel):
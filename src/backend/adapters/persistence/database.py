@@ -2,17 +2,46 @@
 
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
+from uuid import UUID
 
-from sqlalchemy import create_engine
+from sqlalchemy import Dialect, LargeBinary, TypeDecorator, Uuid, create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.types import TypeEngine
 
 from backend.config import get_settings
 
 
+class BinaryUUID(TypeDecorator[UUID]):
+    """UUID stored as 16 raw bytes, or as the native type where one exists.
+
+    SQLite has no UUID type, so the default would be a 32-character hex string;
+    raw bytes halve key and index size and compare with a plain memcmp.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(Uuid())
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value: UUID | None, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return value.bytes
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> UUID | None:  # noqa: ARG002
+        if value is None or isinstance(value, UUID):
+            return value
+        return UUID(bytes=value)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
-    pass
+    type_annotation_map = {UUID: BinaryUUID}
 
 
 def get_database_url() -> str:
@@ -27,12 +56,36 @@ def get_database_url() -> str:
     return settings.database_url
 
 
+# Applied to every new SQLite connection. WAL turns each commit into a single
+# append and lets readers proceed while a write is in progress; NORMAL sync is
+# still crash-safe in WAL mode.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-131072",
+)
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Tune a new SQLite connection (engine "connect" event listener)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 # Create engine with SQLite-specific settings
 engine = create_engine(
     get_database_url(),
     connect_args={"check_same_thread": False},  # Required for SQLite with FastAPI
     echo=get_settings().debug,
 )
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", apply_sqlite_pragmas)
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
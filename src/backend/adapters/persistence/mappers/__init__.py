@@ -2,7 +2,10 @@
 
 from backend.adapters.persistence.mappers.booking_mapper import (
     booking_to_model,
+    booking_to_values,
     model_to_booking,
+    row_to_booking,
+    row_to_booking_list_row,
     set_booking_client_from_data,
 )
 from backend.adapters.persistence.mappers.config_mapper import (
@@ -15,13 +18,16 @@ from backend.adapters.persistence.mappers.config_mapper import (
 )
 from backend.adapters.persistence.mappers.document_mapper import (
     document_to_model,
+    document_to_values,
     model_to_document,
+    row_to_document_list_row,
 )
 from backend.adapters.persistence.mappers.invoice_mapper import (
     client_invoice_to_model,
     model_to_client_invoice,
     model_to_provider_invoice,
     provider_invoice_to_model,
+    row_to_invoice_list_row,
 )
 from backend.adapters.persistence.mappers.party_mapper import (
     client_to_model,
@@ -33,7 +39,10 @@ from backend.adapters.persistence.mappers.party_mapper import (
 __all__ = [
     # Booking mappers
     "booking_to_model",
+    "booking_to_values",
     "model_to_booking",
+    "row_to_booking",
+    "row_to_booking_list_row",
     "set_booking_client_from_data",
     # Config mappers
     "agent_to_model",
@@ -44,12 +53,15 @@ __all__ = [
     "settings_to_model",
     # Document mappers
     "document_to_model",
+    "document_to_values",
     "model_to_document",
+    "row_to_document_list_row",
     # Invoice mappers
     "client_invoice_to_model",
     "model_to_client_invoice",
     "model_to_provider_invoice",
     "provider_invoice_to_model",
+    "row_to_invoice_list_row",
     # Party mappers
     "client_to_model",
     "model_to_client",
@@ -1,5 +1,11 @@
 """Mapper for Booking entity."""
 
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import RowMapping
+
 from backend.adapters.persistence.mappers.invoice_mapper import (
     deserialize_booking_charge,
     serialize_booking_charge,
@@ -7,11 +13,17 @@ from backend.adapters.persistence.mappers.invoice_mapper import (
 from backend.adapters.persistence.models.booking import BookingModel
 from backend.domain.entities.booking import Booking
 from backend.domain.enums import BookingStatus
-from backend.domain.value_objects import ClientInfo, Port
+from backend.domain.value_objects import ClientInfo, Money, Port
+from backend.ports.output.repositories import BookingListRow
 
 
 def booking_to_model(booking: Booking) -> BookingModel:
     """Convert Booking entity to BookingModel ORM."""
+    return BookingModel(**booking_to_values(booking))
+
+
+def booking_to_values(booking: Booking) -> dict[str, Any]:
+    """Convert Booking entity to BookingModel column values."""
     # Serialize charges to JSON
     revenue_charges_json = [serialize_booking_charge(charge) for charge in booking.revenue_charges]
     cost_charges_json = [serialize_booking_charge(charge) for charge in booking.cost_charges]
@@ -25,21 +37,22 @@ def booking_to_model(booking: Booking) -> BookingModel:
     pod_code = booking.pod.code if booking.pod else None
     pod_name = booking.pod.name if booking.pod else None
 
-    return BookingModel(
-        id=booking.id,
-        uuid=booking._uuid,
-        created_at=booking.created_at,
-        client_id=client_id,
-        pol_code=pol_code,
-        pol_name=pol_name,
-        pod_code=pod_code,
-        pod_name=pod_name,
-        vessel=booking.vessel,
-        containers=list(booking.containers),
-        status=booking.status.value,
-        revenue_charges=revenue_charges_json,
-        cost_charges=cost_charges_json,
-    )
+    return {
+        "id": booking.id,
+        "uuid": booking._uuid,
+        "created_at": booking.created_at,
+        "client_id": client_id,
+        "pol_code": pol_code,
+        "pol_name": pol_name,
+        "pod_code": pod_code,
+        "pod_name": pod_name,
+        "vessel": booking.vessel,
+        "containers": booking.containers,
+        "status": booking.status.value,
+        "revenue_charges": revenue_charges_json,
+        "cost_charges": cost_charges_json,
+        "margin": booking.margin.amount,
+    }
 
 
 def model_to_booking(model: BookingModel) -> Booking:
@@ -73,11 +86,60 @@ def model_to_booking(model: BookingModel) -> Booking:
     )
 
 
-def set_booking_client_from_data(booking: Booking, client_id: str, name: str, nif: str) -> None:
+def row_to_booking(row: RowMapping) -> Booking:
+    """Convert a Core result row of the bookings table to Booking entity.
+
+    Read-only list paths use this to skip ORM instance construction and
+    identity-map registration when the model would be discarded immediately.
+    """
+    pol_code = row["pol_code"]
+    pod_code = row["pod_code"]
+
+    return Booking(
+        id=row["id"],
+        created_at=row["created_at"],
+        client=None,
+        pol=Port(code=pol_code, name=row["pol_name"] or "") if pol_code else None,
+        pod=Port(code=pod_code, name=row["pod_name"] or "") if pod_code else None,
+        vessel=row["vessel"],
+        containers=row["containers"],
+        status=BookingStatus(row["status"]),
+        revenue_charges=[deserialize_booking_charge(data) for data in row["revenue_charges"]],
+        cost_charges=[deserialize_booking_charge(data) for data in row["cost_charges"]],
+        _uuid=row["uuid"],
+    )
+
+
+def row_to_booking_list_row(row: RowMapping) -> BookingListRow:
+    """Convert a Core list-view row to a flat BookingListRow.
+
+    Charge totals are summed straight from the stored JSON amounts, so no
+    BookingCharge or Booking objects are built for list views.
+    """
+    revenue_charges = row["revenue_charges"]
+    cost_charges = row["cost_charges"]
+
+    return BookingListRow(
+        id=row["id"],
+        created_at=row["created_at"],
+        status=BookingStatus(row["status"]),
+        client_name=row["client_name"],
+        pol_code=row["pol_code"],
+        pod_code=row["pod_code"],
+        total_revenue=_charges_total(revenue_charges),
+        total_costs=_charges_total(cost_charges),
+        charge_count=len(revenue_charges) + len(cost_charges),
+    )
+
+
+def _charges_total(charges: list[dict[str, Any]]) -> Money:
+    """Sum the amounts of serialized charges."""
+    return Money(sum((Decimal(charge["amount"]["amount"]) for charge in charges), Decimal(0)))
+
+
+def set_booking_client_from_data(booking: Booking, client_id: UUID, name: str, nif: str) -> None:
     """Set booking client info from client data.
 
     Helper function used by repository to populate ClientInfo after joining.
     """
-    from uuid import UUID
-
-    booking.client = ClientInfo(client_id=UUID(client_id), name=name, nif=nif)
+    booking.client = ClientInfo(client_id=client_id, name=name, nif=nif)
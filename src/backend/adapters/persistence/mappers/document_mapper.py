@@ -1,13 +1,23 @@
 """Mapper for Document entity."""
 
+from typing import Any
+
+from sqlalchemy import RowMapping
+
 from backend.adapters.persistence.models.document import DocumentModel
 from backend.domain.entities.document import Document
 from backend.domain.enums import DocumentType, ErrorType, ProcessingStatus
 from backend.domain.value_objects import EmailReference, ErrorInfo, FileHash
+from backend.ports.output.repositories import DocumentListRow
 
 
 def document_to_model(document: Document) -> DocumentModel:
     """Convert Document entity to DocumentModel ORM."""
+    return DocumentModel(**document_to_values(document))
+
+
+def document_to_values(document: Document) -> dict[str, Any]:
+    """Convert Document entity to DocumentModel column values."""
     # Extract email reference fields
     email_message_id = document.email_reference.message_id if document.email_reference else None
     email_subject = document.email_reference.subject if document.email_reference else None
@@ -20,26 +30,26 @@ def document_to_model(document: Document) -> DocumentModel:
     error_occurred_at = document.error_info.occurred_at if document.error_info else None
     error_retryable = document.error_info.is_retryable if document.error_info else None
 
-    return DocumentModel(
-        id=document.id,
-        filename=document.filename,
-        file_hash_algorithm=document.file_hash.algorithm,
-        file_hash_value=document.file_hash.value,
-        email_message_id=email_message_id,
-        email_subject=email_subject,
-        email_sender=email_sender,
-        email_received_at=email_received_at,
-        document_type=document.document_type.value if document.document_type else None,
-        status=document.status.value,
-        storage_path=document.storage_path,
-        error_type=error_type,
-        error_message=error_message,
-        error_occurred_at=error_occurred_at,
-        error_retryable=error_retryable,
-        created_at=document.created_at,
-        processed_at=document.processed_at,
-        invoice_id=document.invoice_id,
-    )
+    return {
+        "id": document.id,
+        "filename": document.filename,
+        "file_hash_algorithm": document.file_hash.algorithm,
+        "file_hash_value": document.file_hash.value,
+        "email_message_id": email_message_id,
+        "email_subject": email_subject,
+        "email_sender": email_sender,
+        "email_received_at": email_received_at,
+        "document_type": document.document_type.value if document.document_type else None,
+        "status": document.status.value,
+        "storage_path": document.storage_path,
+        "error_type": error_type,
+        "error_message": error_message,
+        "error_occurred_at": error_occurred_at,
+        "error_retryable": error_retryable,
+        "created_at": document.created_at,
+        "processed_at": document.processed_at,
+        "invoice_id": document.invoice_id,
+    }
 
 
 def model_to_document(model: DocumentModel) -> Document:
@@ -76,3 +86,29 @@ def model_to_document(model: DocumentModel) -> Document:
         processed_at=model.processed_at,
         invoice_id=model.invoice_id,
     )
+
+
+def row_to_document_list_row(row: RowMapping) -> DocumentListRow:
+    """Convert a Core list-view row to a flat DocumentListRow.
+
+    Email and error fields follow the same presence rules as model_to_document.
+    """
+    message_id = row["email_message_id"]
+    error_type = row["error_type"]
+    document_type = row["document_type"]
+
+    return DocumentListRow(
+        id=row["id"],
+        filename=row["filename"],
+        status=ProcessingStatus(row["status"]),
+        document_type=DocumentType(document_type) if document_type else None,
+        created_at=row["created_at"],
+        processed_at=row["processed_at"],
+        email_message_id=message_id or None,
+        email_sender=(row["email_sender"] or "") if message_id else None,
+        email_subject=(row["email_subject"] or "") if message_id else None,
+        error_message=(row["error_message"] or "") if error_type else None,
+        error_retryable=ErrorType(error_type).is_retryable if error_type else None,
+        invoice_id=row["invoice_id"],
+        has_file=bool(row["has_file"]),
+    )
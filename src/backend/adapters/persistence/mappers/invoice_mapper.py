@@ -2,12 +2,19 @@
 
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
-from backend.adapters.persistence.models.invoice import ClientInvoiceModel, ProviderInvoiceModel
+from sqlalchemy import RowMapping
+
+from backend.adapters.persistence.models.invoice import (
+    ClientInvoiceModel,
+    ProviderInvoiceBLReferenceModel,
+    ProviderInvoiceModel,
+)
 from backend.domain.entities.invoice import ClientInvoice, ProviderInvoice
-from backend.domain.enums import ChargeCategory, ConfidenceLevel, ProviderType
+from backend.domain.enums import ChargeCategory, ConfidenceLevel, DocumentType, ProviderType
 from backend.domain.value_objects import (
     BookingCharge,
     DocumentReference,
@@ -16,6 +23,24 @@ from backend.domain.value_objects import (
     FileHash,
     Money,
 )
+from backend.ports.output.repositories import InvoiceListRow
+
+# Value -> member table so per-field confidence decoding is a dict lookup
+# instead of a full Enum constructor call.
+_CONFIDENCE_LEVELS: dict[str, ConfidenceLevel] = {level.value: level for level in ConfidenceLevel}
+
+
+def _decode_confidence(value: str) -> ConfidenceLevel:
+    """Decode a stored confidence, raising the Enum's ValueError for unknown values."""
+    level = _CONFIDENCE_LEVELS.get(value)
+    return level if level is not None else ConfidenceLevel(value)
+
+
+@lru_cache(maxsize=16384)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, reusing results for IDs repeated across charges."""
+    return UUID(value)
+
 
 # --- JSON Serialization Helpers ---
 
@@ -47,7 +72,7 @@ def deserialize_booking_charge(data: dict[str, Any]) -> BookingCharge:
     """Deserialize BookingCharge from JSON dict."""
     return BookingCharge(
         booking_id=data["booking_id"],
-        invoice_id=UUID(data["invoice_id"]),
+        invoice_id=_parse_uuid(data["invoice_id"]),
         charge_category=ChargeCategory(data["charge_category"]),
         provider_type=ProviderType(data["provider_type"]) if data.get("provider_type") else None,
         container=data.get("container"),
@@ -72,7 +97,7 @@ def deserialize_document_reference(data: dict[str, Any] | None) -> DocumentRefer
     if not data:
         return None
     return DocumentReference(
-        document_id=UUID(data["document_id"]),
+        document_id=_parse_uuid(data["document_id"]),
         filename=data["filename"],
         file_hash=FileHash(
             algorithm=data["file_hash"]["algorithm"], value=data["file_hash"]["value"]
@@ -92,7 +117,7 @@ def serialize_extraction_metadata(metadata: ExtractionMetadata | None) -> dict[s
             for fc in metadata.field_confidences
         ],
         "raw_json": metadata.raw_json,
-        "manually_edited_fields": list(metadata.manually_edited_fields),
+        "manually_edited_fields": metadata.manually_edited_fields,
         "processed_at": metadata.processed_at.isoformat(),
     }
 
@@ -103,12 +128,14 @@ def deserialize_extraction_metadata(data: dict[str, Any] | None) -> ExtractionMe
         return None
     return ExtractionMetadata(
         ai_model=data["ai_model"],
-        overall_confidence=ConfidenceLevel(data["overall_confidence"]),
+        overall_confidence=_decode_confidence(data["overall_confidence"]),
         field_confidences=tuple(
-            FieldConfidence(
-                field_name=fc["field_name"], confidence=ConfidenceLevel(fc["confidence"])
-            )
-            for fc in data.get("field_confidences", [])
+            [
+                FieldConfidence(
+                    field_name=fc["field_name"], confidence=_decode_confidence(fc["confidence"])
+                )
+                for fc in data.get("field_confidences", ())
+            ]
         ),
         raw_json=data.get("raw_json", ""),
         manually_edited_fields=tuple(data.get("manually_edited_fields", [])),
@@ -142,6 +169,8 @@ def client_invoice_to_model(invoice: ClientInvoice) -> ClientInvoiceModel:
         tax_amount=invoice.tax_amount.amount,
         tax_currency="EUR",
         charges=charges_json,
+        charge_count=len(invoice.charges),
+        charges_total=sum((charge.amount for charge in invoice.charges), Money.zero()).amount,
         source_document_id=source_document_id,
         source_document_filename=source_document_filename,
         source_document_hash_algo=source_document_hash_algo,
@@ -202,12 +231,17 @@ def provider_invoice_to_model(invoice: ProviderInvoice) -> ProviderInvoiceModel:
         provider_id=invoice.provider_id,
         provider_type=invoice.provider_type.value,
         invoice_date=invoice.invoice_date,
-        bl_references=invoice.bl_references,
+        bl_reference_links=[
+            ProviderInvoiceBLReferenceModel(bl_reference=bl_reference, position=position)
+            for position, bl_reference in enumerate(dict.fromkeys(invoice.bl_references))
+        ],
         total_amount=invoice.total_amount.amount,
         total_currency="EUR",
         tax_amount=invoice.tax_amount.amount,
         tax_currency="EUR",
         charges=charges_json,
+        charge_count=len(invoice.charges),
+        charges_total=sum((charge.amount for charge in invoice.charges), Money.zero()).amount,
         source_document_id=source_document_id,
         source_document_filename=source_document_filename,
         source_document_hash_algo=source_document_hash_algo,
@@ -246,3 +280,20 @@ def model_to_provider_invoice(model: ProviderInvoiceModel) -> ProviderInvoice:
         source_document=source_document,
         extraction_metadata=deserialize_extraction_metadata(model.extraction_metadata),
     )
+
+
+def row_to_invoice_list_row(
+    row: RowMapping, invoice_type: DocumentType, bl_references: tuple[str, ...]
+) -> InvoiceListRow:
+    """Convert a Core list-view row of either invoice table to a flat InvoiceListRow."""
+    return InvoiceListRow(
+        id=row["id"],
+        invoice_type=invoice_type,
+        invoice_number=row["invoice_number"],
+        invoice_date=row["invoice_date"],
+        party_name=row["party_name"],
+        bl_references=bl_references,
+        total_amount=Money(amount=row["total_amount"]),
+        charge_count=row["charge_count"],
+        charges_total=Money(amount=row["charges_total"]),
+    )
@@ -0,0 +1,69 @@
+"""Store UUID columns as 16-byte binary
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from collections.abc import Callable, Sequence
+from uuid import UUID
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b4c5d6e7f8"
+down_revision: str | Sequence[str] | None = "f2a3b4c5d6e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+UUID_COLUMNS: dict[str, tuple[str, ...]] = {
+    "company": ("id",),
+    "agent": ("id",),
+    "settings": ("id",),
+    "clients": ("id",),
+    "providers": ("id",),
+    "documents": ("id", "invoice_id"),
+    "bookings": ("uuid", "client_id"),
+    "client_invoices": ("id", "client_id", "source_document_id"),
+    "provider_invoices": ("id", "provider_id", "source_document_id"),
+}
+
+
+def _convert_values(table: str, columns: tuple[str, ...], convert: Callable[..., object]) -> None:
+    """Rewrite every non-null value of the given columns in place."""
+    bind = op.get_bind()
+    for column in columns:
+        rows = bind.execute(
+            sa.text(f"SELECT rowid, {column} FROM {table} WHERE {column} IS NOT NULL")
+        ).all()
+        if not rows:
+            continue
+        bind.execute(
+            sa.text(f"UPDATE {table} SET {column} = :value WHERE rowid = :rowid"),
+            [{"rowid": rowid, "value": convert(value)} for rowid, value in rows],
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in UUID_COLUMNS.items():
+        # Values are hex strings until rewritten, so convert before the type change
+        _convert_values(table, columns, lambda value: UUID(hex=value).bytes)
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column, existing_type=sa.Uuid(), type_=sa.LargeBinary(length=16)
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in UUID_COLUMNS.items():
+        _convert_values(table, columns, lambda value: UUID(bytes=value).hex)
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column, existing_type=sa.LargeBinary(length=16), type_=sa.Uuid()
+                )
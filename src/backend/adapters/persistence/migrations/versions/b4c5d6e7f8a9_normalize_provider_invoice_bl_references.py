@@ -0,0 +1,76 @@
+"""Move provider invoice BL references into a link table
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4c5d6e7f8a9"
+down_revision: str | Sequence[str] | None = "a3b4c5d6e7f8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "provider_invoice_bl_refs",
+        sa.Column("invoice_id", sa.LargeBinary(length=16), nullable=False),
+        sa.Column("bl_reference", sa.String(length=100), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["bl_reference"], ["bookings.id"], ondelete="RESTRICT"),
+        sa.ForeignKeyConstraint(["invoice_id"], ["provider_invoices.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("invoice_id", "bl_reference"),
+    )
+    op.create_index(
+        "ix_provider_invoice_bl_refs_bl_reference",
+        "provider_invoice_bl_refs",
+        ["bl_reference"],
+        unique=False,
+    )
+
+    # Unpack each JSON array into one row per BL, keeping the array order
+    op.execute(
+        """
+        INSERT OR IGNORE INTO provider_invoice_bl_refs (invoice_id, bl_reference, position)
+        SELECT provider_invoices.id, refs.value, refs.key
+        FROM provider_invoices, json_each(provider_invoices.bl_references) AS refs
+        """
+    )
+
+    with op.batch_alter_table("provider_invoices") as batch_op:
+        batch_op.drop_column("bl_references")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("provider_invoices") as batch_op:
+        batch_op.add_column(sa.Column("bl_references", sa.JSON(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE provider_invoices
+        SET bl_references = (
+            SELECT json_group_array(bl_reference)
+            FROM (
+                SELECT bl_reference
+                FROM provider_invoice_bl_refs
+                WHERE provider_invoice_bl_refs.invoice_id = provider_invoices.id
+                ORDER BY position
+            )
+        )
+        """
+    )
+
+    with op.batch_alter_table("provider_invoices") as batch_op:
+        batch_op.alter_column("bl_references", existing_type=sa.JSON(), nullable=False)
+
+    op.drop_index("ix_provider_invoice_bl_refs_bl_reference", table_name="provider_invoice_bl_refs")
+    op.drop_table("provider_invoice_bl_refs")
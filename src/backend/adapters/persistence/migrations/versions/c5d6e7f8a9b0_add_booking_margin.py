@@ -0,0 +1,63 @@
+"""Add persisted margin column to bookings
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d6e7f8a9b0"
+down_revision: str | Sequence[str] | None = "b4c5d6e7f8a9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("bookings") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "margin",
+                sa.Numeric(precision=12, scale=2),
+                nullable=False,
+                server_default="0",
+            )
+        )
+        batch_op.create_index("ix_bookings_margin", ["margin"], unique=False)
+
+    # Backfill from the existing revenue and cost charge JSON arrays
+    op.execute(
+        """
+        UPDATE bookings
+        SET margin = ROUND(
+            COALESCE(
+                (
+                    SELECT SUM(CAST(json_extract(value, '$.amount.amount') AS REAL))
+                    FROM json_each(bookings.revenue_charges)
+                ),
+                0
+            )
+            - COALESCE(
+                (
+                    SELECT SUM(CAST(json_extract(value, '$.amount.amount') AS REAL))
+                    FROM json_each(bookings.cost_charges)
+                ),
+                0
+            ),
+            2
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("bookings") as batch_op:
+        batch_op.drop_index("ix_bookings_margin")
+        batch_op.drop_column("margin")
@@ -0,0 +1,28 @@
+"""Drop redundant bookings uuid index
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6e7f8a9b0c1"
+down_revision: str | Sequence[str] | None = "c5d6e7f8a9b0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The unique constraint on uuid already carries its own index
+    op.drop_index("ix_bookings_uuid", table_name="bookings")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_bookings_uuid", "bookings", ["uuid"], unique=False)
@@ -0,0 +1,45 @@
+"""Add composite indexes for booking and document list queries
+
+Revision ID: e1f2a3b4c5d6
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: str | Sequence[str] | None = "d4e5f6a7b8c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_bookings_client_id", table_name="bookings")
+    op.drop_index("ix_bookings_status", table_name="bookings")
+    op.create_index(
+        "ix_bookings_client_created", "bookings", ["client_id", "created_at"], unique=False
+    )
+    op.create_index(
+        "ix_bookings_status_created", "bookings", ["status", "created_at"], unique=False
+    )
+
+    op.drop_index("ix_documents_status", table_name="documents")
+    op.create_index(
+        "ix_documents_status_created", "documents", ["status", "created_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_documents_status_created", table_name="documents")
+    op.create_index("ix_documents_status", "documents", ["status"], unique=False)
+
+    op.drop_index("ix_bookings_status_created", table_name="bookings")
+    op.drop_index("ix_bookings_client_created", table_name="bookings")
+    op.create_index("ix_bookings_status", "bookings", ["status"], unique=False)
+    op.create_index("ix_bookings_client_id", "bookings", ["client_id"], unique=False)
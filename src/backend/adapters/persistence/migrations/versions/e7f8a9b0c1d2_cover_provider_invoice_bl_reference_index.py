@@ -0,0 +1,40 @@
+"""Cover provider invoice BL reference index
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f8a9b0c1d2"
+down_revision: str | Sequence[str] | None = "d6e7f8a9b0c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Carry the invoice id so BL lookups never read the link table itself
+    op.drop_index("ix_provider_invoice_bl_refs_bl_reference", table_name="provider_invoice_bl_refs")
+    op.create_index(
+        "ix_provider_invoice_bl_refs_bl_reference",
+        "provider_invoice_bl_refs",
+        ["bl_reference", "invoice_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_provider_invoice_bl_refs_bl_reference", table_name="provider_invoice_bl_refs")
+    op.create_index(
+        "ix_provider_invoice_bl_refs_bl_reference",
+        "provider_invoice_bl_refs",
+        ["bl_reference"],
+        unique=False,
+    )
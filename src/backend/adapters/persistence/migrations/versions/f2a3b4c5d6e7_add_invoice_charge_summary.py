@@ -0,0 +1,60 @@
+"""Add charge summary columns to invoices
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: str | Sequence[str] | None = "e1f2a3b4c5d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INVOICE_TABLES = ("client_invoices", "provider_invoices")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in INVOICE_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(
+                sa.Column("charge_count", sa.Integer(), nullable=False, server_default="0")
+            )
+            batch_op.add_column(
+                sa.Column(
+                    "charges_total",
+                    sa.Numeric(precision=12, scale=2),
+                    nullable=False,
+                    server_default="0",
+                )
+            )
+
+        # Backfill from the existing charges JSON array
+        op.execute(
+            f"""
+            UPDATE {table}
+            SET charge_count = json_array_length(charges),
+                charges_total = COALESCE(
+                    (
+                        SELECT ROUND(SUM(CAST(json_extract(value, '$.amount.amount') AS REAL)), 2)
+                        FROM json_each({table}.charges)
+                    ),
+                    0
+                )
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(INVOICE_TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column("charges_total")
+            batch_op.drop_column("charge_count")
@@ -11,7 +11,11 @@ from backend.adapters.persistence.models.configuration import (
     SettingsModel,
 )
 from backend.adapters.persistence.models.document import DocumentModel
-from backend.adapters.persistence.models.invoice import ClientInvoiceModel, ProviderInvoiceModel
+from backend.adapters.persistence.models.invoice import (
+    ClientInvoiceModel,
+    ProviderInvoiceBLReferenceModel,
+    ProviderInvoiceModel,
+)
 from backend.adapters.persistence.models.party import ClientModel, ProviderModel
 
 __all__ = [
@@ -22,6 +26,7 @@ __all__ = [
     "CompanyModel",
     "DocumentModel",
     "OutlookOAuthStateModel",
+    "ProviderInvoiceBLReferenceModel",
     "ProviderInvoiceModel",
     "ProviderModel",
     "SettingsModel",
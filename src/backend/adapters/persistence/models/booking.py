@@ -1,21 +1,30 @@
 """SQLAlchemy model for Booking entity."""
 
 from datetime import datetime
-from typing import Any
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, ForeignKey, Index, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
 
 from backend.adapters.persistence.database import Base
 
+if TYPE_CHECKING:
+    from backend.adapters.persistence.models.party import ClientModel
+
 
 class BookingModel(Base):
     """ORM model for Booking entity (primary aggregate)."""
 
     __tablename__ = "bookings"
-    __table_args__ = (Index("ix_bookings_status", "status"), Index("ix_bookings_uuid", "uuid"))
+    __table_args__ = (
+        # Composite indexes serve the list filters and the created_at sort together
+        Index("ix_bookings_client_created", "client_id", "created_at"),
+        Index("ix_bookings_status_created", "status", "created_at"),
+        Index("ix_bookings_margin", "margin"),
+    )
 
     # BL reference is the primary business identifier
     id: Mapped[str] = mapped_column(String(100), primary_key=True)
@@ -26,9 +35,8 @@ class BookingModel(Base):
     created_at: Mapped[datetime] = mapped_column(nullable=False)
 
     # Client reference (nullable until first invoice)
-    client_id: Mapped[UUID | None] = mapped_column(
-        ForeignKey("clients.id", ondelete="RESTRICT"), index=True
-    )
+    client_id: Mapped[UUID | None] = mapped_column(ForeignKey("clients.id", ondelete="RESTRICT"))
+    client: Mapped["ClientModel | None"] = relationship(lazy="selectin", viewonly=True)
 
     # Port of Loading (nullable)
     pol_code: Mapped[str | None] = mapped_column(String(10))
@@ -57,3 +65,6 @@ class BookingModel(Base):
         JSON, nullable=False, default=list
     )
     cost_charges: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
+
+    # Revenue minus costs, persisted so the list can sort by it in SQL
+    margin: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
@@ -15,7 +15,7 @@ class DocumentModel(Base):
     __tablename__ = "documents"
     __table_args__ = (
         UniqueConstraint("file_hash_algorithm", "file_hash_value", name="uq_document_hash"),
-        Index("ix_documents_status", "status"),
+        Index("ix_documents_status_created", "status", "created_at"),
     )
 
     id: Mapped[UUID] = mapped_column(primary_key=True)
@@ -6,11 +6,15 @@ from typing import Any
 from uuid import UUID
 
 from sqlalchemy import CheckConstraint, ForeignKey, Index, Numeric, String, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
 
 from backend.adapters.persistence.database import Base
 
+# Serialized text on SQLite; binary, indexable JSONB if the schema is ever hosted on Postgres
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 
 class ClientInvoiceModel(Base):
     """ORM model for ClientInvoice entity (revenue)."""
@@ -49,7 +53,13 @@ class ClientInvoiceModel(Base):
     )
 
     # Charges stored as JSON array
-    charges: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
+    charges: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONDocument, nullable=False, default=list
+    )
+
+    # Charge summary computed at write time so listings need not parse the array
+    charge_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    charges_total: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
 
     # Source document reference
     source_document_id: Mapped[UUID | None]
@@ -58,7 +68,7 @@ class ClientInvoiceModel(Base):
     source_document_hash_value: Mapped[str | None] = mapped_column(String(128))
 
     # Extraction metadata stored as JSON
-    extraction_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    extraction_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument)
 
 
 class ProviderInvoiceModel(Base):
@@ -85,8 +95,12 @@ class ProviderInvoiceModel(Base):
     )
     invoice_date: Mapped[date] = mapped_column(nullable=False)
 
-    # BL references (can be multiple for multi-booking invoices)
-    bl_references: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    # BL references (can be multiple for multi-booking invoices), one link row per BL
+    bl_reference_links: Mapped[list["ProviderInvoiceBLReferenceModel"]] = relationship(
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="ProviderInvoiceBLReferenceModel.position",
+    )
 
     # Money amounts
     total_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
@@ -105,7 +119,13 @@ class ProviderInvoiceModel(Base):
     )
 
     # Charges stored as JSON array
-    charges: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
+    charges: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONDocument, nullable=False, default=list
+    )
+
+    # Charge summary computed at write time so listings need not parse the array
+    charge_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    charges_total: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
 
     # Source document reference
     source_document_id: Mapped[UUID | None]
@@ -114,4 +134,26 @@ class ProviderInvoiceModel(Base):
     source_document_hash_value: Mapped[str | None] = mapped_column(String(128))
 
     # Extraction metadata stored as JSON
-    extraction_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    extraction_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument)
+
+    @property
+    def bl_references(self) -> list[str]:
+        """BL references in their original order."""
+        return [link.bl_reference for link in self.bl_reference_links]
+
+
+class ProviderInvoiceBLReferenceModel(Base):
+    """ORM model linking a provider invoice to each booking it references."""
+
+    __tablename__ = "provider_invoice_bl_refs"
+    __table_args__ = (
+        Index("ix_provider_invoice_bl_refs_bl_reference", "bl_reference", "invoice_id"),
+    )
+
+    invoice_id: Mapped[UUID] = mapped_column(
+        ForeignKey("provider_invoices.id", ondelete="CASCADE"), primary_key=True
+    )
+    bl_reference: Mapped[str] = mapped_column(
+        ForeignKey("bookings.id", ondelete="RESTRICT"), primary_key=True
+    )
+    position: Mapped[int] = mapped_column(nullable=False)
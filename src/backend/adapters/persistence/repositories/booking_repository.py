@@ -1,18 +1,53 @@
 """SQLite repository for Booking aggregate."""
 
-from datetime import date
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    RowMapping,
+    Select,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 
 from backend.adapters.persistence.mappers import (
     booking_to_model,
+    booking_to_values,
     model_to_booking,
+    row_to_booking,
+    row_to_booking_list_row,
     set_booking_client_from_data,
 )
 from backend.adapters.persistence.models.booking import BookingModel
 from backend.adapters.persistence.models.party import ClientModel
 from backend.domain.entities.booking import Booking
-from backend.ports.output.repositories import BookingFilters, BookingRepository, BookingSort
+from backend.ports.output.repositories import (
+    BookingFilters,
+    BookingListRow,
+    BookingRepository,
+    BookingSort,
+)
+
+# Rows fetched per round trip when streaming list results
+_LIST_BATCH_SIZE = 500
+
+
+def _charges_reference_invoices(charges_column: Any, invoice_ids: list[str]) -> ColumnElement[bool]:
+    """Match bookings whose JSON charge list holds a charge from any given invoice."""
+    charges = func.json_each(charges_column).table_valued("value")
+    return (
+        select(charges.c.value)
+        .where(func.json_extract(charges.c.value, "$.invoice_id").in_(invoice_ids))
+        .exists()
+    )
 
 
 class SqlAlchemyBookingRepository(BookingRepository):
@@ -23,34 +58,28 @@ class SqlAlchemyBookingRepository(BookingRepository):
 
     def save(self, booking: Booking) -> None:
         """Save a new booking or update existing one."""
-        # Check if booking already exists
-        existing = self.session.query(BookingModel).filter(BookingModel.id == booking.id).first()
+        if not self._update_row(booking):
+            self.session.add(booking_to_model(booking))
 
-        if existing:
-            # Update existing
-            self.update(booking)
-        else:
-            # Create new
-            model = booking_to_model(booking)
-            self.session.add(model)
-            self.session.commit()
+        self.session.flush()
 
     def find_by_id(self, bl_reference: str) -> Booking | None:
         """Find booking by BL reference."""
-        model = self.session.query(BookingModel).filter(BookingModel.id == bl_reference).first()
+        model = self.session.get(
+            BookingModel,
+            bl_reference,
+            options=[selectinload(BookingModel.client), raiseload("*")],
+        )
 
         if model is None:
             return None
 
         booking = model_to_booking(model)
 
-        # Populate ClientInfo if client_id exists
-        if model.client_id:
-            client = (
-                self.session.query(ClientModel).filter(ClientModel.id == model.client_id).first()
-            )
-            if client:
-                set_booking_client_from_data(booking, str(client.id), client.name, client.nif)
+        # Populate ClientInfo from the eagerly loaded client
+        client = model.client
+        if client:
+            set_booking_client_from_data(booking, client.id, client.name, client.nif)
 
         return booking
 
@@ -65,26 +94,147 @@ class SqlAlchemyBookingRepository(BookingRepository):
 
         return booking
 
+    def find_or_create_many(self, bl_references: list[str]) -> dict[str, Booking]:
+        """Find bookings by ID, creating the missing ones, keyed by BL reference."""
+        if not bl_references:
+            return {}
+        # One IN query for the existing bookings and one INSERT for the rest
+        query = self._with_client().where(BookingModel.id.in_(bl_references))
+        bookings = {
+            booking.id: booking
+            for booking in self._to_bookings(self.session.execute(query).mappings())
+        }
+        missing = [
+            Booking.create(bl_reference)
+            for bl_reference in dict.fromkeys(bl_references)
+            if bl_reference not in bookings
+        ]
+        if missing:
+            self.session.execute(
+                insert(BookingModel), [booking_to_values(booking) for booking in missing]
+            )
+            bookings.update((booking.id, booking) for booking in missing)
+
+        return bookings
+
+    def find_by_invoice_ids(self, invoice_ids: list[UUID]) -> list[Booking]:
+        """Find bookings holding charges from any of the given invoices."""
+        if not invoice_ids:
+            return []
+        # Charges live as JSON on the booking row; SQLite matches them in place so
+        # only affected bookings are read and hydrated
+        ids = [str(invoice_id) for invoice_id in invoice_ids]
+        query = self._with_client().where(
+            or_(
+                _charges_reference_invoices(BookingModel.revenue_charges, ids),
+                _charges_reference_invoices(BookingModel.cost_charges, ids),
+            )
+        )
+        return self._to_bookings(self.session.execute(query).mappings())
+
     def list_all(
         self, filters: BookingFilters | None = None, sort: BookingSort | None = None
     ) -> list[Booking]:
         """List all bookings with optional filtering and sorting."""
-        query = self.session.query(BookingModel)
+        query = self._filter_and_sort(self._with_client(), filters, sort)
+
+        # Stream rows in batches so only one window of raw rows is alive at a time
+        rows = self.session.execute(query.execution_options(yield_per=_LIST_BATCH_SIZE)).mappings()
+        return self._to_bookings(rows)
+
+    def list_rows(
+        self, filters: BookingFilters | None = None, sort: BookingSort | None = None
+    ) -> list[BookingListRow]:
+        """List flat booking summaries with optional filtering and sorting."""
+        # Only the columns the list view renders; charges are summed from JSON
+        query = select(
+            BookingModel.id,
+            BookingModel.created_at,
+            BookingModel.status,
+            BookingModel.pol_code,
+            BookingModel.pod_code,
+            BookingModel.revenue_charges,
+            BookingModel.cost_charges,
+            ClientModel.name.label("client_name"),
+        ).outerjoin(ClientModel, BookingModel.client_id == ClientModel.id)
+        query = self._filter_and_sort(query, filters, sort)
+
+        rows = self.session.execute(query.execution_options(yield_per=_LIST_BATCH_SIZE)).mappings()
+        return [row_to_booking_list_row(row) for row in rows]
+
+    def update(self, booking: Booking) -> None:
+        """Update an existing booking."""
+        if not self._update_row(booking):
+            raise ValueError(f"Booking {booking.id} not found")
+
+    def update_many(self, bookings: list[Booking]) -> None:
+        """Update a batch of existing bookings in one statement."""
+        if not bookings:
+            return
+        # ORM bulk UPDATE by primary key runs as one executemany and keeps
+        # already loaded models in sync; a missing row fails the whole batch
+        try:
+            self.session.execute(
+                update(BookingModel), [booking_to_values(booking) for booking in bookings]
+            )
+        except StaleDataError as exc:
+            raise ValueError("Bookings not found for batch update") from exc
+
+    def _update_row(self, booking: Booking) -> bool:
+        """Write entity state with a single UPDATE by primary key."""
+        result = self.session.execute(
+            update(BookingModel)
+            .where(BookingModel.id == booking.id)
+            .values(**booking_to_values(booking))
+        )
+        assert isinstance(result, CursorResult)
+        return result.rowcount > 0
+
+    @staticmethod
+    def _with_client() -> Select[Any]:
+        """Select plain booking rows with the client columns ClientInfo needs."""
+        # Read-only path: plain table rows instead of ORM instances, joining client
+        # columns so ClientInfo needs no per-row lookup
+        return select(
+            BookingModel.__table__,
+            ClientModel.name.label("client_name"),
+            ClientModel.nif.label("client_nif"),
+        ).outerjoin(ClientModel, BookingModel.client_id == ClientModel.id)
 
+    @staticmethod
+    def _to_bookings(rows: Iterable[RowMapping]) -> list[Booking]:
+        """Convert booking rows to domain entities and populate client info."""
+        bookings = []
+        for row in rows:
+            booking = row_to_booking(row)
+
+            # Populate ClientInfo if the joined client exists
+            if row["client_name"] is not None:
+                set_booking_client_from_data(
+                    booking, row["client_id"], row["client_name"], row["client_nif"]
+                )
+
+            bookings.append(booking)
+
+        return bookings
+
+    @staticmethod
+    def _filter_and_sort(
+        query: Select[Any], filters: BookingFilters | None, sort: BookingSort | None
+    ) -> Select[Any]:
+        """Apply list filters and ordering to a bookings select."""
         # Apply filters
         if filters:
             if filters.client_id:
-                query = query.filter(BookingModel.client_id == filters.client_id)
+                query = query.where(BookingModel.client_id == filters.client_id)
             if filters.booking:
-                query = query.filter(BookingModel.id.ilike(f"%{filters.booking}%"))
+                query = query.where(BookingModel.id.ilike(f"%{filters.booking}%"))
             if filters.status:
-                query = query.filter(BookingModel.status == filters.status.value)
+                query = query.where(BookingModel.status == filters.status.value)
             if filters.date_from:
-                query = query.filter(
-                    BookingModel.created_at >= date.fromisoformat(filters.date_from)
-                )
+                query = query.where(BookingModel.created_at >= filters.date_from)
             if filters.date_to:
-                query = query.filter(BookingModel.created_at <= date.fromisoformat(filters.date_to))
+                query = query.where(BookingModel.created_at <= filters.date_to)
 
         # Apply sorting
         if sort:
@@ -92,63 +242,15 @@ class SqlAlchemyBookingRepository(BookingRepository):
                 order_col = (
                     BookingModel.created_at.desc() if sort.descending else BookingModel.created_at
                 )
-            elif sort.field == "margin":
-                # Sorting by calculated field (margin) requires computing it
-                # For now, we'll order by created_at as fallback
-                # TODO: Add computed columns or use raw SQL for complex sorts
-                order_col = BookingModel.created_at.desc()
-            elif sort.field == "commission":
-                # Similar to margin
-                order_col = BookingModel.created_at.desc()
+                query = query.order_by(order_col)
+            elif sort.field in ("margin", "commission"):
+                # Commission is margin times a positive rate, so both share the margin order
+                query = query.order_by(
+                    BookingModel.margin.desc() if sort.descending else BookingModel.margin
+                )
             else:
-                order_col = BookingModel.created_at.desc()
-
-            query = query.order_by(order_col)
+                query = query.order_by(BookingModel.created_at.desc())
         else:
             query = query.order_by(BookingModel.created_at.desc())
 
-        models = query.all()
-
-        # Convert to domain entities and populate client info
-        bookings = []
-        for model in models:
-            booking = model_to_booking(model)
-
-            # Populate ClientInfo if client_id exists
-            if model.client_id:
-                client = (
-                    self.session.query(ClientModel)
-                    .filter(ClientModel.id == model.client_id)
-                    .first()
-                )
-                if client:
-                    set_booking_client_from_data(booking, str(client.id), client.name, client.nif)
-
-            bookings.append(booking)
-
-        return bookings
-
-    def update(self, booking: Booking) -> None:
-        """Update an existing booking."""
-        model = self.session.query(BookingModel).filter(BookingModel.id == booking.id).first()
-
-        if model is None:
-            raise ValueError(f"Booking {booking.id} not found")
-
-        # Update model fields from entity
-        updated_model = booking_to_model(booking)
-
-        model.uuid = updated_model.uuid
-        model.created_at = updated_model.created_at
-        model.client_id = updated_model.client_id
-        model.pol_code = updated_model.pol_code
-        model.pol_name = updated_model.pol_name
-        model.pod_code = updated_model.pod_code
-        model.pod_name = updated_model.pod_name
-        model.vessel = updated_model.vessel
-        model.containers = updated_model.containers
-        model.status = updated_model.status
-        model.revenue_charges = updated_model.revenue_charges
-        model.cost_charges = updated_model.cost_charges
-
-        self.session.commit()
+        return query
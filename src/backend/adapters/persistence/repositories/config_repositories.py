@@ -1,7 +1,10 @@
 """SQLite repositories for configuration entities (singletons)."""
 
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
+from backend.adapters.persistence.database import Base
 from backend.adapters.persistence.mappers import (
     agent_to_model,
     company_to_model,
@@ -19,6 +22,23 @@ from backend.adapters.security import OutlookRefreshTokenVault
 from backend.domain.entities.configuration import Agent, Company, Settings
 from backend.ports.output.repositories import AgentRepository, CompanyRepository, SettingsRepository
 
+# Singleton rows have no known primary key up front; build their lookups once.
+_COMPANY_STMT = select(CompanyModel).limit(1)
+_AGENT_STMT = select(AgentModel).limit(1)
+_SETTINGS_STMT = select(SettingsModel).limit(1)
+
+
+def _upsert_singleton(session: Session, model: Base) -> None:
+    """Insert the singleton row or update it in place with one statement."""
+    columns = model.__table__.columns
+    values = {column.key: getattr(model, column.key) for column in columns}
+    stmt = sqlite_insert(type(model)).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[columns.id],
+        set_={key: stmt.excluded[key] for key in values if key != "id"},
+    )
+    session.execute(stmt)
+
 
 class SqlAlchemyCompanyRepository(CompanyRepository):
     """SQLite implementation of CompanyRepository (singleton)."""
@@ -28,23 +48,11 @@ class SqlAlchemyCompanyRepository(CompanyRepository):
 
     def save(self, company: Company) -> None:
         """Save or update company configuration."""
-        existing = self.session.query(CompanyModel).first()
-
-        if existing:
-            existing.name = company.name
-            existing.nif = company.nif
-            existing.address = company.address
-            existing.contact_info = company.contact_info
-            existing.agent_commission_rate = company.agent_commission_rate
-        else:
-            model = company_to_model(company)
-            self.session.add(model)
-
-        self.session.commit()
+        _upsert_singleton(self.session, company_to_model(company))
 
     def get(self) -> Company | None:
         """Get company configuration (singleton)."""
-        model = self.session.query(CompanyModel).first()
+        model = self.session.execute(_COMPANY_STMT).scalar_one_or_none()
         if model is None:
             return None
         return model_to_company(model)
@@ -58,21 +66,11 @@ class SqlAlchemyAgentRepository(AgentRepository):
 
     def save(self, agent: Agent) -> None:
         """Save or update agent profile."""
-        existing = self.session.query(AgentModel).first()
-
-        if existing:
-            existing.name = agent.name
-            existing.email = agent.email
-            existing.phone = agent.phone
-        else:
-            model = agent_to_model(agent)
-            self.session.add(model)
-
-        self.session.commit()
+        _upsert_singleton(self.session, agent_to_model(agent))
 
     def get(self) -> Agent | None:
         """Get agent profile (singleton)."""
-        model = self.session.query(AgentModel).first()
+        model = self.session.execute(_AGENT_STMT).scalar_one_or_none()
         if model is None:
             return None
         return model_to_agent(model)
@@ -87,66 +85,60 @@ class SqlAlchemySettingsRepository(SettingsRepository):
 
     def save(self, settings: Settings) -> None:
         """Save or update application settings."""
-        existing = self.session.query(SettingsModel).first()
-        previous_stored_token = existing.outlook_refresh_token if existing else ""
-        stored_token_value = self._prepare_stored_refresh_token(
-            settings=settings,
-            previous_stored_token=previous_stored_token,
-        )
-
-        if existing:
-            existing.gemini_api_key = settings.gemini_api_key
-            existing.outlook_configured = settings.outlook_configured
-            existing.outlook_refresh_token = stored_token_value
-            existing.default_export_path = settings.default_export_path
-            existing.extraction_prompt = settings.extraction_prompt
-            existing.onboarding_dismissed = settings.onboarding_dismissed
-        else:
-            model = settings_to_model(settings)
-            model.outlook_refresh_token = stored_token_value
-            self.session.add(model)
-
-        self.session.commit()
+        model = settings_to_model(settings)
+        model.outlook_refresh_token = self._prepare_stored_refresh_token(settings)
+        _upsert_singleton(self.session, model)
 
     def get(self) -> Settings | None:
         """Get application settings (singleton)."""
-        model = self.session.query(SettingsModel).first()
+        model = self.session.execute(_SETTINGS_STMT).scalar_one_or_none()
         if model is None:
             return None
         settings = model_to_settings(model)
-        stored_token = model.outlook_refresh_token
-        resolved_token = self._token_vault.load_token(
-            settings.id,
-            stored_token,
-        )
         if not settings.outlook_configured:
             settings.outlook_refresh_token = ""
             return settings
 
-        settings.outlook_refresh_token = resolved_token
-        if not resolved_token or self._token_vault.is_keychain_reference(stored_token):
-            return settings
+        settings.outlook_refresh_token = self._token_vault.load_token(
+            settings.id,
+            model.outlook_refresh_token,
+        )
+        return settings
+
+    def migrate_refresh_token(self) -> bool:
+        """Move a legacy plaintext Outlook refresh token into the keychain.
+
+        Run once at startup so that ``get`` stays read-only. Returns True when
+        the stored value was replaced by a keychain reference.
+        """
+        model = self.session.execute(_SETTINGS_STMT).scalar_one_or_none()
+        if model is None or not model.outlook_configured:
+            return False
+
+        stored_token = model.outlook_refresh_token
+        if not stored_token or self._token_vault.is_keychain_reference(stored_token):
+            return False
 
         try:
-            migrated_token_reference = self._token_vault.save_token(settings.id, resolved_token)
+            token_reference = self._token_vault.save_token(model.id, stored_token)
         except RuntimeError:
-            return settings
-        if migrated_token_reference and migrated_token_reference != stored_token:
-            model.outlook_refresh_token = migrated_token_reference
-            self.session.commit()
+            return False
+        # Without a keychain the vault stores plaintext, so there is nothing to move
+        if not token_reference or token_reference == stored_token:
+            return False
 
-        settings.outlook_refresh_token = resolved_token
-        return settings
+        model.outlook_refresh_token = token_reference
+        self.session.flush()
+        return True
 
-    def _prepare_stored_refresh_token(
-        self,
-        settings: Settings,
-        previous_stored_token: str,
-    ) -> str:
+    def _prepare_stored_refresh_token(self, settings: Settings) -> str:
         if settings.outlook_configured and settings.outlook_refresh_token:
             return self._token_vault.save_token(
                 settings.id,
                 settings.outlook_refresh_token,
             )
-        self._token_vault.delete_token(settings.id, previous_stored_token)
+        previous_stored_token = self.session.execute(
+            select(SettingsModel.outlook_refresh_token).where(SettingsModel.id == settings.id)
+        ).scalar_one_or_none()
+        self._token_vault.delete_token(settings.id, previous_stored_token or "")
         return ""
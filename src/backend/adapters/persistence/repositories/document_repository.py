@@ -1,16 +1,85 @@
 """SQLite repository for Document entity."""
 
-from datetime import datetime, timedelta
 from uuid import UUID
 
+from sqlalchemy import CursorResult, bindparam, func, insert, select, update
 from sqlalchemy.orm import Session
 
-from backend.adapters.persistence.mappers import document_to_model, model_to_document
+from backend.adapters.persistence.mappers import (
+    document_to_model,
+    document_to_values,
+    model_to_document,
+    row_to_document_list_row,
+)
 from backend.adapters.persistence.models.document import DocumentModel
 from backend.domain.entities.document import Document
 from backend.domain.enums import ProcessingStatus
 from backend.domain.value_objects import FileHash
-from backend.ports.output.repositories import DocumentRepository
+from backend.ports.output.repositories import DocumentListRow, DocumentRepository
+
+# Rows fetched per round trip when streaming list results
+_LIST_BATCH_SIZE = 500
+
+# Fixed-shape statements are built once and executed with bound parameters.
+_DOCUMENT_BY_HASH = select(DocumentModel).where(
+    DocumentModel.file_hash_algorithm == bindparam("algorithm"),
+    DocumentModel.file_hash_value == bindparam("value"),
+)
+# Covered by the file hash unique index, so only the key is read
+_DOCUMENT_ID_BY_HASH = select(DocumentModel.id).where(
+    DocumentModel.file_hash_algorithm == bindparam("algorithm"),
+    DocumentModel.file_hash_value == bindparam("value"),
+)
+_DOCUMENTS_BY_STATUS = (
+    select(DocumentModel)
+    .where(DocumentModel.status == bindparam("status"))
+    .order_by(DocumentModel.created_at.desc())
+    .execution_options(yield_per=_LIST_BATCH_SIZE)
+)
+# SQLite evaluates the cutoff itself; created_at holds naive local time, hence localtime
+_STUCK_DOCUMENTS = (
+    select(DocumentModel)
+    .where(
+        DocumentModel.status == ProcessingStatus.PROCESSING.value,
+        DocumentModel.created_at < func.datetime("now", "localtime", "-10 minutes"),
+    )
+    .order_by(DocumentModel.created_at)
+)
+# List views read only the columns they render; hashes and the storage path stay behind
+_DOCUMENT_ROWS = (
+    select(
+        DocumentModel.id,
+        DocumentModel.filename,
+        DocumentModel.status,
+        DocumentModel.document_type,
+        DocumentModel.created_at,
+        DocumentModel.processed_at,
+        DocumentModel.email_message_id,
+        DocumentModel.email_sender,
+        DocumentModel.email_subject,
+        DocumentModel.error_type,
+        DocumentModel.error_message,
+        DocumentModel.invoice_id,
+        (func.coalesce(DocumentModel.storage_path, "") != "").label("has_file"),
+    )
+    .order_by(DocumentModel.created_at.desc(), DocumentModel.id.desc())
+    .execution_options(yield_per=_LIST_BATCH_SIZE)
+)
+_DOCUMENT_ROWS_BY_STATUS = _DOCUMENT_ROWS.where(DocumentModel.status == bindparam("status"))
+
+# Columns that change over a document's lifecycle; hash, email and creation data are fixed
+_UPDATABLE_COLUMNS = (
+    "filename",
+    "document_type",
+    "status",
+    "storage_path",
+    "error_type",
+    "error_message",
+    "error_occurred_at",
+    "error_retryable",
+    "processed_at",
+    "invoice_id",
+)
 
 
 class SqlAlchemyDocumentRepository(DocumentRepository):
@@ -23,77 +92,75 @@ class SqlAlchemyDocumentRepository(DocumentRepository):
         """Save a new document."""
         model = document_to_model(document)
         self.session.add(model)
-        self.session.commit()
+        self.session.flush()
+
+    def save_many(self, documents: list[Document]) -> None:
+        """Save a batch of new documents in one transaction."""
+        if not documents:
+            return
+        # ORM bulk INSERT from plain dicts: no identity-map bookkeeping per row, and
+        # insertmanyvalues packs rows into multi-row statements within SQLite's limits
+        self.session.execute(
+            insert(DocumentModel), [document_to_values(document) for document in documents]
+        )
 
     def find_by_id(self, document_id: UUID) -> Document | None:
         """Find document by ID."""
-        model = self.session.query(DocumentModel).filter(DocumentModel.id == document_id).first()
+        model = self.session.get(DocumentModel, document_id)
         if model is None:
             return None
         return model_to_document(model)
 
     def find_by_file_hash(self, file_hash: FileHash) -> Document | None:
         """Find document by file hash (for duplicate detection)."""
-        model = (
-            self.session.query(DocumentModel)
-            .filter(
-                DocumentModel.file_hash_algorithm == file_hash.algorithm,
-                DocumentModel.file_hash_value == file_hash.value,
-            )
-            .first()
-        )
+        model = self.session.execute(
+            _DOCUMENT_BY_HASH, {"algorithm": file_hash.algorithm, "value": file_hash.value}
+        ).scalar_one_or_none()
         if model is None:
             return None
         return model_to_document(model)
 
+    def exists_by_file_hash(self, file_hash: FileHash) -> bool:
+        """Check whether a document with this file hash is already stored."""
+        document_id = self.session.execute(
+            _DOCUMENT_ID_BY_HASH, {"algorithm": file_hash.algorithm, "value": file_hash.value}
+        ).scalar_one_or_none()
+        return document_id is not None
+
     def list_by_status(self, status: ProcessingStatus) -> list[Document]:
         """List documents by processing status."""
-        models = (
-            self.session.query(DocumentModel)
-            .filter(DocumentModel.status == status.value)
-            .order_by(DocumentModel.created_at.desc())
-            .all()
-        )
+        models = self.session.scalars(_DOCUMENTS_BY_STATUS, {"status": status.value})
         return [model_to_document(model) for model in models]
 
+    def list_rows(self, status: ProcessingStatus | None = None) -> list[DocumentListRow]:
+        """List flat document summaries, newest first, optionally by status."""
+        if status is None:
+            rows = self.session.execute(_DOCUMENT_ROWS).mappings()
+        else:
+            rows = self.session.execute(
+                _DOCUMENT_ROWS_BY_STATUS, {"status": status.value}
+            ).mappings()
+        return [row_to_document_list_row(row) for row in rows]
+
     def find_stuck_processing(self) -> list[Document]:
         """Find documents stuck in PROCESSING status (crash recovery).
 
         Documents that have been in PROCESSING status for more than 10 minutes
         are considered stuck (likely due to app crash or network timeout).
         """
-        threshold = datetime.now() - timedelta(minutes=10)
-
-        models = (
-            self.session.query(DocumentModel)
-            .filter(
-                DocumentModel.status == ProcessingStatus.PROCESSING.value,
-                DocumentModel.created_at < threshold,
-            )
-            .order_by(DocumentModel.created_at)
-            .all()
-        )
+        models = self.session.scalars(_STUCK_DOCUMENTS).all()
         return [model_to_document(model) for model in models]
 
     def update(self, document: Document) -> None:
         """Update an existing document."""
-        model = self.session.query(DocumentModel).filter(DocumentModel.id == document.id).first()
+        values = document_to_values(document)
 
-        if model is None:
+        # Single UPDATE by primary key; the rowcount doubles as the existence check
+        result = self.session.execute(
+            update(DocumentModel)
+            .where(DocumentModel.id == document.id)
+            .values({column: values[column] for column in _UPDATABLE_COLUMNS})
+        )
+        assert isinstance(result, CursorResult)
+        if result.rowcount == 0:
             raise ValueError(f"Document {document.id} not found")
-
-        # Update model fields from entity
-        updated_model = document_to_model(document)
-
-        model.filename = updated_model.filename
-        model.document_type = updated_model.document_type
-        model.status = updated_model.status
-        model.storage_path = updated_model.storage_path
-        model.error_type = updated_model.error_type
-        model.error_message = updated_model.error_message
-        model.error_occurred_at = updated_model.error_occurred_at
-        model.error_retryable = updated_model.error_retryable
-        model.processed_at = updated_model.processed_at
-        model.invoice_id = updated_model.invoice_id
-
-        self.session.commit()
@@ -1,8 +1,9 @@
 """SQLite repository for Invoice entities."""
 
-from datetime import date
+from itertools import groupby
 from uuid import UUID
 
+from sqlalchemy import ColumnElement, bindparam, select
 from sqlalchemy.orm import Session
 
 from backend.adapters.persistence.mappers import (
@@ -10,10 +11,30 @@ from backend.adapters.persistence.mappers import (
     model_to_client_invoice,
     model_to_provider_invoice,
     provider_invoice_to_model,
+    row_to_invoice_list_row,
 )
-from backend.adapters.persistence.models.invoice import ClientInvoiceModel, ProviderInvoiceModel
+from backend.adapters.persistence.models.invoice import (
+    ClientInvoiceModel,
+    ProviderInvoiceBLReferenceModel,
+    ProviderInvoiceModel,
+)
+from backend.adapters.persistence.models.party import ClientModel, ProviderModel
 from backend.domain.entities.invoice import ClientInvoice, ProviderInvoice
-from backend.ports.output.repositories import InvoiceFilters, InvoiceRepository
+from backend.domain.enums import DocumentType
+from backend.ports.output.repositories import InvoiceFilters, InvoiceListRow, InvoiceRepository
+
+# Rows fetched per round trip when streaming list results
+_LIST_BATCH_SIZE = 500
+
+# Fixed-shape statements are built once and executed with bound parameters.
+_CLIENT_INVOICE_BY_NUMBER = select(ClientInvoiceModel).where(
+    ClientInvoiceModel.invoice_number == bindparam("invoice_number"),
+    ClientInvoiceModel.client_id == bindparam("client_id"),
+)
+_PROVIDER_INVOICE_BY_NUMBER = select(ProviderInvoiceModel).where(
+    ProviderInvoiceModel.invoice_number == bindparam("invoice_number"),
+    ProviderInvoiceModel.provider_id == bindparam("provider_id"),
+)
 
 
 class SqlAlchemyInvoiceRepository(InvoiceRepository):
@@ -26,42 +47,34 @@ class SqlAlchemyInvoiceRepository(InvoiceRepository):
         """Save a client invoice (revenue)."""
         model = client_invoice_to_model(invoice)
         self.session.add(model)
-        self.session.commit()
+        self.session.flush()
 
     def save_provider_invoice(self, invoice: ProviderInvoice) -> None:
         """Save a provider invoice (cost)."""
         model = provider_invoice_to_model(invoice)
         self.session.add(model)
-        self.session.commit()
+        self.session.flush()
 
     def find_client_invoice_by_id(self, invoice_id: UUID) -> ClientInvoice | None:
         """Find client invoice by invoice ID."""
-        model = self.session.query(ClientInvoiceModel).filter(ClientInvoiceModel.id == invoice_id).first()
+        model = self.session.get(ClientInvoiceModel, invoice_id)
         if model is None:
             return None
         return model_to_client_invoice(model)
 
     def find_provider_invoice_by_id(self, invoice_id: UUID) -> ProviderInvoice | None:
         """Find provider invoice by invoice ID."""
-        model = (
-            self.session.query(ProviderInvoiceModel)
-            .filter(ProviderInvoiceModel.id == invoice_id)
-            .first()
-        )
+        model = self.session.get(ProviderInvoiceModel, invoice_id)
         if model is None:
             return None
         return model_to_provider_invoice(model)
 
     def find_client_invoice(self, invoice_number: str, client_id: UUID) -> ClientInvoice | None:
         """Find client invoice by number and client ID."""
-        model = (
-            self.session.query(ClientInvoiceModel)
-            .filter(
-                ClientInvoiceModel.invoice_number == invoice_number,
-                ClientInvoiceModel.client_id == client_id,
-            )
-            .first()
-        )
+        model = self.session.execute(
+            _CLIENT_INVOICE_BY_NUMBER,
+            {"invoice_number": invoice_number, "client_id": client_id},
+        ).scalar_one_or_none()
         if model is None:
             return None
         return model_to_client_invoice(model)
@@ -70,67 +83,104 @@ class SqlAlchemyInvoiceRepository(InvoiceRepository):
         self, invoice_number: str, provider_id: UUID
     ) -> ProviderInvoice | None:
         """Find provider invoice by number and provider ID."""
-        model = (
-            self.session.query(ProviderInvoiceModel)
-            .filter(
-                ProviderInvoiceModel.invoice_number == invoice_number,
-                ProviderInvoiceModel.provider_id == provider_id,
-            )
-            .first()
-        )
+        model = self.session.execute(
+            _PROVIDER_INVOICE_BY_NUMBER,
+            {"invoice_number": invoice_number, "provider_id": provider_id},
+        ).scalar_one_or_none()
         if model is None:
             return None
         return model_to_provider_invoice(model)
 
     def list_client_invoices(self, filters: InvoiceFilters | None = None) -> list[ClientInvoice]:
         """List client invoices with optional filtering."""
-        query = self.session.query(ClientInvoiceModel)
-
-        if filters:
-            if filters.client_id:
-                query = query.filter(ClientInvoiceModel.client_id == filters.client_id)
-            if filters.booking_id:
-                query = query.filter(ClientInvoiceModel.bl_reference == filters.booking_id)
-            if filters.date_from:
-                query = query.filter(
-                    ClientInvoiceModel.invoice_date >= date.fromisoformat(filters.date_from)
-                )
-            if filters.date_to:
-                query = query.filter(
-                    ClientInvoiceModel.invoice_date <= date.fromisoformat(filters.date_to)
-                )
-
-        models = query.order_by(ClientInvoiceModel.invoice_date.desc()).all()
+        query = (
+            select(ClientInvoiceModel)
+            .where(*_client_invoice_conditions(filters))
+            .order_by(ClientInvoiceModel.invoice_date.desc())
+        )
+        models = self.session.scalars(query.execution_options(yield_per=_LIST_BATCH_SIZE))
         return [model_to_client_invoice(model) for model in models]
 
     def list_provider_invoices(
         self, filters: InvoiceFilters | None = None
     ) -> list[ProviderInvoice]:
         """List provider invoices with optional filtering."""
-        query = self.session.query(ProviderInvoiceModel)
-
-        if filters:
-            if filters.provider_id:
-                query = query.filter(ProviderInvoiceModel.provider_id == filters.provider_id)
-            if filters.booking_id:
-                # Provider invoices can have multiple BL references (JSON array)
-                # This requires JSON querying which is database-specific
-                # For SQLite, we use the JSON_EXTRACT function
-                query = query.filter(
-                    ProviderInvoiceModel.bl_references.contains([filters.booking_id])
-                )
-            if filters.date_from:
-                query = query.filter(
-                    ProviderInvoiceModel.invoice_date >= date.fromisoformat(filters.date_from)
-                )
-            if filters.date_to:
-                query = query.filter(
-                    ProviderInvoiceModel.invoice_date <= date.fromisoformat(filters.date_to)
-                )
-
-        models = query.order_by(ProviderInvoiceModel.invoice_date.desc()).all()
+        query = (
+            select(ProviderInvoiceModel)
+            .where(*_provider_invoice_conditions(filters))
+            .order_by(ProviderInvoiceModel.invoice_date.desc())
+        )
+        models = self.session.scalars(query.execution_options(yield_per=_LIST_BATCH_SIZE))
         return [model_to_provider_invoice(model) for model in models]
 
+    def list_client_invoice_rows(
+        self, filters: InvoiceFilters | None = None
+    ) -> list[InvoiceListRow]:
+        """List flat client invoice summaries with optional filtering."""
+        # Summary columns plus the client name; charges and metadata JSON stay behind,
+        # since the stored charge count and total already summarize them
+        query = (
+            select(
+                ClientInvoiceModel.id,
+                ClientInvoiceModel.invoice_number,
+                ClientInvoiceModel.invoice_date,
+                ClientInvoiceModel.bl_reference,
+                ClientInvoiceModel.total_amount,
+                ClientInvoiceModel.charge_count,
+                ClientInvoiceModel.charges_total,
+                ClientModel.name.label("party_name"),
+            )
+            .outerjoin(ClientModel, ClientInvoiceModel.client_id == ClientModel.id)
+            .where(*_client_invoice_conditions(filters))
+            .order_by(ClientInvoiceModel.invoice_date.desc())
+        )
+        rows = self.session.execute(query.execution_options(yield_per=_LIST_BATCH_SIZE)).mappings()
+        return [
+            row_to_invoice_list_row(row, DocumentType.CLIENT_INVOICE, (row["bl_reference"],))
+            for row in rows
+        ]
+
+    def list_provider_invoice_rows(
+        self, filters: InvoiceFilters | None = None
+    ) -> list[InvoiceListRow]:
+        """List flat provider invoice summaries with optional filtering."""
+        # One row per BL link, ordered so each invoice's links are adjacent and in position order
+        query = (
+            select(
+                ProviderInvoiceModel.id,
+                ProviderInvoiceModel.invoice_number,
+                ProviderInvoiceModel.invoice_date,
+                ProviderInvoiceModel.total_amount,
+                ProviderInvoiceModel.charge_count,
+                ProviderInvoiceModel.charges_total,
+                ProviderModel.name.label("party_name"),
+                ProviderInvoiceBLReferenceModel.bl_reference,
+            )
+            .outerjoin(ProviderModel, ProviderInvoiceModel.provider_id == ProviderModel.id)
+            .outerjoin(
+                ProviderInvoiceBLReferenceModel,
+                ProviderInvoiceBLReferenceModel.invoice_id == ProviderInvoiceModel.id,
+            )
+            .where(*_provider_invoice_conditions(filters))
+            .order_by(
+                ProviderInvoiceModel.invoice_date.desc(),
+                ProviderInvoiceModel.id,
+                ProviderInvoiceBLReferenceModel.position,
+            )
+        )
+        rows = self.session.execute(query.execution_options(yield_per=_LIST_BATCH_SIZE)).mappings()
+
+        invoices = []
+        for _, invoice_rows in groupby(rows, key=lambda row: row["id"]):
+            links = list(invoice_rows)
+            bl_references = tuple(
+                link["bl_reference"] for link in links if link["bl_reference"] is not None
+            )
+            invoices.append(
+                row_to_invoice_list_row(links[0], DocumentType.PROVIDER_INVOICE, bl_references)
+            )
+        return invoices
+
     def delete_by_source_document(self, document_id: UUID) -> list[UUID]:
         """Delete invoices linked to a source document and return removed IDs."""
         removed_ids: list[UUID] = []
@@ -154,6 +204,48 @@ class SqlAlchemyInvoiceRepository(InvoiceRepository):
             self.session.delete(provider_model)
 
         if removed_ids:
-            self.session.commit()
+            self.session.flush()
 
         return removed_ids
+
+
+def _client_invoice_conditions(filters: InvoiceFilters | None) -> list[ColumnElement[bool]]:
+    """Translate invoice filters into WHERE conditions on client invoices."""
+    conditions: list[ColumnElement[bool]] = []
+    if filters is None:
+        return conditions
+
+    if filters.client_id:
+        conditions.append(ClientInvoiceModel.client_id == filters.client_id)
+    if filters.booking_id:
+        conditions.append(ClientInvoiceModel.bl_reference == filters.booking_id)
+    if filters.date_from:
+        conditions.append(ClientInvoiceModel.invoice_date >= filters.date_from)
+    if filters.date_to:
+        conditions.append(ClientInvoiceModel.invoice_date <= filters.date_to)
+    return conditions
+
+
+def _provider_invoice_conditions(filters: InvoiceFilters | None) -> list[ColumnElement[bool]]:
+    """Translate invoice filters into WHERE conditions on provider invoices."""
+    conditions: list[ColumnElement[bool]] = []
+    if filters is None:
+        return conditions
+
+    if filters.provider_id:
+        conditions.append(ProviderInvoiceModel.provider_id == filters.provider_id)
+    if filters.booking_id:
+        # Provider invoices can reference several BLs; an IN over the covering
+        # link index seeks matching invoices instead of probing every invoice
+        conditions.append(
+            ProviderInvoiceModel.id.in_(
+                select(ProviderInvoiceBLReferenceModel.invoice_id).where(
+                    ProviderInvoiceBLReferenceModel.bl_reference == filters.booking_id
+                )
+            )
+        )
+    if filters.date_from:
+        conditions.append(ProviderInvoiceModel.invoice_date >= filters.date_from)
+    if filters.date_to:
+        conditions.append(ProviderInvoiceModel.invoice_date <= filters.date_to)
+    return conditions
@@ -2,6 +2,7 @@
 
 from uuid import UUID
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from backend.adapters.persistence.mappers import (
@@ -15,6 +16,11 @@ from backend.domain.entities.party import Client, Provider, normalize_nif
 from backend.domain.enums import ProviderType
 from backend.ports.output.repositories import ClientRepository, ProviderRepository
 
+# Fixed-shape statements are built once and executed with bound parameters.
+_CLIENT_BY_NIF = select(ClientModel).where(ClientModel.nif == bindparam("nif"))
+_CLIENTS_BY_NAME = select(ClientModel).order_by(ClientModel.name)
+_PROVIDER_BY_NIF = select(ProviderModel).where(ProviderModel.nif == bindparam("nif"))
+
 
 class SqlAlchemyClientRepository(ClientRepository):
     """SQLite implementation of ClientRepository."""
@@ -26,11 +32,11 @@ class SqlAlchemyClientRepository(ClientRepository):
         """Save a new client."""
         model = client_to_model(client)
         self.session.add(model)
-        self.session.commit()
+        self.session.flush()
 
     def find_by_id(self, client_id: UUID) -> Client | None:
         """Find client by ID."""
-        model = self.session.query(ClientModel).filter(ClientModel.id == client_id).first()
+        model = self.session.get(ClientModel, client_id)
         if model is None:
             return None
         return model_to_client(model)
@@ -38,14 +44,14 @@ class SqlAlchemyClientRepository(ClientRepository):
     def find_by_nif(self, nif: str) -> Client | None:
         """Find client by NIF (tax ID)."""
         normalized_nif = normalize_nif(nif)
-        model = self.session.query(ClientModel).filter(ClientModel.nif == normalized_nif).first()
+        model = self.session.execute(_CLIENT_BY_NIF, {"nif": normalized_nif}).scalar_one_or_none()
         if model is None:
             return None
         return model_to_client(model)
 
     def list_all(self) -> list[Client]:
         """List all clients."""
-        models = self.session.query(ClientModel).order_by(ClientModel.name).all()
+        models = self.session.scalars(_CLIENTS_BY_NAME).all()
         return [model_to_client(model) for model in models]
 
 
@@ -59,11 +65,11 @@ class SqlAlchemyProviderRepository(ProviderRepository):
         """Save a new provider."""
         model = provider_to_model(provider)
         self.session.add(model)
-        self.session.commit()
+        self.session.flush()
 
     def find_by_id(self, provider_id: UUID) -> Provider | None:
         """Find provider by ID."""
-        model = self.session.query(ProviderModel).filter(ProviderModel.id == provider_id).first()
+        model = self.session.get(ProviderModel, provider_id)
         if model is None:
             return None
         return model_to_provider(model)
@@ -71,9 +77,7 @@ class SqlAlchemyProviderRepository(ProviderRepository):
     def find_by_nif(self, nif: str) -> Provider | None:
         """Find provider by NIF (tax ID)."""
         normalized_nif = normalize_nif(nif)
-        model = (
-            self.session.query(ProviderModel).filter(ProviderModel.nif == normalized_nif).first()
-        )
+        model = self.session.execute(_PROVIDER_BY_NIF, {"nif": normalized_nif}).scalar_one_or_none()
         if model is None:
             return None
         return model_to_provider(model)
@@ -0,0 +1,20 @@
+"""SQLAlchemy implementation of the UnitOfWork port."""
+
+from sqlalchemy.orm import Session
+
+from backend.ports.output.unit_of_work import UnitOfWork
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """Commits or rolls back the session shared by the request's repositories."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def commit(self) -> None:
+        """Commit the session transaction."""
+        self.session.commit()
+
+    def rollback(self) -> None:
+        """Roll back the session transaction."""
+        self.session.rollback()
@@ -0,0 +1,209 @@
+"""Generic-password access to the macOS Keychain.
+
+Calls Security.framework in-process through ctypes so each token operation
+avoids a fork/exec of the `security` CLI. Falls back to the CLI when the
+framework cannot be loaded, and whenever a framework call fails for any
+reason other than a missing item: items written by earlier releases through
+the CLI only trust /usr/bin/security, so this process may be denied access.
+"""
+
+import ctypes
+import subprocess
+
+SECURITY_FRAMEWORK_PATH = "/System/Library/Frameworks/Security.framework/Security"
+CORE_FOUNDATION_PATH = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+
+_ERR_SEC_SUCCESS = 0
+_ERR_SEC_DUPLICATE_ITEM = -25299
+_ERR_SEC_ITEM_NOT_FOUND = -25300
+
+_OSStatus = ctypes.c_int32
+_UInt32 = ctypes.c_uint32
+_Ref = ctypes.c_void_p
+
+
+def _load_frameworks() -> tuple[ctypes.CDLL, ctypes.CDLL] | None:
+    try:
+        security = ctypes.CDLL(SECURITY_FRAMEWORK_PATH)
+        core_foundation = ctypes.CDLL(CORE_FOUNDATION_PATH)
+    except OSError:
+        return None
+
+    security.SecKeychainAddGenericPassword.restype = _OSStatus
+    security.SecKeychainAddGenericPassword.argtypes = [
+        _Ref,
+        _UInt32,
+        ctypes.c_char_p,
+        _UInt32,
+        ctypes.c_char_p,
+        _UInt32,
+        ctypes.c_char_p,
+        ctypes.POINTER(_Ref),
+    ]
+    security.SecKeychainFindGenericPassword.restype = _OSStatus
+    security.SecKeychainFindGenericPassword.argtypes = [
+        _Ref,
+        _UInt32,
+        ctypes.c_char_p,
+        _UInt32,
+        ctypes.c_char_p,
+        ctypes.POINTER(_UInt32),
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.POINTER(_Ref),
+    ]
+    security.SecKeychainItemModifyAttributesAndData.restype = _OSStatus
+    security.SecKeychainItemModifyAttributesAndData.argtypes = [
+        _Ref,
+        ctypes.c_void_p,
+        _UInt32,
+        ctypes.c_char_p,
+    ]
+    security.SecKeychainItemFreeContent.restype = _OSStatus
+    security.SecKeychainItemFreeContent.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    security.SecKeychainItemDelete.restype = _OSStatus
+    security.SecKeychainItemDelete.argtypes = [_Ref]
+    core_foundation.CFRelease.restype = None
+    core_foundation.CFRelease.argtypes = [_Ref]
+    return security, core_foundation
+
+
+_FRAMEWORKS = _load_frameworks()
+
+
+def save_password(service: str, account: str, password: str) -> bool:
+    """Create or replace a generic password; return whether it was stored."""
+    if _FRAMEWORKS is None:
+        return _save_password_cli(service, account, password)
+
+    security, core_foundation = _FRAMEWORKS
+    service_bytes = service.encode()
+    account_bytes = account.encode()
+    password_bytes = password.encode()
+    status = security.SecKeychainAddGenericPassword(
+        None,
+        len(service_bytes),
+        service_bytes,
+        len(account_bytes),
+        account_bytes,
+        len(password_bytes),
+        password_bytes,
+        None,
+    )
+    if status == _ERR_SEC_SUCCESS:
+        return True
+    if status != _ERR_SEC_DUPLICATE_ITEM:
+        return _save_password_cli(service, account, password)
+
+    # Existing item: overwrite its data in place, as `-U` does for the CLI
+    status, item = _find_item(security, service_bytes, account_bytes)
+    if item is None:
+        return _save_password_cli(service, account, password)
+    try:
+        status = security.SecKeychainItemModifyAttributesAndData(
+            item, None, len(password_bytes), password_bytes
+        )
+    finally:
+        core_foundation.CFRelease(item)
+    if status != _ERR_SEC_SUCCESS:
+        return _save_password_cli(service, account, password)
+    return True
+
+
+def find_password(service: str, account: str) -> str | None:
+    """Return the stored generic password, or None when it is missing."""
+    if _FRAMEWORKS is None:
+        return _find_password_cli(service, account)
+
+    security, _ = _FRAMEWORKS
+    service_bytes = service.encode()
+    account_bytes = account.encode()
+    length = _UInt32()
+    data = ctypes.c_void_p()
+    status = security.SecKeychainFindGenericPassword(
+        None,
+        len(service_bytes),
+        service_bytes,
+        len(account_bytes),
+        account_bytes,
+        ctypes.byref(length),
+        ctypes.byref(data),
+        None,
+    )
+    if status == _ERR_SEC_ITEM_NOT_FOUND:
+        return None
+    if status != _ERR_SEC_SUCCESS:
+        return _find_password_cli(service, account)
+    try:
+        return ctypes.string_at(data, length.value).decode().strip()
+    finally:
+        security.SecKeychainItemFreeContent(None, data)
+
+
+def delete_password(service: str, account: str) -> None:
+    """Remove a generic password if it exists."""
+    if _FRAMEWORKS is None:
+        _delete_password_cli(service, account)
+        return
+
+    security, core_foundation = _FRAMEWORKS
+    status, item = _find_item(security, service.encode(), account.encode())
+    if status == _ERR_SEC_ITEM_NOT_FOUND:
+        return
+    if item is None:
+        _delete_password_cli(service, account)
+        return
+    try:
+        status = security.SecKeychainItemDelete(item)
+    finally:
+        core_foundation.CFRelease(item)
+    if status != _ERR_SEC_SUCCESS:
+        _delete_password_cli(service, account)
+
+
+def _find_item(security: ctypes.CDLL, service: bytes, account: bytes) -> tuple[int, int | None]:
+    """Return the lookup status and the item reference when it was found."""
+    item = _Ref()
+    status = security.SecKeychainFindGenericPassword(
+        None,
+        len(service),
+        service,
+        len(account),
+        account,
+        None,
+        None,
+        ctypes.byref(item),
+    )
+    if status != _ERR_SEC_SUCCESS or not item.value:
+        return status, None
+    return status, item.value
+
+
+def _save_password_cli(service: str, account: str, password: str) -> bool:
+    result = subprocess.run(
+        ["security", "add-generic-password", "-a", account, "-s", service, "-w", password, "-U"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.returncode == 0
+
+
+def _find_password_cli(service: str, account: str) -> str | None:
+    result = subprocess.run(
+        ["security", "find-generic-password", "-a", account, "-s", service, "-w"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _delete_password_cli(service: str, account: str) -> None:
+    subprocess.run(
+        ["security", "delete-generic-password", "-a", account, "-s", service],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
@@ -1,46 +1,43 @@
 """Outlook refresh token vault with macOS Keychain support."""
 
 import os
-import subprocess
 import sys
+import threading
+import time
 from uuid import UUID
 
+from backend.adapters.security import _keychain_native
+
 KEYCHAIN_SERVICE = "ai-bookkeeper.outlook.refresh-token"
 KEYCHAIN_REF_PREFIX = "keychain://ai-bookkeeper/outlook-refresh-token/"
 
+# Decided once at import; AI_BOOKKEEPER_DISABLE_KEYCHAIN opts out on macOS
+_USE_KEYCHAIN = sys.platform == "darwin" and not os.environ.get("AI_BOOKKEEPER_DISABLE_KEYCHAIN")
+
+# Resolved tokens, shared by all vaults since one is built per repository
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_token_cache: dict[tuple[UUID, str], tuple[float, str]] = {}
+_token_cache_lock = threading.Lock()
+# Bumped on every invalidation so a load that read the Keychain before a
+# concurrent save or delete does not cache the value it replaced
+_token_cache_generation = 0
+
 
 class OutlookRefreshTokenVault:
     """Store/retrieve Outlook refresh tokens, preferring macOS Keychain."""
 
-    def __init__(self) -> None:
-        self._use_keychain = self._is_keychain_enabled()
-
     def save_token(self, settings_id: UUID, refresh_token: str) -> str:
         """Persist refresh token and return DB-storable token reference."""
         if not refresh_token:
             return ""
-        if not self._use_keychain:
+        if not _USE_KEYCHAIN:
             return refresh_token
 
         account = self._account_for_settings(settings_id)
-        result = subprocess.run(
-            [
-                "security",
-                "add-generic-password",
-                "-a",
-                account,
-                "-s",
-                KEYCHAIN_SERVICE,
-                "-w",
-                refresh_token,
-                "-U",
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
+        if not _keychain_native.save_password(KEYCHAIN_SERVICE, account, refresh_token):
             raise RuntimeError("Failed to store Outlook token in macOS Keychain")
+        # Only after the write, so no load in between can re-cache the old token
+        self._invalidate(settings_id)
 
         return f"{KEYCHAIN_REF_PREFIX}{account}"
 
@@ -52,37 +49,33 @@ class OutlookRefreshTokenVault:
         """Resolve refresh token from DB value/reference."""
         if not stored_value:
             return ""
-        if not self._use_keychain:
+        if not _USE_KEYCHAIN:
             return stored_value
         if not stored_value.startswith(KEYCHAIN_REF_PREFIX):
             # Legacy plaintext value from before keychain migration.
             return stored_value
 
+        key = (settings_id, stored_value)
+        with _token_cache_lock:
+            cached = _token_cache.get(key)
+            generation = _token_cache_generation
+        if cached is not None and time.monotonic() - cached[0] < _TOKEN_CACHE_TTL_SECONDS:
+            return cached[1]
+
         account = stored_value.removeprefix(KEYCHAIN_REF_PREFIX).strip()
         if not account:
             account = self._account_for_settings(settings_id)
 
-        result = subprocess.run(
-            [
-                "security",
-                "find-generic-password",
-                "-a",
-                account,
-                "-s",
-                KEYCHAIN_SERVICE,
-                "-w",
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            return ""
-        return result.stdout.strip()
+        token = _keychain_native.find_password(KEYCHAIN_SERVICE, account) or ""
+        if token:
+            with _token_cache_lock:
+                if generation == _token_cache_generation:
+                    _token_cache[key] = (time.monotonic(), token)
+        return token
 
     def delete_token(self, settings_id: UUID, stored_value: str) -> None:
         """Delete token from keychain when disconnecting Outlook."""
-        if not self._use_keychain:
+        if not _USE_KEYCHAIN:
             return
 
         account = (
@@ -90,27 +83,16 @@ class OutlookRefreshTokenVault:
             if stored_value.startswith(KEYCHAIN_REF_PREFIX)
             else self._account_for_settings(settings_id)
         )
-        if not account:
-            return
-
-        subprocess.run(
-            [
-                "security",
-                "delete-generic-password",
-                "-a",
-                account,
-                "-s",
-                KEYCHAIN_SERVICE,
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-    def _is_keychain_enabled(self) -> bool:
-        if sys.platform != "darwin":
-            return False
-        return not os.getenv("PYTEST_CURRENT_TEST")
+        if account:
+            _keychain_native.delete_password(KEYCHAIN_SERVICE, account)
+        self._invalidate(settings_id)
+
+    def _invalidate(self, settings_id: UUID) -> None:
+        global _token_cache_generation
+        with _token_cache_lock:
+            _token_cache_generation += 1
+            for key in [key for key in _token_cache if key[0] == settings_id]:
+                del _token_cache[key]
 
     def _account_for_settings(self, settings_id: UUID) -> str:
         return f"settings-{settings_id}"
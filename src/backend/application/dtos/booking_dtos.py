@@ -1,12 +1,12 @@
 """DTOs for booking use cases."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class BookingListItem:
     """Booking summary for list view."""
 
@@ -23,7 +23,7 @@ class BookingListItem:
     document_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookingChargeItem:
     """Single charge line in booking detail response."""
 
@@ -36,7 +36,7 @@ class BookingChargeItem:
     source_document_url: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookingDetailResponse:
     """Complete booking detail with charges."""
 
@@ -77,7 +77,7 @@ class BookingDetailResponse:
     cost_charges: list[BookingChargeItem] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListBookingsRequest:
     """Request to list bookings with filters."""
 
@@ -85,13 +85,13 @@ class ListBookingsRequest:
     client: str | None = None
     booking: str | None = None
     status: str | None = None
-    date_from: str | None = None
-    date_to: str | None = None
+    date_from: date | None = None
+    date_to: date | None = None
     sort_by: str = "created_at"
     descending: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EditBookingRequest:
     """Request to edit mutable booking fields."""
 
@@ -5,7 +5,7 @@ from decimal import Decimal
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigureCompanyRequest:
     """Request to configure company information."""
 
@@ -16,7 +16,7 @@ class ConfigureCompanyRequest:
     commission_rate: Decimal = Decimal("0.50")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompanyResponse:
     """Response with company configuration."""
 
@@ -28,7 +28,7 @@ class CompanyResponse:
     commission_rate: Decimal
     is_configured: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigureAgentRequest:
     """Request to configure agent profile."""
 
@@ -37,7 +37,7 @@ class ConfigureAgentRequest:
     phone: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentResponse:
     """Response with agent profile."""
 
@@ -47,7 +47,7 @@ class AgentResponse:
     phone: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigureSettingsRequest:
     """Request to configure application settings."""
 
@@ -57,7 +57,7 @@ class ConfigureSettingsRequest:
     onboarding_dismissed: bool | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingsResponse:
     """Response with application settings."""
 
@@ -69,7 +69,7 @@ class SettingsResponse:
     onboarding_dismissed: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiagnosticsExportResponse:
     """Response for diagnostics bundle export."""
 
@@ -1,12 +1,12 @@
 """DTOs for document use cases."""
 
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class DocumentListItem:
     """Document summary for list view."""
 
@@ -31,30 +31,33 @@ class DocumentListItem:
     booking_references: list[str] | None = None
     total_amount: Decimal | None = None
     file_url: str | None = None
-    manually_edited_fields: list[str] = field(default_factory=list)
+    manually_edited_fields: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListDocumentsRequest:
     """Request to list documents by status."""
 
     status: str | None = None
     limit: int = 100
     document_type: str | None = None
-    date_from: str | None = None
-    date_to: str | None = None
+    date_from: date | None = None
+    date_to: date | None = None
     party: str | None = None
     booking: str | None = None
+    # Keyset cursor: created_at and id of the last document on the previous page
+    cursor: datetime | None = None
+    cursor_id: UUID | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FetchEmailsRequest:
     """Request to fetch Outlook emails with PDF attachments."""
 
     max_messages: int = 25
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FetchEmailsResponse:
     """Summary result for an email fetch operation."""
 
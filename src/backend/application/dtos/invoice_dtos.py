@@ -7,7 +7,7 @@ from typing import Any
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessInvoiceRequest:
     """Request to process a document with AI extraction."""
 
@@ -15,7 +15,7 @@ class ProcessInvoiceRequest:
     allow_processed: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessInvoiceResponse:
     """Response from AI invoice extraction (preview for user validation).
 
@@ -49,11 +49,11 @@ class ProcessInvoiceResponse:
 
     # Validation
     overall_confidence: str = "HIGH"
-    warnings: list[str] = field(default_factory=list)
-    errors: list[str] = field(default_factory=list)
+    warnings: tuple[str, ...] = ()
+    errors: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SaveChargeInput:
     """Single reviewed charge line to persist."""
 
@@ -64,7 +64,7 @@ class SaveChargeInput:
     container: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfirmInvoiceRequest:
     """Request to confirm reviewed extraction data and persist invoice entities."""
 
@@ -73,7 +73,7 @@ class ConfirmInvoiceRequest:
     ai_model: str
     raw_json: str
     overall_confidence: str = "HIGH"
-    manually_edited_fields: list[str] = field(default_factory=list)
+    manually_edited_fields: tuple[str, ...] = ()
 
     invoice_number: str | None = None
     invoice_date: str | None = None
@@ -91,7 +91,7 @@ class ConfirmInvoiceRequest:
     shipping_details: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfirmInvoiceResponse:
     """Response after persisting a reviewed invoice."""
 
@@ -99,22 +99,25 @@ class ConfirmInvoiceResponse:
     invoice_id: UUID | None
     document_type: str
     status: str
-    booking_ids: list[str] = field(default_factory=list)
+    booking_ids: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListInvoicesRequest:
     """Request to list/search persisted invoices."""
 
     invoice_number: str | None = None
     party: str | None = None
-    date_from: str | None = None
-    date_to: str | None = None
+    date_from: date | None = None
+    date_to: date | None = None
     invoice_type: str | None = None
     limit: int = 100
+    # Keyset cursor: invoice_date and id of the last invoice on the previous page
+    cursor: date | None = None
+    cursor_id: UUID | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class InvoiceListItem:
     """Unified invoice row for search results."""
 
@@ -125,3 +128,5 @@ class InvoiceListItem:
     party_name: str | None
     booking_references: list[str]
     total_amount: Decimal
+    charge_count: int
+    charges_total: Decimal
@@ -1,11 +1,11 @@
 """DTOs for reporting use cases."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommissionReportRequest:
     """Request to generate a commission report."""
 
@@ -17,7 +17,7 @@ class CommissionReportRequest:
     invoice_type: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class CommissionReportItem:
     """Single booking row in a commission report."""
 
@@ -31,7 +31,7 @@ class CommissionReportItem:
     commission: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommissionReportTotals:
     """Aggregate totals for a commission report."""
 
@@ -42,17 +42,21 @@ class CommissionReportTotals:
     total_commission: Decimal
 
 
-@dataclass(frozen=True)
+_ZERO = Decimal("0.00")
+
+# Immutable, so one shared instance serves every report built without totals
+_EMPTY_TOTALS = CommissionReportTotals(
+    booking_count=0,
+    total_revenue=_ZERO,
+    total_costs=_ZERO,
+    total_margin=_ZERO,
+    total_commission=_ZERO,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class CommissionReportResponse:
     """Response payload for commission report generation."""
 
-    items: list[CommissionReportItem] = field(default_factory=list)
-    totals: CommissionReportTotals = field(
-        default_factory=lambda: CommissionReportTotals(
-            booking_count=0,
-            total_revenue=Decimal("0.00"),
-            total_costs=Decimal("0.00"),
-            total_margin=Decimal("0.00"),
-            total_commission=Decimal("0.00"),
-        )
-    )
+    items: tuple[CommissionReportItem, ...] = ()
+    totals: CommissionReportTotals = _EMPTY_TOTALS
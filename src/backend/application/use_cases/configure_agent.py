@@ -3,13 +3,15 @@
 from backend.application.dtos import AgentResponse, ConfigureAgentRequest
 from backend.domain.entities.configuration import Agent
 from backend.ports.output.repositories import AgentRepository
+from backend.ports.output.unit_of_work import UnitOfWork
 
 
 class ConfigureAgentUseCase:
     """Configure or update agent profile."""
 
-    def __init__(self, agent_repo: AgentRepository):
+    def __init__(self, agent_repo: AgentRepository, unit_of_work: UnitOfWork):
         self.agent_repo = agent_repo
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: ConfigureAgentRequest) -> AgentResponse:
         """Execute the use case."""
@@ -29,13 +31,9 @@ class ConfigureAgentUseCase:
             )
 
         self.agent_repo.save(agent)
+        self.unit_of_work.commit()
 
-        return AgentResponse(
-            id=agent.id,
-            name=agent.name,
-            email=agent.email,
-            phone=agent.phone,
-        )
+        return self._to_response(agent)
 
     def get_agent(self) -> AgentResponse | None:
         """Get current agent profile."""
@@ -44,6 +42,10 @@ class ConfigureAgentUseCase:
         if not agent:
             return None
 
+        return self._to_response(agent)
+
+    @staticmethod
+    def _to_response(agent: Agent) -> AgentResponse:
         return AgentResponse(
             id=agent.id,
             name=agent.name,
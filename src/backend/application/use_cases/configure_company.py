@@ -3,13 +3,15 @@
 from backend.application.dtos import CompanyResponse, ConfigureCompanyRequest
 from backend.domain.entities.configuration import Company
 from backend.ports.output.repositories import CompanyRepository
+from backend.ports.output.unit_of_work import UnitOfWork
 
 
 class ConfigureCompanyUseCase:
     """Configure or update company information."""
 
-    def __init__(self, company_repo: CompanyRepository):
+    def __init__(self, company_repo: CompanyRepository, unit_of_work: UnitOfWork):
         self.company_repo = company_repo
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: ConfigureCompanyRequest) -> CompanyResponse:
         """Execute the use case."""
@@ -36,16 +38,9 @@ class ConfigureCompanyUseCase:
             )
 
         self.company_repo.save(company)
+        self.unit_of_work.commit()
 
-        return CompanyResponse(
-            id=company.id,
-            name=company.name,
-            nif=company.nif,
-            address=company.address,
-            contact_info=company.contact_info,
-            commission_rate=company.agent_commission_rate,
-            is_configured=company.is_configured,
-        )
+        return self._to_response(company)
 
     def get_company(self) -> CompanyResponse | None:
         """Get current company configuration."""
@@ -54,6 +49,10 @@ class ConfigureCompanyUseCase:
         if not company:
             return None
 
+        return self._to_response(company)
+
+    @staticmethod
+    def _to_response(company: Company) -> CompanyResponse:
         return CompanyResponse(
             id=company.id,
             name=company.name,
@@ -3,13 +3,15 @@
 from backend.application.dtos import ConfigureSettingsRequest, SettingsResponse
 from backend.domain.entities.configuration import Settings
 from backend.ports.output.repositories import SettingsRepository
+from backend.ports.output.unit_of_work import UnitOfWork
 
 
 class ConfigureSettingsUseCase:
     """Configure or update application settings."""
 
-    def __init__(self, settings_repo: SettingsRepository):
+    def __init__(self, settings_repo: SettingsRepository, unit_of_work: UnitOfWork):
         self.settings_repo = settings_repo
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: ConfigureSettingsRequest) -> SettingsResponse:
         """Execute the use case."""
@@ -32,15 +34,9 @@ class ConfigureSettingsUseCase:
             settings.set_onboarding_dismissed(request.onboarding_dismissed)
 
         self.settings_repo.save(settings)
+        self.unit_of_work.commit()
 
-        return SettingsResponse(
-            id=settings.id,
-            has_api_key=settings.has_api_key,
-            outlook_configured=settings.outlook_configured,
-            default_export_path=settings.default_export_path,
-            extraction_prompt=settings.extraction_prompt,
-            onboarding_dismissed=settings.onboarding_dismissed,
-        )
+        return self._to_response(settings)
 
     def get_settings(self) -> SettingsResponse | None:
         """Get current application settings."""
@@ -49,6 +45,10 @@ class ConfigureSettingsUseCase:
         if not settings:
             return None
 
+        return self._to_response(settings)
+
+    @staticmethod
+    def _to_response(settings: Settings) -> SettingsResponse:
         return SettingsResponse(
             id=settings.id,
             has_api_key=settings.has_api_key,
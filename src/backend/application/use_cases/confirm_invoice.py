@@ -30,6 +30,15 @@ from backend.ports.output.repositories import (
     InvoiceRepository,
     ProviderRepository,
 )
+from backend.ports.output.unit_of_work import UnitOfWork
+
+# Reviewed values are matched by enum value; unknown ones fall back without raising
+_CHARGE_CATEGORIES = {category.value: category for category in ChargeCategory}
+_PROVIDER_TYPES = {provider_type.value: provider_type for provider_type in ProviderType}
+_CONFIDENCE_LEVELS = {level.value: level for level in ConfidenceLevel}
+
+# POL, POD, vessel and containers resolved from the reviewed shipping details
+_ShippingDetails = tuple[Port | None, Port | None, str | None, list[str] | None]
 
 
 class ConfirmInvoiceUseCase:
@@ -42,12 +51,14 @@ class ConfirmInvoiceUseCase:
         invoice_repo: InvoiceRepository,
         client_repo: ClientRepository,
         provider_repo: ProviderRepository,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.document_repo = document_repo
         self.booking_repo = booking_repo
         self.invoice_repo = invoice_repo
         self.client_repo = client_repo
         self.provider_repo = provider_repo
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: ConfirmInvoiceRequest) -> ConfirmInvoiceResponse:
         """Confirm and save reviewed invoice data."""
@@ -65,12 +76,13 @@ class ConfirmInvoiceUseCase:
             self._cleanup_existing_projection_for_document(document.id)
             document.mark_processed(DocumentType.OTHER)
             self.document_repo.update(document)
+            self.unit_of_work.commit()
             return ConfirmInvoiceResponse(
                 document_id=document.id,
                 invoice_id=None,
                 document_type=document_type.value,
                 status=document.status.value,
-                booking_ids=[],
+                booking_ids=(),
             )
 
         if not request.invoice_number:
@@ -116,13 +128,15 @@ class ConfirmInvoiceUseCase:
 
         document.mark_processed(document_type=document_type, invoice_id=invoice_id)
         self.document_repo.update(document)
+        # Invoice, bookings, parties and document status land as one transaction
+        self.unit_of_work.commit()
 
         return ConfirmInvoiceResponse(
             document_id=document.id,
             invoice_id=invoice_id,
             document_type=document_type.value,
             status=document.status.value,
-            booking_ids=booking_ids,
+            booking_ids=tuple(booking_ids),
         )
 
     def _persist_client_invoice(
@@ -152,11 +166,14 @@ class ConfirmInvoiceUseCase:
         ):
             raise ValueError("Client invoice already exists for invoice_number + client")
 
-        charges_total = self._sum_charge_amounts(request.charges)
+        # Parse each amount once; reused for the total and for its charge
+        charge_amounts = [self._to_money(charge_input.amount) for charge_input in request.charges]
+        charges_total = self._sum_amounts(charge_amounts)
         tax_amount = self._to_money(request.totals.get("tax_amount", "0"))
-        total_amount = self._to_money(request.totals.get("total")) if request.totals.get(
-            "total"
-        ) is not None else charges_total + tax_amount
+        raw_total = request.totals.get("total")
+        total_amount = (
+            self._to_money(raw_total) if raw_total is not None else charges_total + tax_amount
+        )
         self._cleanup_existing_projection_for_document(source_document.document_id)
 
         invoice = ClientInvoice.create(
@@ -170,10 +187,10 @@ class ConfirmInvoiceUseCase:
         invoice.source_document = source_document
         invoice.extraction_metadata = extraction_metadata
 
-        referenced_bookings: set[str] = set()
-        for charge_input in request.charges:
+        # Charges grouped per booking as they are built, so each booking takes its own
+        charges_by_booking: dict[str, list[BookingCharge]] = {}
+        for charge_input, amount in zip(request.charges, charge_amounts, strict=True):
             booking_id = (charge_input.bl_reference or primary_bl_reference).strip()
-            referenced_bookings.add(booking_id)
 
             charge = BookingCharge(
                 booking_id=booking_id,
@@ -182,12 +199,17 @@ class ConfirmInvoiceUseCase:
                 provider_type=None,
                 container=charge_input.container,
                 description=charge_input.description,
-                amount=self._to_money(charge_input.amount),
+                amount=amount,
             )
             invoice.add_charge(charge)
-
-        for booking_id in sorted(referenced_bookings):
-            booking = self.booking_repo.find_or_create(booking_id)
+            charges_by_booking.setdefault(booking_id, []).append(charge)
+
+        shipping = self._parse_shipping_details(request)
+        bookings: list[Booking] = []
+        booking_ids = sorted(charges_by_booking)
+        found = self.booking_repo.find_or_create_many(booking_ids)
+        for booking_id in booking_ids:
+            booking = found[booking_id]
             booking.update_client(
                 ClientInfo(
                     client_id=client.id,
@@ -195,15 +217,15 @@ class ConfirmInvoiceUseCase:
                     nif=client.nif,
                 )
             )
-            self._apply_shipping_details(booking, request)
+            self._apply_shipping_details(booking, shipping)
 
-            for charge in invoice.charges:
-                if charge.booking_id == booking_id:
-                    booking.add_revenue_charge(charge)
-            self.booking_repo.save(booking)
+            for charge in charges_by_booking[booking_id]:
+                booking.add_revenue_charge(charge)
+            bookings.append(booking)
 
+        self.booking_repo.update_many(bookings)
         self.invoice_repo.save_client_invoice(invoice)
-        return invoice.id, sorted(referenced_bookings)
+        return invoice.id, booking_ids
 
     def _persist_provider_invoice(
         self,
@@ -237,11 +259,13 @@ class ConfirmInvoiceUseCase:
         ):
             raise ValueError("Provider invoice already exists for invoice_number + provider")
 
-        charges_total = self._sum_charge_amounts(request.charges)
+        charge_amounts = [self._to_money(charge_input.amount) for charge_input in request.charges]
+        charges_total = self._sum_amounts(charge_amounts)
         tax_amount = self._to_money(request.totals.get("tax_amount", "0"))
-        total_amount = self._to_money(request.totals.get("total")) if request.totals.get(
-            "total"
-        ) is not None else charges_total + tax_amount
+        raw_total = request.totals.get("total")
+        total_amount = (
+            self._to_money(raw_total) if raw_total is not None else charges_total + tax_amount
+        )
         self._cleanup_existing_projection_for_document(source_document.document_id)
 
         invoice = ProviderInvoice.create(
@@ -256,12 +280,11 @@ class ConfirmInvoiceUseCase:
         invoice.source_document = source_document
         invoice.extraction_metadata = extraction_metadata
 
-        referenced_bookings: set[str] = set()
+        charges_by_booking: dict[str, list[BookingCharge]] = {}
         default_booking_id = bl_references[0]
 
-        for charge_input in request.charges:
+        for charge_input, amount in zip(request.charges, charge_amounts, strict=True):
             booking_id = (charge_input.bl_reference or default_booking_id).strip()
-            referenced_bookings.add(booking_id)
 
             charge = BookingCharge(
                 booking_id=booking_id,
@@ -270,65 +293,76 @@ class ConfirmInvoiceUseCase:
                 provider_type=provider.provider_type,
                 container=charge_input.container,
                 description=charge_input.description,
-                amount=self._to_money(charge_input.amount),
+                amount=amount,
             )
             invoice.add_charge(charge)
-
-        for booking_id in sorted(referenced_bookings):
-            booking = self.booking_repo.find_or_create(booking_id)
-            self._apply_shipping_details(booking, request)
-
-            for charge in invoice.charges:
-                if charge.booking_id == booking_id:
-                    booking.add_cost_charge(charge)
-            self.booking_repo.save(booking)
-
+            charges_by_booking.setdefault(booking_id, []).append(charge)
+
+        shipping = self._parse_shipping_details(request)
+        bookings: list[Booking] = []
+        booking_ids = sorted(charges_by_booking)
+        # Linked BLs without charges still need a booking row for the link's foreign key
+        found = self.booking_repo.find_or_create_many([*booking_ids, *bl_references])
+        for booking_id in booking_ids:
+            booking = found[booking_id]
+            self._apply_shipping_details(booking, shipping)
+
+            for charge in charges_by_booking[booking_id]:
+                booking.add_cost_charge(charge)
+            bookings.append(booking)
+
+        self.booking_repo.update_many(bookings)
         self.invoice_repo.save_provider_invoice(invoice)
-        return invoice.id, sorted(referenced_bookings)
+        return invoice.id, booking_ids
 
     def _extract_bl_references(self, references: list[str | dict[str, Any]]) -> list[str]:
+        # Deduplicate in the same pass, keeping first-seen order
+        seen: set[str] = set()
         result: list[str] = []
         for item in references:
             if isinstance(item, str):
                 value = item.strip()
-                if value:
-                    result.append(value)
             elif isinstance(item, dict):
                 value = str(item.get("bl_number", "")).strip()
-                if value:
-                    result.append(value)
-        return list(dict.fromkeys(result))
+            else:
+                continue
+            if value and value not in seen:
+                seen.add(value)
+                result.append(value)
+        return result
 
     def _extract_bl_references_from_charges(self, charges: list[SaveChargeInput]) -> list[str]:
-        refs = []
+        seen: set[str] = set()
+        refs: list[str] = []
         for charge in charges:
-            if charge.bl_reference:
-                value = charge.bl_reference.strip()
-                if value:
-                    refs.append(value)
-        return list(dict.fromkeys(refs))
+            value = (charge.bl_reference or "").strip()
+            if value and value not in seen:
+                seen.add(value)
+                refs.append(value)
+        return refs
 
     def _parse_charge_category(self, value: str) -> ChargeCategory:
-        try:
-            return ChargeCategory(value.upper())
-        except ValueError:
-            return ChargeCategory.OTHER
+        return _CHARGE_CATEGORIES.get(value.upper(), ChargeCategory.OTHER)
 
     def _parse_provider_type(self, value: str | None) -> ProviderType:
         if not value:
             return ProviderType.OTHER
-        try:
-            return ProviderType(value.upper())
-        except ValueError:
-            return ProviderType.OTHER
+        return _PROVIDER_TYPES.get(value.upper(), ProviderType.OTHER)
 
     def _to_money(self, value: object) -> Money:
         if value is None or value == "":
             return Money.zero()
+        # Decimals and ints convert exactly; only strings and floats need parsing
+        if isinstance(value, Decimal):
+            return Money(value)
+        # bool is an int subclass but never a valid amount
+        if isinstance(value, int) and not isinstance(value, bool):
+            return Money(Decimal(value))
         return Money(Decimal(str(value)))
 
-    def _sum_charge_amounts(self, charges: list[SaveChargeInput]) -> Money:
-        return sum((self._to_money(c.amount) for c in charges), Money.zero())
+    def _sum_amounts(self, amounts: list[Money]) -> Money:
+        # Amounts are already rounded to cents, so one Decimal sum matches adding Money
+        return Money(sum((amount.amount for amount in amounts), Decimal(0)))
 
     def _build_extraction_metadata(self, request: ConfirmInvoiceRequest) -> ExtractionMetadata:
         confidence = self._parse_confidence(request.overall_confidence)
@@ -336,16 +370,13 @@ class ConfirmInvoiceUseCase:
             ai_model=request.ai_model,
             overall_confidence=confidence,
             raw_json=request.raw_json,
-            manually_edited_fields=tuple(request.manually_edited_fields),
+            manually_edited_fields=request.manually_edited_fields,
         )
 
     def _parse_confidence(self, value: str) -> ConfidenceLevel:
-        try:
-            return ConfidenceLevel(value.upper())
-        except ValueError:
-            return ConfidenceLevel.LOW
+        return _CONFIDENCE_LEVELS.get(value.upper(), ConfidenceLevel.LOW)
 
-    def _apply_shipping_details(self, booking: Booking, request: ConfirmInvoiceRequest) -> None:
+    def _parse_shipping_details(self, request: ConfirmInvoiceRequest) -> _ShippingDetails:
         shipping = request.shipping_details or {}
 
         pol_data = shipping.get("pol")
@@ -357,16 +388,26 @@ class ConfirmInvoiceUseCase:
             pol = Port(code=str(pol_data.get("code")), name=str(pol_data.get("name", "")))
         if isinstance(pod_data, dict) and pod_data.get("code"):
             pod = Port(code=str(pod_data.get("code")), name=str(pod_data.get("name", "")))
-        if pol is not None or pod is not None:
-            booking.update_ports(pol=pol, pod=pod)
 
         vessel = shipping.get("vessel")
-        if vessel:
-            booking.vessel = str(vessel)
 
         containers = shipping.get("containers")
-        if isinstance(containers, list):
-            booking.containers = [str(container) for container in containers if container]
+        return (
+            pol,
+            pod,
+            str(vessel) if vessel else None,
+            list(map(str, filter(None, containers))) if isinstance(containers, list) else None,
+        )
+
+    def _apply_shipping_details(self, booking: Booking, shipping: _ShippingDetails) -> None:
+        pol, pod, vessel, containers = shipping
+        if pol is not None or pod is not None:
+            booking.update_ports(pol=pol, pod=pod)
+        if vessel:
+            booking.vessel = vessel
+        if containers is not None:
+            # Each booking gets its own list so later edits do not leak across bookings
+            booking.containers = list(containers)
 
     def _cleanup_existing_projection_for_document(self, document_id: UUID) -> None:
         """Remove previously persisted projection for a source document."""
@@ -374,15 +415,13 @@ class ConfirmInvoiceUseCase:
         if not replaced_invoice_ids:
             return
 
-        bookings = self.booking_repo.list_all()
+        # Only bookings carrying charges from the replaced invoices are loaded
+        bookings = self.booking_repo.find_by_invoice_ids(replaced_invoice_ids)
         for booking in bookings:
-            booking_changed = False
             for invoice_id in replaced_invoice_ids:
-                booking_changed = (
-                    booking.remove_charges_for_invoice(invoice_id) or booking_changed
-                )
-            if booking_changed:
-                self.booking_repo.update(booking)
+                booking.remove_charges_for_invoice(invoice_id)
+        if bookings:
+            self.booking_repo.update_many(bookings)
 
     def _is_same_source_document(
         self,
@@ -1,17 +1,20 @@
 """Use case for editing booking fields."""
 
-from collections.abc import Callable
+from typing import Literal
 
 from backend.application.dtos import EditBookingRequest
+from backend.domain.entities.booking import Booking
 from backend.domain.value_objects import Port
 from backend.ports.output.repositories import BookingRepository
+from backend.ports.output.unit_of_work import UnitOfWork
 
 
 class EditBookingUseCase:
     """Edit mutable booking fields and persist changes."""
 
-    def __init__(self, booking_repo: BookingRepository) -> None:
+    def __init__(self, booking_repo: BookingRepository, unit_of_work: UnitOfWork) -> None:
         self.booking_repo = booking_repo
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: EditBookingRequest) -> None:
         """Apply requested field updates to a booking."""
@@ -24,51 +27,46 @@ class EditBookingUseCase:
             booking.vessel = normalized_vessel or None
 
         if request.containers is not None:
+            # Strip each container once, then drop the blank ones
             booking.containers = [
-                container.strip()
-                for container in request.containers
-                if container.strip()
+                container for container in map(str.strip, request.containers) if container
             ]
 
         self._apply_port_update(
-            current_code=booking.pol.code if booking.pol else None,
-            current_name=booking.pol.name if booking.pol else None,
-            requested_code=request.pol_code,
-            requested_name=request.pol_name,
-            assign_port=lambda port: setattr(booking, "pol", port),
-            port_label="POL",
+            booking, "pol", requested_code=request.pol_code, requested_name=request.pol_name
         )
         self._apply_port_update(
-            current_code=booking.pod.code if booking.pod else None,
-            current_name=booking.pod.name if booking.pod else None,
-            requested_code=request.pod_code,
-            requested_name=request.pod_name,
-            assign_port=lambda port: setattr(booking, "pod", port),
-            port_label="POD",
+            booking, "pod", requested_code=request.pod_code, requested_name=request.pod_name
         )
 
         self.booking_repo.update(booking)
+        self.unit_of_work.commit()
 
     @staticmethod
     def _apply_port_update(
+        booking: Booking,
+        attr_name: Literal["pol", "pod"],
         *,
-        current_code: str | None,
-        current_name: str | None,
         requested_code: str | None,
         requested_name: str | None,
-        assign_port: Callable[[Port | None], None],
-        port_label: str,
     ) -> None:
         if requested_code is None and requested_name is None:
             return
 
+        current: Port | None = getattr(booking, attr_name)
+        current_code = current.code if current else None
+        current_name = current.name if current else None
+
         code_value = current_code if requested_code is None else requested_code.strip()
         name_value = current_name if requested_name is None else requested_name.strip()
 
         if not code_value:
             if name_value:
+                port_label = attr_name.upper()
                 raise ValueError(f"{port_label} code is required when setting {port_label} name")
-            assign_port(None)
+            setattr(booking, attr_name, None)
             return
 
-        assign_port(Port(code=code_value.upper(), name=name_value or code_value.upper()))
+        setattr(
+            booking, attr_name, Port(code=code_value.upper(), name=name_value or code_value.upper())
+        )
@@ -2,12 +2,12 @@
 
 from decimal import Decimal
 from io import BytesIO
-
-from openpyxl import Workbook
-from openpyxl.styles import Font
+from itertools import chain
 
 from backend.ports.output.repositories import BookingRepository, CompanyRepository
 
+_DEFAULT_COMMISSION_RATE = Decimal("0.50")
+
 
 class ExportBookingUseCase:
     """Export booking detail and charges as an XLSX file."""
@@ -22,17 +22,24 @@ class ExportBookingUseCase:
 
     def execute(self, bl_reference: str) -> bytes:
         """Generate XLSX bytes for the requested booking."""
+        # openpyxl takes ~0.1s to import; load it on first export, not at startup
+        from openpyxl import Workbook
+        from openpyxl.cell import Cell
+        from openpyxl.styles import Font
+
         booking = self.booking_repo.find_by_id(bl_reference)
         if booking is None:
             raise ValueError(f"Booking '{bl_reference}' not found")
 
         company = self.company_repo.get()
-        commission_rate = company.agent_commission_rate if company else Decimal("0.50")
+        commission_rate = company.agent_commission_rate if company else _DEFAULT_COMMISSION_RATE
 
         workbook = Workbook()
         sheet = workbook.active
         assert sheet is not None
         sheet.title = "Booking Export"
+        # Cells are styled as they are built, so no second pass walks the sheet
+        bold = Font(bold=True)
 
         header_rows = [
             ("Booking ID", booking.id),
@@ -51,52 +58,36 @@ class ExportBookingUseCase:
             ),
         ]
         for label, value in header_rows:
-            sheet.append([label, value])
-        for row in sheet.iter_rows(min_row=1, max_row=len(header_rows), min_col=1, max_col=1):
-            row[0].font = Font(bold=True)
+            label_cell = Cell(sheet, value=label)
+            label_cell.font = bold
+            sheet.append([label_cell, value])
 
-        start_row = len(header_rows) + 3
-        sheet.cell(row=start_row, column=1, value="Type")
-        sheet.cell(row=start_row, column=2, value="Category")
-        sheet.cell(row=start_row, column=3, value="Description")
-        sheet.cell(row=start_row, column=4, value="Container")
-        sheet.cell(row=start_row, column=5, value="Amount")
-        for column in range(1, 6):
-            sheet.cell(row=start_row, column=column).font = Font(bold=True)
+        # Two blank rows between the summary and the charges table
+        sheet.append([])
+        sheet.append([])
+        column_cells = []
+        for title in ("Type", "Category", "Description", "Container", "Amount"):
+            column_cell = Cell(sheet, value=title)
+            column_cell.font = bold
+            column_cells.append(column_cell)
+        sheet.append(column_cells)
 
-        current_row = start_row + 1
-        for charge in booking.revenue_charges:
+        charges = chain(
+            (("REVENUE", charge) for charge in booking.revenue_charges),
+            (("COST", charge) for charge in booking.cost_charges),
+        )
+        for charge_type, charge in charges:
+            amount_cell = Cell(sheet, value=float(charge.amount.amount))
+            amount_cell.number_format = "#,##0.00"
             sheet.append(
                 [
-                    "REVENUE",
+                    charge_type,
                     charge.charge_category.value,
                     charge.description,
                     charge.container or "",
-                    float(charge.amount.amount),
+                    amount_cell,
                 ]
             )
-            current_row += 1
-        for charge in booking.cost_charges:
-            sheet.append(
-                [
-                    "COST",
-                    charge.charge_category.value,
-                    charge.description,
-                    charge.container or "",
-                    float(charge.amount.amount),
-                ]
-            )
-            current_row += 1
-
-        for row in sheet.iter_rows(
-            min_row=start_row + 1,
-            max_row=max(current_row - 1, start_row + 1),
-            min_col=5,
-            max_col=5,
-        ):
-            for cell in row:
-                if cell.value is not None:
-                    cell.number_format = "#,##0.00"
 
         buffer = BytesIO()
         workbook.save(buffer)
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import importlib.metadata
 import json
+import os
 import platform
+import re
 import zipfile
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from backend.application.dtos import DiagnosticsExportResponse
 from backend.config import get_settings
@@ -26,6 +28,12 @@ from backend.ports.output.repositories import (
 MAX_LOG_FILES = 5
 MAX_BYTES_PER_LOG_FILE = 2 * 1024 * 1024
 MAX_ERROR_LINES = 50
+# DEFLATE level for the bundle; logs are repetitive text, so level 3 keeps most of
+# the default level's ratio at about half its compression time
+ZIP_COMPRESS_LEVEL = 3
+
+# Cheap gate for lines that may be ERROR records; only matches are parsed as JSON
+_ERROR_LEVEL_PATTERN = re.compile(r'"level"\s*:\s*"error"', re.IGNORECASE)
 
 
 class ExportDiagnosticsUseCase:
@@ -42,6 +50,7 @@ class ExportDiagnosticsUseCase:
         *,
         primary_log_dir: Path | None = None,
         diagnostics_output_dir: Path | None = None,
+        compress_level: int = ZIP_COMPRESS_LEVEL,
     ) -> None:
         self.settings_repo = settings_repo
         self.booking_repo = booking_repo
@@ -51,6 +60,7 @@ class ExportDiagnosticsUseCase:
         self.provider_repo = provider_repo
         self.primary_log_dir = primary_log_dir
         self.diagnostics_output_dir = diagnostics_output_dir
+        self.compress_level = compress_level
 
     def execute(self) -> DiagnosticsExportResponse:
         """Export diagnostics into a zip file and return its location."""
@@ -63,24 +73,29 @@ class ExportDiagnosticsUseCase:
 
         warnings: list[str] = []
         truncation_notes: list[str] = []
-        collected_logs: list[tuple[str, str]] = []
+        error_lines: list[tuple[str, str]] = []
 
         log_files = self._collect_recent_log_files()
         if not log_files:
             warnings.append("No log files were found; exported bundle contains metadata only.")
 
-        with zipfile.ZipFile(bundle_path, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        with zipfile.ZipFile(
+            bundle_path,
+            mode="w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=self.compress_level,
+        ) as archive:
             for log_path in log_files:
                 try:
-                    sanitized_content, was_truncated = self._read_sanitized_log_tail(
+                    raw_text, was_truncated = self._read_log_tail(
                         log_path, max_bytes=MAX_BYTES_PER_LOG_FILE
                     )
                 except OSError:
                     warnings.append(f"Could not read log file: {log_path.name}")
                     continue
 
-                collected_logs.append((log_path.name, sanitized_content))
-                archive.writestr(f"logs/{log_path.name}", sanitized_content)
+                with archive.open(f"logs/{log_path.name}", mode="w") as member:
+                    self._write_sanitized_log(member, log_path.name, raw_text, error_lines)
 
                 if was_truncated:
                     truncation_notes.append(
@@ -107,7 +122,7 @@ class ExportDiagnosticsUseCase:
             )
             archive.writestr(
                 "error-report.txt",
-                self._build_error_report(collected_logs),
+                self._build_error_report(error_lines),
             )
 
         if truncation_notes:
@@ -156,10 +171,10 @@ class ExportDiagnosticsUseCase:
             return self.diagnostics_output_dir
         return get_settings().diagnostics_path
 
-    def _read_sanitized_log_tail(self, log_path: Path, *, max_bytes: int) -> tuple[str, bool]:
-        with log_path.open("rb") as handle:
-            handle.seek(0, 2)
-            file_size = handle.tell()
+    def _read_log_tail(self, log_path: Path, *, max_bytes: int) -> tuple[str, bool]:
+        # One bulk read of the tail: unbuffered, sized from fstat instead of seeking to the end
+        with log_path.open("rb", buffering=0) as handle:
+            file_size = os.fstat(handle.fileno()).st_size
             start = max(file_size - max_bytes, 0)
             handle.seek(start)
             chunk = handle.read()
@@ -170,9 +185,24 @@ class ExportDiagnosticsUseCase:
             if first_newline >= 0:
                 chunk = chunk[first_newline + 1 :]
 
-        raw_text = chunk.decode("utf-8", errors="replace")
-        sanitized_lines = [sanitize_log_line(line) for line in raw_text.splitlines()]
-        return "\n".join(sanitized_lines), was_truncated
+        return chunk.decode("utf-8", errors="replace"), was_truncated
+
+    def _write_sanitized_log(
+        self,
+        member: IO[bytes],
+        filename: str,
+        raw_text: str,
+        error_lines: list[tuple[str, str]],
+    ) -> None:
+        # Sanitized lines go straight into the archive member instead of being joined
+        # in memory; only candidate ERROR lines are kept for the error report
+        separator = b""
+        for line in raw_text.splitlines():
+            sanitized = sanitize_log_line(line)
+            member.write(separator + sanitized.encode("utf-8"))
+            separator = b"\n"
+            if _ERROR_LEVEL_PATTERN.search(sanitized):
+                error_lines.append((filename, sanitized))
 
     def _build_app_info(self) -> dict[str, Any]:
         app_settings = get_settings()
@@ -223,33 +253,32 @@ class ExportDiagnosticsUseCase:
         }
         return sanitize_for_logging(db_stats)
 
-    def _build_error_report(self, collected_logs: list[tuple[str, str]]) -> str:
+    def _build_error_report(self, error_lines: list[tuple[str, str]]) -> str:
         extracted: list[str] = []
 
-        for filename, log_text in collected_logs:
-            for line in log_text.splitlines():
-                parsed = self._safe_parse_json(line)
-                if not parsed:
-                    continue
+        for filename, line in error_lines:
+            parsed = self._safe_parse_json(line)
+            if not parsed:
+                continue
 
-                level = str(parsed.get("level", "")).upper()
-                if level != "ERROR":
-                    continue
+            level = str(parsed.get("level", "")).upper()
+            if level != "ERROR":
+                continue
 
-                timestamp = str(parsed.get("timestamp", ""))
-                component = str(parsed.get("component", ""))
-                message = str(parsed.get("message", ""))
-                context = parsed.get("context")
-                exception_text = ""
-                if isinstance(context, dict):
-                    raw_exception = context.get("exception")
-                    if isinstance(raw_exception, str):
-                        exception_text = raw_exception.strip()
-
-                entry = f"{timestamp} | {component} | {message} | source={filename}"
-                if exception_text:
-                    entry = f"{entry}\n{exception_text}"
-                extracted.append(entry)
+            timestamp = str(parsed.get("timestamp", ""))
+            component = str(parsed.get("component", ""))
+            message = str(parsed.get("message", ""))
+            context = parsed.get("context")
+            exception_text = ""
+            if isinstance(context, dict):
+                raw_exception = context.get("exception")
+                if isinstance(raw_exception, str):
+                    exception_text = raw_exception.strip()
+
+            entry = f"{timestamp} | {component} | {message} | source={filename}"
+            if exception_text:
+                entry = f"{entry}\n{exception_text}"
+            extracted.append(entry)
 
         if not extracted:
             return "No ERROR entries found in selected logs."
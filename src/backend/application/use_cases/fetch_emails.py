@@ -17,6 +17,7 @@ from backend.ports.output.email_client import (
     EmailRateLimitError,
 )
 from backend.ports.output.repositories import DocumentRepository, SettingsRepository
+from backend.ports.output.unit_of_work import UnitOfWork
 
 
 class FetchEmailsUseCase:
@@ -28,11 +29,13 @@ class FetchEmailsUseCase:
         settings_repo: SettingsRepository,
         email_client: EmailClient,
         storage_root: Path,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.document_repo = document_repo
         self.settings_repo = settings_repo
         self.email_client = email_client
         self.storage_root = storage_root
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: FetchEmailsRequest) -> FetchEmailsResponse:
         """Execute the fetch emails workflow."""
@@ -56,7 +59,8 @@ class FetchEmailsUseCase:
         except EmailClientError as exc:
             raise ValueError(f"Could not fetch Outlook emails: {exc}") from exc
 
-        imported_documents = 0
+        new_documents: list[Document] = []
+        seen_hashes: set[str] = set()
         duplicate_documents = 0
         pdf_attachments_found = 0
 
@@ -67,10 +71,13 @@ class FetchEmailsUseCase:
                     hashlib.sha256(attachment.content).hexdigest()
                 )
 
-                existing = self.document_repo.find_by_file_hash(file_hash)
-                if existing is not None:
+                if file_hash.value in seen_hashes:
                     duplicate_documents += 1
                     continue
+                if self.document_repo.exists_by_file_hash(file_hash):
+                    duplicate_documents += 1
+                    continue
+                seen_hashes.add(file_hash.value)
 
                 stored_path = self._store_attachment(
                     filename=attachment.filename,
@@ -88,13 +95,16 @@ class FetchEmailsUseCase:
                     ),
                     storage_path=str(stored_path),
                 )
-                self.document_repo.save(document)
-                imported_documents += 1
+                new_documents.append(document)
+
+        # Persist the whole fetch as one batch instead of a commit per attachment
+        self.document_repo.save_many(new_documents)
+        self.unit_of_work.commit()
 
         return FetchEmailsResponse(
             scanned_messages=len(messages),
             pdf_attachments_found=pdf_attachments_found,
-            imported_documents=imported_documents,
+            imported_documents=len(new_documents),
             duplicate_documents=duplicate_documents,
         )
 
@@ -18,6 +18,10 @@ from backend.ports.output.repositories import (
     CompanyRepository,
 )
 
+# Totals keep two decimal places even when there are no rows to sum
+_ZERO = Decimal("0.00")
+_DEFAULT_COMMISSION_RATE = Decimal("0.50")
+
 
 class GenerateCommissionReportUseCase:
     """Generate commission report rows and totals."""
@@ -32,43 +36,55 @@ class GenerateCommissionReportUseCase:
 
     def execute(self, request: CommissionReportRequest) -> CommissionReportResponse:
         """Build report data from bookings filtered by date and status."""
-        self._validate_dates(request.date_from, request.date_to)
+        date_from, date_to = self._parse_dates(request.date_from, request.date_to)
 
         status = self._parse_status(request.status)
         filters = BookingFilters(
             status=status,
-            date_from=request.date_from,
-            date_to=request.date_to,
+            date_from=date_from,
+            date_to=date_to,
         )
         sort = BookingSort(field="created_at", descending=False)
         bookings = self.booking_repo.list_all(filters=filters, sort=sort)
         bookings = self._apply_extended_filters(bookings, request)
 
         company = self.company_repo.get()
-        commission_rate = company.agent_commission_rate if company else Decimal("0.50")
-
-        rows = [
-            CommissionReportItem(
-                booking_id=booking.id,
-                client_name=booking.client.name if booking.client else None,
-                created_at=booking.created_at,
-                status=booking.status.value,
-                total_revenue=booking.total_revenue.amount,
-                total_costs=booking.total_costs.amount,
-                margin=booking.margin.amount,
-                commission=booking.calculate_agent_commission(commission_rate).amount,
+        commission_rate = company.agent_commission_rate if company else _DEFAULT_COMMISSION_RATE
+
+        # One pass: each charge list is summed once per booking, margin and commission
+        # derive from those sums, and the report totals accumulate alongside the rows
+        rows: list[CommissionReportItem] = []
+        total_revenue = total_costs = total_margin = total_commission = _ZERO
+        for booking in bookings:
+            revenue = booking.total_revenue
+            costs = booking.total_costs
+            margin = revenue - costs
+            commission = margin * commission_rate
+            rows.append(
+                CommissionReportItem(
+                    booking_id=booking.id,
+                    client_name=booking.client.name if booking.client else None,
+                    created_at=booking.created_at,
+                    status=booking.status.value,
+                    total_revenue=revenue.amount,
+                    total_costs=costs.amount,
+                    margin=margin.amount,
+                    commission=commission.amount,
+                )
             )
-            for booking in bookings
-        ]
+            total_revenue += revenue.amount
+            total_costs += costs.amount
+            total_margin += margin.amount
+            total_commission += commission.amount
 
         totals = CommissionReportTotals(
             booking_count=len(rows),
-            total_revenue=sum((row.total_revenue for row in rows), Decimal("0.00")),
-            total_costs=sum((row.total_costs for row in rows), Decimal("0.00")),
-            total_margin=sum((row.margin for row in rows), Decimal("0.00")),
-            total_commission=sum((row.commission for row in rows), Decimal("0.00")),
+            total_revenue=total_revenue,
+            total_costs=total_costs,
+            total_margin=total_margin,
+            total_commission=total_commission,
         )
-        return CommissionReportResponse(items=rows, totals=totals)
+        return CommissionReportResponse(items=tuple(rows), totals=totals)
 
     def _apply_extended_filters(
         self,
@@ -105,11 +121,12 @@ class GenerateCommissionReportUseCase:
             raise ValueError(f"Invalid status: {status}") from exc
 
     @staticmethod
-    def _validate_dates(date_from: str | None, date_to: str | None) -> None:
+    def _parse_dates(date_from: str | None, date_to: str | None) -> tuple[date | None, date | None]:
         parsed_from = date.fromisoformat(date_from) if date_from else None
         parsed_to = date.fromisoformat(date_to) if date_to else None
         if parsed_from and parsed_to and parsed_from > parsed_to:
             raise ValueError("date_from cannot be greater than date_to")
+        return parsed_from, parsed_to
 
     @staticmethod
     def _parse_invoice_type(invoice_type: str | None) -> str | None:
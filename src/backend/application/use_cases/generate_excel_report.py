@@ -2,9 +2,6 @@
 
 from io import BytesIO
 
-from openpyxl import Workbook
-from openpyxl.styles import Font
-
 from backend.application.dtos import CommissionReportRequest
 from backend.application.use_cases.generate_commission_report import (
     GenerateCommissionReportUseCase,
@@ -19,6 +16,10 @@ class GenerateExcelReportUseCase:
 
     def execute(self, request: CommissionReportRequest) -> bytes:
         """Return XLSX bytes for commission report data."""
+        # Deferred like the booking export: openpyxl is only needed once an export runs
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
         report = self.commission_report_use_case.execute(request)
 
         workbook = Workbook()
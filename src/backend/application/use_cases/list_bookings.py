@@ -4,7 +4,12 @@ from decimal import Decimal
 
 from backend.application.dtos import BookingListItem, ListBookingsRequest
 from backend.domain.enums import BookingStatus
-from backend.ports.output.repositories import BookingFilters, BookingRepository, BookingSort
+from backend.ports.output.repositories import (
+    BookingFilters,
+    BookingListRow,
+    BookingRepository,
+    BookingSort,
+)
 
 
 class ListBookingsUseCase:
@@ -36,44 +41,34 @@ class ListBookingsUseCase:
             descending=request.descending,
         )
 
-        # Query bookings
-        bookings = self.booking_repo.list_all(filters=filters, sort=sort)
+        # Query flat list rows; the list view never needs the full aggregate
+        rows = self.booking_repo.list_rows(filters=filters, sort=sort)
 
         if request.client is not None:
             normalized_client = request.client.strip().lower()
             if normalized_client:
-                bookings = [
-                    booking
-                    for booking in bookings
-                    if booking.client is not None
-                    and normalized_client in booking.client.name.lower()
+                rows = [
+                    row
+                    for row in rows
+                    if row.client_name is not None and normalized_client in row.client_name.lower()
                 ]
 
-        # Convert to DTOs
-        items = [
-            BookingListItem(
-                id=booking.id,
-                client_name=booking.client.name if booking.client else None,
-                pol_code=booking.pol.code if booking.pol else None,
-                pod_code=booking.pod.code if booking.pod else None,
-                created_at=booking.created_at,
-                status=booking.status.value,
-                total_revenue=booking.total_revenue.amount,
-                total_costs=booking.total_costs.amount,
-                margin=booking.margin.amount,
-                commission=booking.calculate_agent_commission(self.commission_rate).amount,
-                document_count=len(booking.revenue_charges) + len(booking.cost_charges),
-            )
-            for booking in bookings
-        ]
+        # Rows arrive in the requested order; the repository sorts in SQL
+        return [self._to_item(row) for row in rows]
 
-        sort_fields = {
-            "created_at": lambda item: item.created_at,
-            "margin": lambda item: item.margin,
-            "commission": lambda item: item.commission,
-        }
-        sort_key = sort_fields.get(request.sort_by)
-        if sort_key is not None:
-            items.sort(key=sort_key, reverse=request.descending)
-
-        return items
+    def _to_item(self, row: BookingListRow) -> BookingListItem:
+        """Build a list item, deriving margin and commission from the totals."""
+        margin = row.total_revenue - row.total_costs
+        return BookingListItem(
+            id=row.id,
+            client_name=row.client_name,
+            pol_code=row.pol_code,
+            pod_code=row.pod_code,
+            created_at=row.created_at,
+            status=row.status.value,
+            total_revenue=row.total_revenue.amount,
+            total_costs=row.total_costs.amount,
+            margin=margin.amount,
+            commission=(margin * self.commission_rate).amount,
+            document_count=row.charge_count,
+        )
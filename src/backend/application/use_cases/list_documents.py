@@ -1,14 +1,13 @@
 """Use case for listing documents."""
 
-from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
 from backend.application.dtos import DocumentListItem, ListDocumentsRequest
-from backend.domain.entities.document import Document
 from backend.domain.enums import DocumentType, ProcessingStatus
 from backend.ports.output.repositories import (
     ClientRepository,
+    DocumentListRow,
     DocumentRepository,
     InvoiceRepository,
     ProviderRepository,
@@ -32,10 +31,15 @@ class ListDocumentsUseCase:
 
     def execute(self, request: ListDocumentsRequest) -> list[DocumentListItem]:
         """Execute the use case."""
-        date_from = self._parse_date(request.date_from, field_name="date_from")
-        date_to = self._parse_date(request.date_to, field_name="date_to")
+        date_from = request.date_from
+        date_to = request.date_to
         if date_from and date_to and date_from > date_to:
             raise ValueError("date_from cannot be greater than date_to")
+        if (request.cursor is None) != (request.cursor_id is None):
+            raise ValueError("cursor and cursor_id must be provided together")
+        if request.cursor is not None and request.cursor.tzinfo is not None:
+            # created_at is stored as naive local time, as returned in next_cursor
+            raise ValueError("cursor must not carry a time zone")
 
         requested_document_type: DocumentType | None = None
         if request.document_type:
@@ -47,12 +51,23 @@ class ListDocumentsUseCase:
         party_filter = (request.party or "").strip().lower()
         booking_filter = (request.booking or "").strip().lower()
 
+        # Rows arrive newest first from the repository
         documents = self._get_documents(request.status)
-        documents = sorted(documents, key=lambda doc: doc.created_at, reverse=True)
         email_pdf_counts = self._build_email_pdf_counts(documents)
 
+        # Rows up to and including the cursor were served on earlier pages;
+        # they still count towards each email's PDF total above
+        cursor = (
+            (request.cursor, request.cursor_id)
+            if request.cursor is not None and request.cursor_id is not None
+            else None
+        )
+
         items: list[DocumentListItem] = []
         for doc in documents:
+            if cursor and (doc.created_at, doc.id) >= cursor:
+                continue
+
             if requested_document_type and doc.document_type != requested_document_type:
                 continue
 
@@ -85,20 +100,20 @@ class ListDocumentsUseCase:
                     document_type=doc.document_type.value if doc.document_type else None,
                     created_at=doc.created_at,
                     processed_at=doc.processed_at,
-                    email_sender=doc.email_reference.sender if doc.email_reference else None,
-                    email_subject=doc.email_reference.subject if doc.email_reference else None,
+                    email_sender=doc.email_sender,
+                    email_subject=doc.email_subject,
                     pdf_count_in_email=(
-                        email_pdf_counts.get(doc.email_reference.message_id, 1)
-                        if doc.email_reference is not None
+                        email_pdf_counts.get(doc.email_message_id, 1)
+                        if doc.email_message_id is not None
                         else None
                     ),
-                    error_message=doc.error_info.error_message if doc.error_info else None,
-                    error_retryable=doc.error_info.is_retryable if doc.error_info else None,
+                    error_message=doc.error_message,
+                    error_retryable=doc.error_retryable,
                     invoice_number=invoice_number,
                     party_name=party_name,
                     booking_references=booking_references,
                     total_amount=total_amount,
-                    file_url=f"/api/documents/{doc.id}/file" if doc.storage_path else None,
+                    file_url=f"/api/documents/{doc.id}/file" if doc.has_file else None,
                     manually_edited_fields=manually_edited_fields,
                 )
             )
@@ -108,48 +123,45 @@ class ListDocumentsUseCase:
 
         return items
 
-    def _get_documents(self, status: str | None) -> list[Document]:
+    def _get_documents(self, status: str | None) -> list[DocumentListRow]:
         if status:
             try:
                 target_status = ProcessingStatus[status.upper()]
             except KeyError:
                 raise ValueError(f"Invalid status: {status}") from None
-            return self.document_repo.list_by_status(target_status)
+            return self.document_repo.list_rows(target_status)
 
-        documents = []
-        for current_status in ProcessingStatus:
-            documents.extend(self.document_repo.list_by_status(current_status))
-        return documents
+        return self.document_repo.list_rows()
 
     @staticmethod
-    def _build_email_pdf_counts(documents: list[Document]) -> dict[str, int]:
+    def _build_email_pdf_counts(documents: list[DocumentListRow]) -> dict[str, int]:
         counts: dict[str, int] = {}
         for document in documents:
-            email_reference = document.email_reference
-            if email_reference is None:
+            message_id = document.email_message_id
+            if message_id is None:
                 continue
-            counts[email_reference.message_id] = (
-                counts.get(email_reference.message_id, 0) + 1
-            )
+            counts[message_id] = counts.get(message_id, 0) + 1
         return counts
 
     def _get_metadata(
         self,
-        document: Document,
-    ) -> tuple[str | None, str | None, list[str], Decimal | None, list[str]]:
+        document: DocumentListRow,
+    ) -> tuple[str | None, str | None, list[str], Decimal | None, tuple[str, ...]]:
         if document.invoice_id is None:
-            return None, None, [], None, []
+            return None, None, [], None, ()
 
         invoice_id: UUID = document.invoice_id
         if document.document_type == DocumentType.CLIENT_INVOICE:
             client_invoice = self.invoice_repo.find_client_invoice_by_id(invoice_id)
             if client_invoice is None:
-                return None, None, [], None, []
+                return None, None, [], None, ()
             client = self.client_repo.find_by_id(client_invoice.client_id)
             party_name = client.name if client is not None else None
-            manually_edited_fields = list(
+            manually_edited_fields = (
                 client_invoice.extraction_metadata.manually_edited_fields
-            ) if client_invoice.extraction_metadata is not None else []
+                if client_invoice.extraction_metadata is not None
+                else ()
+            )
             return (
                 client_invoice.invoice_number,
                 party_name,
@@ -161,12 +173,14 @@ class ListDocumentsUseCase:
         if document.document_type == DocumentType.PROVIDER_INVOICE:
             provider_invoice = self.invoice_repo.find_provider_invoice_by_id(invoice_id)
             if provider_invoice is None:
-                return None, None, [], None, []
+                return None, None, [], None, ()
             provider = self.provider_repo.find_by_id(provider_invoice.provider_id)
             party_name = provider.name if provider is not None else None
-            manually_edited_fields = list(
+            manually_edited_fields = (
                 provider_invoice.extraction_metadata.manually_edited_fields
-            ) if provider_invoice.extraction_metadata is not None else []
+                if provider_invoice.extraction_metadata is not None
+                else ()
+            )
             return (
                 provider_invoice.invoice_number,
                 party_name,
@@ -175,13 +189,4 @@ class ListDocumentsUseCase:
                 manually_edited_fields,
             )
 
-        return None, None, [], None, []
-
-    @staticmethod
-    def _parse_date(value: str | None, field_name: str) -> date | None:
-        if value is None or not value.strip():
-            return None
-        try:
-            return date.fromisoformat(value)
-        except ValueError as exc:
-            raise ValueError(f"Invalid {field_name}: {value}") from exc
+        return None, None, [], None, ()
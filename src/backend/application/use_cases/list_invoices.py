@@ -1,105 +1,76 @@
 """Use case for listing and searching persisted invoices."""
 
-from datetime import date
-
 from backend.application.dtos import InvoiceListItem, ListInvoicesRequest
-from backend.ports.output.repositories import (
-    ClientRepository,
-    InvoiceFilters,
-    InvoiceRepository,
-    ProviderRepository,
-)
+from backend.ports.output.repositories import InvoiceFilters, InvoiceListRow, InvoiceRepository
 
 
 class ListInvoicesUseCase:
     """List invoices with optional search filters."""
 
-    def __init__(
-        self,
-        invoice_repo: InvoiceRepository,
-        client_repo: ClientRepository,
-        provider_repo: ProviderRepository,
-    ) -> None:
+    def __init__(self, invoice_repo: InvoiceRepository) -> None:
         self.invoice_repo = invoice_repo
-        self.client_repo = client_repo
-        self.provider_repo = provider_repo
 
     def execute(self, request: ListInvoicesRequest) -> list[InvoiceListItem]:
         """Execute invoice search over client and provider invoices."""
-        date_from = self._parse_date(request.date_from, "date_from")
-        date_to = self._parse_date(request.date_to, "date_to")
+        date_from = request.date_from
+        date_to = request.date_to
         if date_from and date_to and date_from > date_to:
             raise ValueError("date_from cannot be greater than date_to")
+        if (request.cursor is None) != (request.cursor_id is None):
+            raise ValueError("cursor and cursor_id must be provided together")
 
         invoice_type = self._normalize_invoice_type(request.invoice_type)
         invoice_number_filter = (request.invoice_number or "").strip().lower()
         party_filter = (request.party or "").strip().lower()
 
+        # Later pages never reach past the cursor date, so let SQL bound the range
+        if request.cursor is not None and (date_to is None or request.cursor < date_to):
+            date_to = request.cursor
+
         repo_filters = InvoiceFilters(
-            date_from=date_from.isoformat() if date_from else None,
-            date_to=date_to.isoformat() if date_to else None,
+            date_from=date_from,
+            date_to=date_to,
         )
 
-        items: list[InvoiceListItem] = []
-
+        # Flat rows carry the party name already, so no per-invoice party lookups
+        rows: list[InvoiceListRow] = []
         if invoice_type in (None, "CLIENT_INVOICE"):
-            for client_invoice in self.invoice_repo.list_client_invoices(repo_filters):
-                if (
-                    invoice_number_filter
-                    and invoice_number_filter not in client_invoice.invoice_number.lower()
-                ):
-                    continue
-                client = self.client_repo.find_by_id(client_invoice.client_id)
-                party_name = client.name if client else None
-                if party_filter and party_filter not in (party_name or "").lower():
-                    continue
-                items.append(
-                    InvoiceListItem(
-                        id=client_invoice.id,
-                        invoice_type="CLIENT_INVOICE",
-                        invoice_number=client_invoice.invoice_number,
-                        invoice_date=client_invoice.invoice_date,
-                        party_name=party_name,
-                        booking_references=[client_invoice.bl_reference],
-                        total_amount=client_invoice.total_amount.amount,
-                    )
-                )
-
+            rows.extend(self.invoice_repo.list_client_invoice_rows(repo_filters))
         if invoice_type in (None, "PROVIDER_INVOICE"):
-            for provider_invoice in self.invoice_repo.list_provider_invoices(repo_filters):
-                if (
-                    invoice_number_filter
-                    and invoice_number_filter not in provider_invoice.invoice_number.lower()
-                ):
-                    continue
-                provider = self.provider_repo.find_by_id(provider_invoice.provider_id)
-                party_name = provider.name if provider else None
-                if party_filter and party_filter not in (party_name or "").lower():
-                    continue
-                items.append(
-                    InvoiceListItem(
-                        id=provider_invoice.id,
-                        invoice_type="PROVIDER_INVOICE",
-                        invoice_number=provider_invoice.invoice_number,
-                        invoice_date=provider_invoice.invoice_date,
-                        party_name=party_name,
-                        booking_references=list(provider_invoice.bl_references),
-                        total_amount=provider_invoice.total_amount.amount,
-                    )
+            rows.extend(self.invoice_repo.list_provider_invoice_rows(repo_filters))
+
+        cursor = (
+            (request.cursor, request.cursor_id)
+            if request.cursor is not None and request.cursor_id is not None
+            else None
+        )
+
+        items: list[InvoiceListItem] = []
+        for row in rows:
+            if cursor and (row.invoice_date, row.id) >= cursor:
+                continue
+            if invoice_number_filter and invoice_number_filter not in row.invoice_number.lower():
+                continue
+            if party_filter and party_filter not in (row.party_name or "").lower():
+                continue
+            items.append(
+                InvoiceListItem(
+                    id=row.id,
+                    invoice_type=row.invoice_type.value,
+                    invoice_number=row.invoice_number,
+                    invoice_date=row.invoice_date,
+                    party_name=row.party_name,
+                    booking_references=list(row.bl_references),
+                    total_amount=row.total_amount.amount,
+                    charge_count=row.charge_count,
+                    charges_total=row.charges_total.amount,
                 )
+            )
 
-        items.sort(key=lambda item: item.invoice_date, reverse=True)
+        # Invoice id breaks date ties so cursor pages neither skip nor repeat rows
+        items.sort(key=lambda item: (item.invoice_date, item.id), reverse=True)
         return items[: request.limit]
 
-    @staticmethod
-    def _parse_date(value: str | None, field_name: str) -> date | None:
-        if value is None or not value.strip():
-            return None
-        try:
-            return date.fromisoformat(value)
-        except ValueError as exc:
-            raise ValueError(f"Invalid {field_name}: {value}") from exc
-
     @staticmethod
     def _normalize_invoice_type(value: str | None) -> str | None:
         if value is None or not value.strip():
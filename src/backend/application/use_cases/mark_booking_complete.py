@@ -1,13 +1,15 @@
 """Use case for changing booking completion status."""
 
 from backend.ports.output.repositories import BookingRepository
+from backend.ports.output.unit_of_work import UnitOfWork
 
 
 class MarkBookingCompleteUseCase:
     """Toggle booking status between PENDING and COMPLETE."""
 
-    def __init__(self, booking_repo: BookingRepository) -> None:
+    def __init__(self, booking_repo: BookingRepository, unit_of_work: UnitOfWork) -> None:
         self.booking_repo = booking_repo
+        self.unit_of_work = unit_of_work
 
     def mark_complete(self, bl_reference: str) -> None:
         """Mark a booking as complete."""
@@ -16,6 +18,7 @@ class MarkBookingCompleteUseCase:
             raise ValueError(f"Booking '{bl_reference}' not found")
         booking.mark_complete()
         self.booking_repo.update(booking)
+        self.unit_of_work.commit()
 
     def revert_to_pending(self, bl_reference: str) -> None:
         """Revert a completed booking back to pending."""
@@ -24,3 +27,4 @@ class MarkBookingCompleteUseCase:
             raise ValueError(f"Booking '{bl_reference}' not found")
         booking.revert_to_pending()
         self.booking_repo.update(booking)
+        self.unit_of_work.commit()
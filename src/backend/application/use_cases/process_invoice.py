@@ -31,6 +31,7 @@ from backend.ports.output.repositories import (
     DocumentRepository,
     SettingsRepository,
 )
+from backend.ports.output.unit_of_work import UnitOfWork
 
 logger = logging.getLogger(__name__)
 
@@ -52,11 +53,13 @@ class ProcessInvoiceUseCase:
         settings_repo: SettingsRepository,
         company_repo: CompanyRepository,
         ai_extractor: AIExtractor,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.document_repo = document_repo
         self.settings_repo = settings_repo
         self.company_repo = company_repo
         self.ai_extractor = ai_extractor
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: ProcessInvoiceRequest) -> ProcessInvoiceResponse:
         """Execute the process invoice use case.
@@ -96,6 +99,8 @@ class ProcessInvoiceUseCase:
         # 3. Mark as processing
         document.start_processing(allow_reprocess=request.allow_processed)
         self.document_repo.update(document)
+        # Commit before the AI call so the write lock is not held while waiting
+        self.unit_of_work.commit()
 
         try:
             # 4. Read PDF content
@@ -175,13 +180,14 @@ class ProcessInvoiceUseCase:
                 field_statuses=field_statuses,
                 extraction_notes=result.extraction_notes,
                 overall_confidence=overall_confidence,
-                warnings=warnings,
-                errors=errors,
+                warnings=tuple(warnings),
+                errors=tuple(errors),
             )
 
         except AIAuthError as err:
             document.mark_error(ErrorInfo.api_key_invalid())
             self.document_repo.update(document)
+            self.unit_of_work.commit()
             raise ValueError(
                 "Gemini API key is invalid. Update it in Settings."
             ) from err
@@ -189,6 +195,7 @@ class ProcessInvoiceUseCase:
         except AITimeoutError as err:
             document.mark_error(ErrorInfo.ai_timeout())
             self.document_repo.update(document)
+            self.unit_of_work.commit()
             raise ValueError(
                 "AI processing timed out. Please retry."
             ) from err
@@ -196,6 +203,7 @@ class ProcessInvoiceUseCase:
         except AIRateLimitError as e:
             document.mark_error(ErrorInfo.ai_rate_limit(e.retry_after_minutes))
             self.document_repo.update(document)
+            self.unit_of_work.commit()
             raise ValueError(
                 f"AI rate limit reached. Try again in {e.retry_after_minutes} minutes."
             ) from e
@@ -208,6 +216,7 @@ class ProcessInvoiceUseCase:
                 )
             )
             self.document_repo.update(document)
+            self.unit_of_work.commit()
             raise ValueError(f"AI extraction failed: {e}") from e
 
     def _read_pdf(self, storage_path: str | None, filename: str) -> PDFContent:
@@ -19,6 +19,7 @@ from backend.adapters.persistence.repositories import (
     SqlAlchemyProviderRepository,
     SqlAlchemySettingsRepository,
 )
+from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from backend.application.use_cases import (
     ConfigureAgentUseCase,
     ConfigureCompanyUseCase,
@@ -50,6 +51,7 @@ from backend.ports.output.repositories import (
     ProviderRepository,
     SettingsRepository,
 )
+from backend.ports.output.unit_of_work import UnitOfWork
 
 _oauth_manager: OutlookOAuthManager | None = None
 
@@ -95,27 +97,35 @@ def get_invoice_repository(db: Annotated[Session, Depends(get_db)]) -> InvoiceRe
     return SqlAlchemyInvoiceRepository(db)
 
 
+def get_unit_of_work(db: Annotated[Session, Depends(get_db)]) -> UnitOfWork:
+    """Get unit of work bound to the request's database session."""
+    return SqlAlchemyUnitOfWork(db)
+
+
 # --- Use Case Dependencies ---
 
 
 def get_configure_company_use_case(
     company_repo: Annotated[CompanyRepository, Depends(get_company_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> ConfigureCompanyUseCase:
     """Get configure company use case instance."""
-    return ConfigureCompanyUseCase(company_repo)
+    return ConfigureCompanyUseCase(company_repo, unit_of_work)
 
 def get_configure_agent_use_case(
     agent_repo: Annotated[AgentRepository, Depends(get_agent_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> ConfigureAgentUseCase:
     """Get configure agent use case instance."""
-    return ConfigureAgentUseCase(agent_repo)
+    return ConfigureAgentUseCase(agent_repo, unit_of_work)
 
 
 def get_configure_settings_use_case(
     settings_repo: Annotated[SettingsRepository, Depends(get_settings_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> ConfigureSettingsUseCase:
     """Get configure settings use case instance."""
-    return ConfigureSettingsUseCase(settings_repo)
+    return ConfigureSettingsUseCase(settings_repo, unit_of_work)
 
 
 def get_export_diagnostics_use_case(
@@ -165,15 +175,9 @@ def get_list_bookings_use_case(
 
 def get_list_invoices_use_case(
     invoice_repo: Annotated[InvoiceRepository, Depends(get_invoice_repository)],
-    client_repo: Annotated[ClientRepository, Depends(get_client_repository)],
-    provider_repo: Annotated[ProviderRepository, Depends(get_provider_repository)],
 ) -> ListInvoicesUseCase:
     """Get list invoices use case instance."""
-    return ListInvoicesUseCase(
-        invoice_repo=invoice_repo,
-        client_repo=client_repo,
-        provider_repo=provider_repo,
-    )
+    return ListInvoicesUseCase(invoice_repo=invoice_repo)
 
 
 def get_view_booking_detail_use_case(
@@ -194,16 +198,18 @@ def get_view_booking_detail_use_case(
 
 def get_edit_booking_use_case(
     booking_repo: Annotated[BookingRepository, Depends(get_booking_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> EditBookingUseCase:
     """Get edit booking use case instance."""
-    return EditBookingUseCase(booking_repo)
+    return EditBookingUseCase(booking_repo, unit_of_work)
 
 
 def get_mark_booking_complete_use_case(
     booking_repo: Annotated[BookingRepository, Depends(get_booking_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> MarkBookingCompleteUseCase:
     """Get mark booking complete use case instance."""
-    return MarkBookingCompleteUseCase(booking_repo)
+    return MarkBookingCompleteUseCase(booking_repo, unit_of_work)
 
 
 def get_export_booking_use_case(
@@ -268,6 +274,7 @@ def get_process_invoice_use_case(
     settings_repo: Annotated[SettingsRepository, Depends(get_settings_repository)],
     company_repo: Annotated[CompanyRepository, Depends(get_company_repository)],
     ai_extractor: Annotated[AIExtractor, Depends(get_ai_extractor)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> ProcessInvoiceUseCase:
     """Get process invoice use case instance."""
     return ProcessInvoiceUseCase(
@@ -275,6 +282,7 @@ def get_process_invoice_use_case(
         settings_repo=settings_repo,
         company_repo=company_repo,
         ai_extractor=ai_extractor,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -282,6 +290,7 @@ def get_fetch_emails_use_case(
     document_repo: Annotated[DocumentRepository, Depends(get_document_repository)],
     settings_repo: Annotated[SettingsRepository, Depends(get_settings_repository)],
     email_client: Annotated[EmailClient, Depends(get_email_client)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> FetchEmailsUseCase:
     """Get fetch emails use case instance."""
     app_settings = get_settings()
@@ -290,6 +299,7 @@ def get_fetch_emails_use_case(
         settings_repo=settings_repo,
         email_client=email_client,
         storage_root=app_settings.storage_path,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -299,6 +309,7 @@ def get_confirm_invoice_use_case(
     invoice_repo: Annotated[InvoiceRepository, Depends(get_invoice_repository)],
     client_repo: Annotated[ClientRepository, Depends(get_client_repository)],
     provider_repo: Annotated[ProviderRepository, Depends(get_provider_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> ConfirmInvoiceUseCase:
     """Get confirm invoice use case instance."""
     return ConfirmInvoiceUseCase(
@@ -307,6 +318,7 @@ def get_confirm_invoice_use_case(
         invoice_repo=invoice_repo,
         client_repo=client_repo,
         provider_repo=provider_repo,
+        unit_of_work=unit_of_work,
     )
 
 
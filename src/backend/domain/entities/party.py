@@ -2,11 +2,13 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 from backend.domain.enums import ProviderType
 
 
+@lru_cache(maxsize=4096)
 def normalize_nif(nif: str) -> str:
     """Normalize NIF by removing spaces, dashes, and converting to uppercase."""
     return nif.replace(" ", "").replace("-", "").replace(".", "").upper()
@@ -1,7 +1,12 @@
 """AI Bookkeeper - FastAPI Backend Application."""
 
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import OperationalError
 
 from backend.adapters.api.exceptions import register_exception_handlers
 from backend.adapters.api.routes import (
@@ -12,15 +17,34 @@ from backend.adapters.api.routes import (
     outlook,
     reports,
 )
+from backend.adapters.persistence.database import SessionLocal
+from backend.adapters.persistence.repositories import SqlAlchemySettingsRepository
 from backend.config import get_settings
 from backend.config.logging import setup_logging
 
 setup_logging(get_settings())
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run one-shot data migrations before serving requests."""
+    try:
+        with SessionLocal() as db:
+            if SqlAlchemySettingsRepository(db).migrate_refresh_token():
+                db.commit()
+    except OperationalError:
+        # A database without the schema yet must not keep the app from booting
+        logger.exception("Skipping refresh token migration at startup")
+    yield
+
+
 app = FastAPI(
     title="AI Bookkeeper",
     description="AI-powered invoice processing for commercial agents",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS for local Tauri app
@@ -10,16 +10,20 @@ from backend.ports.output.email_client import (
 from backend.ports.output.repositories import (
     AgentRepository,
     BookingFilters,
+    BookingListRow,
     BookingRepository,
     BookingSort,
     ClientRepository,
     CompanyRepository,
+    DocumentListRow,
     DocumentRepository,
     InvoiceFilters,
+    InvoiceListRow,
     InvoiceRepository,
     ProviderRepository,
     SettingsRepository,
 )
+from backend.ports.output.unit_of_work import UnitOfWork
 
 __all__ = [
     "AgentRepository",
@@ -30,13 +34,17 @@ __all__ = [
     "EmailMessage",
     "EmailRateLimitError",
     "BookingFilters",
+    "BookingListRow",
     "BookingRepository",
     "BookingSort",
     "ClientRepository",
     "CompanyRepository",
+    "DocumentListRow",
     "DocumentRepository",
     "InvoiceFilters",
+    "InvoiceListRow",
     "InvoiceRepository",
     "ProviderRepository",
     "SettingsRepository",
+    "UnitOfWork",
 ]
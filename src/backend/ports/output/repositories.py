@@ -6,6 +6,7 @@ persistence, following the dependency inversion principle.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import date, datetime
 from uuid import UUID
 
 from backend.domain.entities.booking import Booking
@@ -13,8 +14,8 @@ from backend.domain.entities.configuration import Agent, Company, Settings
 from backend.domain.entities.document import Document
 from backend.domain.entities.invoice import ClientInvoice, ProviderInvoice
 from backend.domain.entities.party import Client, Provider
-from backend.domain.enums import BookingStatus, ProcessingStatus, ProviderType
-from backend.domain.value_objects import FileHash
+from backend.domain.enums import BookingStatus, DocumentType, ProcessingStatus, ProviderType
+from backend.domain.value_objects import FileHash, Money
 
 # --- Filter and Sort Data Classes ---
 
@@ -26,8 +27,8 @@ class BookingFilters:
     client_id: UUID | None = None
     booking: str | None = None
     status: BookingStatus | None = None
-    date_from: str | None = None  # ISO format date
-    date_to: str | None = None  # ISO format date
+    date_from: date | None = None
+    date_to: date | None = None
 
 
 @dataclass
@@ -45,8 +46,60 @@ class InvoiceFilters:
     client_id: UUID | None = None
     provider_id: UUID | None = None
     booking_id: str | None = None
-    date_from: str | None = None  # ISO format date
-    date_to: str | None = None  # ISO format date
+    date_from: date | None = None
+    date_to: date | None = None
+
+
+# --- Read Models ---
+
+
+@dataclass(frozen=True, slots=True)
+class BookingListRow:
+    """Flat booking summary for list views, read without building the aggregate."""
+
+    id: str  # BL reference
+    created_at: datetime
+    status: BookingStatus
+    client_name: str | None
+    pol_code: str | None
+    pod_code: str | None
+    total_revenue: Money
+    total_costs: Money
+    charge_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentListRow:
+    """Flat document summary for list views, read without building the entity."""
+
+    id: UUID
+    filename: str
+    status: ProcessingStatus
+    document_type: DocumentType | None
+    created_at: datetime
+    processed_at: datetime | None
+    email_message_id: str | None  # Set only for documents imported from email
+    email_sender: str | None
+    email_subject: str | None
+    error_message: str | None  # Set only for documents with recorded errors
+    error_retryable: bool | None
+    invoice_id: UUID | None
+    has_file: bool
+
+
+@dataclass(frozen=True, slots=True)
+class InvoiceListRow:
+    """Flat invoice summary for list views, with the party name already joined."""
+
+    id: UUID
+    invoice_type: DocumentType
+    invoice_number: str
+    invoice_date: date
+    party_name: str | None
+    bl_references: tuple[str, ...]
+    total_amount: Money
+    charge_count: int
+    charges_total: Money
 
 
 # --- Repository Interfaces ---
@@ -70,6 +123,16 @@ class BookingRepository(ABC):
         """Find booking by ID, or create if it doesn't exist."""
         pass
 
+    @abstractmethod
+    def find_or_create_many(self, bl_references: list[str]) -> dict[str, Booking]:
+        """Find bookings by ID, creating the missing ones, keyed by BL reference."""
+        pass
+
+    @abstractmethod
+    def find_by_invoice_ids(self, invoice_ids: list[UUID]) -> list[Booking]:
+        """Find bookings holding charges from any of the given invoices."""
+        pass
+
     @abstractmethod
     def list_all(
         self, filters: BookingFilters | None = None, sort: BookingSort | None = None
@@ -77,11 +140,23 @@ class BookingRepository(ABC):
         """List all bookings with optional filtering and sorting."""
         pass
 
+    @abstractmethod
+    def list_rows(
+        self, filters: BookingFilters | None = None, sort: BookingSort | None = None
+    ) -> list[BookingListRow]:
+        """List flat booking summaries with optional filtering and sorting."""
+        pass
+
     @abstractmethod
     def update(self, booking: Booking) -> None:
         """Update an existing booking."""
         pass
 
+    @abstractmethod
+    def update_many(self, bookings: list[Booking]) -> None:
+        """Update a batch of existing bookings in one statement."""
+        pass
+
 
 class InvoiceRepository(ABC):
     """Repository for invoice persistence (both client and provider)."""
@@ -130,6 +205,20 @@ class InvoiceRepository(ABC):
         """List provider invoices with optional filtering."""
         pass
 
+    @abstractmethod
+    def list_client_invoice_rows(
+        self, filters: InvoiceFilters | None = None
+    ) -> list[InvoiceListRow]:
+        """List flat client invoice summaries with optional filtering."""
+        pass
+
+    @abstractmethod
+    def list_provider_invoice_rows(
+        self, filters: InvoiceFilters | None = None
+    ) -> list[InvoiceListRow]:
+        """List flat provider invoice summaries with optional filtering."""
+        pass
+
     @abstractmethod
     def delete_by_source_document(self, document_id: UUID) -> list[UUID]:
         """Delete invoices linked to a source document and return removed invoice IDs."""
@@ -144,6 +233,11 @@ class DocumentRepository(ABC):
         """Save a new document."""
         pass
 
+    @abstractmethod
+    def save_many(self, documents: list[Document]) -> None:
+        """Save a batch of new documents in one transaction."""
+        pass
+
     @abstractmethod
     def find_by_id(self, document_id: UUID) -> Document | None:
         """Find document by ID."""
@@ -154,11 +248,21 @@ class DocumentRepository(ABC):
         """Find document by file hash (for duplicate detection)."""
         pass
 
+    @abstractmethod
+    def exists_by_file_hash(self, file_hash: FileHash) -> bool:
+        """Check whether a document with this file hash is already stored."""
+        pass
+
     @abstractmethod
     def list_by_status(self, status: ProcessingStatus) -> list[Document]:
         """List documents by processing status."""
         pass
 
+    @abstractmethod
+    def list_rows(self, status: ProcessingStatus | None = None) -> list[DocumentListRow]:
+        """List flat document summaries, newest first, optionally by status."""
+        pass
+
     @abstractmethod
     def find_stuck_processing(self) -> list[Document]:
         """Find documents stuck in PROCESSING status (crash recovery)."""
@@ -0,0 +1,21 @@
+"""Output port: Unit of work interface for transaction boundaries.
+
+Repositories only stage changes; use cases decide when a business operation
+is complete and commit it as one transaction.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """Transaction boundary shared by the repositories of one operation."""
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Persist all changes staged by repositories since the last commit."""
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard all changes staged since the last commit."""
+        pass
@@ -318,6 +318,8 @@ export interface InvoiceListItem {
   party_name: string | null;
   booking_references: string[];
   total_amount: string | number;
+  charge_count: number;
+  charges_total: string | number;
 }
 
 export interface ListInvoicesResponse {
@@ -6,6 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from backend import main
 from backend.adapters.persistence.database import Base, get_db
 
 # Import models FIRST to register with Base.metadata
@@ -48,9 +49,11 @@ def db_session(db_engine):
 
 
 @pytest.fixture
-def client(db_engine):
+def client(db_engine, monkeypatch):
     """Create a test client with database dependency override."""
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    # Startup migrations open their own session from the module's factory
+    monkeypatch.setattr(main, "SessionLocal", TestingSessionLocal)
 
     def override_get_db():
         db = TestingSessionLocal()
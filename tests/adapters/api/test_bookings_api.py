@@ -383,6 +383,17 @@ def test_edit_booking_updates_shipping_fields(client: TestClient, _sample_bookin
     assert payload["pod_name"] == "Valencia"
 
 
+def test_edit_booking_rejects_port_name_without_code(client: TestClient, _sample_bookings) -> None:
+    """Test PATCH /api/bookings/{id} rejects a POD name when the POD code is cleared."""
+    response = client.patch(
+        "/api/bookings/BL-2024-001",
+        json={"pod_code": "", "pod_name": "Valencia"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "POD code is required when setting POD name"
+
+
 def test_export_booking_returns_excel_file(client: TestClient, _sample_bookings) -> None:
     """Test GET /api/bookings/{id}/export returns XLSX attachment."""
     response = client.get("/api/bookings/BL-2024-001/export")
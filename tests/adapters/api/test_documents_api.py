@@ -249,6 +249,50 @@ def test_list_documents_invalid_date_range_returns_400(client: TestClient) -> No
     assert "date_from cannot be greater than date_to" in response.json()["detail"]
 
 
+def test_list_documents_pages_with_cursor(client: TestClient, db_session) -> None:
+    """Test documents sharing a timestamp are paged without gaps or repeats."""
+    repo = SqlAlchemyDocumentRepository(db_session)
+    created_at = datetime(2024, 1, 15, 9, 30)
+    for index in range(3):
+        document = Document.create(
+            filename=f"email-batch-{index}.pdf",
+            file_hash=FileHash.sha256(f"page-{index}"),
+            email_reference=EmailReference(
+                message_id="msg-paged",
+                subject="Paged invoices",
+                sender="batch@example.com",
+                received_at=created_at,
+            ),
+        )
+        document.created_at = created_at
+        repo.save(document)
+    db_session.commit()
+
+    first = client.get("/api/documents?limit=2").json()
+    second = client.get(
+        "/api/documents",
+        params={
+            "limit": 2,
+            "cursor": first["next_cursor"],
+            "cursor_id": first["next_cursor_id"],
+        },
+    ).json()
+
+    ids = [item["id"] for item in first["documents"] + second["documents"]]
+    assert len(first["documents"]) == 2
+    assert len(set(ids)) == 3
+    assert second["next_cursor"] is None
+    # Earlier pages still count towards the email's PDF total
+    assert second["documents"][0]["pdf_count_in_email"] == 3
+
+
+def test_list_documents_cursor_without_id_returns_400(client: TestClient) -> None:
+    """Test list documents rejects a cursor missing its tie-breaking id."""
+    response = client.get("/api/documents?cursor=2024-01-15T09:30:00")
+    assert response.status_code == 400
+    assert "cursor and cursor_id" in response.json()["detail"]
+
+
 def test_get_document_file_success(
     client: TestClient, processed_provider_document
 ) -> None:
@@ -375,8 +419,8 @@ def test_retry_document_endpoint_success(client: TestClient) -> None:
                 },
                 extraction_notes=None,
                 overall_confidence="HIGH",
-                warnings=[],
-                errors=[],
+                warnings=(),
+                errors=(),
             )
         )
     )
@@ -447,8 +491,8 @@ def test_reprocess_document_endpoint_success(client: TestClient) -> None:
             },
             extraction_notes=None,
             overall_confidence="HIGH",
-            warnings=[],
-            errors=[],
+            warnings=(),
+            errors=(),
         )
     )
     app.dependency_overrides[get_process_invoice_use_case] = lambda: stub
@@ -236,6 +236,51 @@ def test_confirm_reprocess_invalid_payload_preserves_existing_projection(
     assert booking["revenue_charges"][0]["description"] == "Original kept revenue"
 
 
+def test_confirm_provider_invoice_links_bl_without_charges(
+    client: TestClient, db_engine, db_session, pending_document
+) -> None:
+    # Every linked BL must have a booking row once foreign keys are enforced;
+    # the pragma is ignored inside the fixture's open transaction
+    db_session.commit()
+    with db_engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    response = client.post(
+        "/api/invoices/confirm",
+        json={
+            "document_id": str(pending_document.id),
+            "document_type": "PROVIDER_INVOICE",
+            "ai_model": "gemini-3-pro",
+            "raw_json": "{\"document_type\":\"PROVIDER_INVOICE\"}",
+            "overall_confidence": "HIGH",
+            "invoice_number": "INV-210",
+            "invoice_date": "2024-01-20",
+            "issuer_name": "Provider A",
+            "issuer_nif": "P22222222",
+            "recipient_name": "Our Company",
+            "recipient_nif": "B00000000",
+            "provider_type": "SHIPPING",
+            "bl_references": ["BL-210", "BL-211"],
+            "charges": [
+                {
+                    "bl_reference": "BL-210",
+                    "description": "Ocean Freight",
+                    "category": "FREIGHT",
+                    "amount": "800.00",
+                }
+            ],
+            "totals": {"tax_amount": "0.00", "total": "800.00"},
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["booking_ids"] == ["BL-210"]
+
+    booking_response = client.get("/api/bookings/BL-211")
+    assert booking_response.status_code == 200
+    assert Decimal(booking_response.json()["total_costs"]) == Decimal("0.00")
+
+
 def test_confirm_document_validation_error(client: TestClient, pending_document) -> None:
     response = client.post(
         "/api/invoices/confirm",
@@ -464,6 +509,8 @@ def test_list_invoices_filters_by_number_party_and_type(
     assert item["party_name"] == "Ocean Carrier"
     assert item["booking_references"] == ["BL-SEARCH-001", "BL-SEARCH-002"]
     assert item["total_amount"] == "650.00"
+    assert item["charge_count"] == 0
+    assert item["charges_total"] == "0.00"
 
 
 def test_list_invoices_invalid_date_range_returns_400(client: TestClient) -> None:
@@ -471,3 +518,35 @@ def test_list_invoices_invalid_date_range_returns_400(client: TestClient) -> Non
     response = client.get("/api/invoices?date_from=2024-02-01&date_to=2024-01-01")
     assert response.status_code == 400
     assert "date_from cannot be greater than date_to" in response.json()["detail"]
+
+
+def test_list_invoices_pages_with_cursor(
+    client: TestClient, db_session, sample_persisted_invoices
+) -> None:
+    """Test invoice search continues from the cursor returned on the previous page."""
+    client_invoice, provider_invoice = sample_persisted_invoices
+    db_session.commit()
+
+    first = client.get("/api/invoices?limit=1").json()
+    second = client.get(
+        "/api/invoices",
+        params={
+            "limit": 1,
+            "cursor": first["next_cursor"],
+            "cursor_id": first["next_cursor_id"],
+        },
+    ).json()
+    last = client.get(
+        "/api/invoices",
+        params={
+            "limit": 1,
+            "cursor": second["next_cursor"],
+            "cursor_id": second["next_cursor_id"],
+        },
+    ).json()
+
+    assert [row["id"] for row in first["invoices"]] == [str(provider_invoice.id)]
+    assert first["next_cursor"] == "2024-01-12"
+    assert [row["id"] for row in second["invoices"]] == [str(client_invoice.id)]
+    assert last["invoices"] == []
+    assert last["next_cursor"] is None
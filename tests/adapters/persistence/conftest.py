@@ -1,7 +1,7 @@
 """Pytest fixtures for repository integration tests."""
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from backend.adapters.persistence.database import Base
@@ -33,3 +33,17 @@ def clean_db_session(db_engine):
     session = SessionLocal()
     yield session
     session.close()
+
+
+@pytest.fixture
+def executed_statements(db_engine):
+    """Record SQL statements emitted against the test engine."""
+    statements: list[str] = []
+
+    def _record(*args):
+        # before_cursor_execute(conn, cursor, statement, parameters, context, executemany)
+        statements.append(args[2])
+
+    event.listen(db_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", _record)
@@ -0,0 +1,268 @@
+"""Integration tests for Booking repository."""
+
+from uuid import uuid4
+
+import pytest
+
+from backend.adapters.persistence.repositories import (
+    SqlAlchemyBookingRepository,
+    SqlAlchemyClientRepository,
+)
+from backend.domain.entities.booking import Booking
+from backend.domain.entities.party import Client
+from backend.domain.enums import BookingStatus, ChargeCategory
+from backend.domain.value_objects import BookingCharge, ClientInfo, Money, Port
+from backend.ports.output.repositories import BookingFilters, BookingSort
+
+
+def _revenue_charge(booking_id: str, amount: float) -> BookingCharge:
+    return BookingCharge(
+        booking_id=booking_id,
+        invoice_id=uuid4(),
+        charge_category=ChargeCategory.FREIGHT,
+        provider_type=None,
+        container=None,
+        description="Ocean Freight",
+        amount=Money.from_float(amount),
+    )
+
+
+class TestBookingRepository:
+    """Test suite for SqlAlchemyBookingRepository."""
+
+    def test_save_and_retrieve_booking(self, db_session):
+        """Test saving and retrieving a booking with ports and charges."""
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        booking = Booking.create("BL-001")
+        booking.pol = Port(code="ESVAL", name="Valencia")
+        booking.containers = ["MSCU1234567"]
+        booking.add_revenue_charge(_revenue_charge("BL-001", 1000.00))
+        repo.save(booking)
+
+        retrieved = repo.find_by_id("BL-001")
+
+        assert retrieved is not None
+        assert retrieved.pol == Port(code="ESVAL", name="Valencia")
+        assert retrieved.pod is None
+        assert retrieved.containers == ["MSCU1234567"]
+        assert retrieved.total_revenue == Money.from_float(1000.00)
+
+    def test_save_existing_booking_updates_in_place(self, db_session):
+        """Test saving an already persisted booking updates its row."""
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        booking = Booking.create("BL-001")
+        repo.save(booking)
+        booking.vessel = "MSC Aurora"
+        booking.mark_complete()
+        repo.save(booking)
+
+        retrieved = repo.find_by_id("BL-001")
+
+        assert retrieved is not None
+        assert retrieved.vessel == "MSC Aurora"
+        assert retrieved.status == BookingStatus.COMPLETE
+        assert len(repo.list_all()) == 1
+
+    def test_list_all_hydrates_client_and_ports(self, db_session):
+        """Test list_all returns bookings with client info populated."""
+        client_repo = SqlAlchemyClientRepository(db_session)
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        client = Client.create(nif="B12345678", name="Test Client SA")
+        client_repo.save(client)
+
+        with_client = Booking.create("BL-001")
+        with_client.update_client(ClientInfo(client_id=client.id, name=client.name, nif=client.nif))
+        with_client.pod = Port(code="CNSHA", name="")
+        with_client.add_revenue_charge(_revenue_charge("BL-001", 500.00))
+        repo.save(with_client)
+        repo.save(Booking.create("BL-002"))
+
+        bookings = {booking.id: booking for booking in repo.list_all()}
+
+        assert set(bookings) == {"BL-001", "BL-002"}
+        assert bookings["BL-001"].client == ClientInfo(
+            client_id=client.id, name="Test Client SA", nif="B12345678"
+        )
+        assert bookings["BL-001"].pod == Port(code="CNSHA", name="")
+        assert bookings["BL-001"].total_revenue == Money.from_float(500.00)
+        assert bookings["BL-001"]._uuid == with_client._uuid
+        assert bookings["BL-002"].client is None
+
+    def test_list_all_loads_clients_in_single_statement(self, db_session, executed_statements):
+        """Test list_all does not issue a client lookup per booking."""
+        client_repo = SqlAlchemyClientRepository(db_session)
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        for index in range(3):
+            client = Client.create(nif=f"B0000000{index}", name=f"Client {index}")
+            client_repo.save(client)
+            booking = Booking.create(f"BL-00{index}")
+            booking.update_client(ClientInfo(client_id=client.id, name=client.name, nif=client.nif))
+            repo.save(booking)
+        executed_statements.clear()
+
+        bookings = repo.list_all()
+
+        assert len(bookings) == 3
+        assert all(booking.client is not None for booking in bookings)
+        assert len(executed_statements) == 1
+
+    def test_list_all_filters_by_status(self, db_session):
+        """Test list_all applies status filters."""
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        pending = Booking.create("BL-001")
+        complete = Booking.create("BL-002")
+        complete.mark_complete()
+        repo.save(pending)
+        repo.save(complete)
+
+        bookings = repo.list_all(filters=BookingFilters(status=BookingStatus.COMPLETE))
+
+        assert [booking.id for booking in bookings] == ["BL-002"]
+
+    def test_find_by_id_reflects_client_change(self, db_session):
+        """Test find_by_id returns the new client after the booking is reassigned."""
+        client_repo = SqlAlchemyClientRepository(db_session)
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        first = Client.create(nif="B00000001", name="First Client")
+        second = Client.create(nif="B00000002", name="Second Client")
+        client_repo.save(first)
+        client_repo.save(second)
+
+        booking = Booking.create("BL-001")
+        booking.update_client(ClientInfo(client_id=first.id, name=first.name, nif=first.nif))
+        repo.save(booking)
+        assert repo.find_by_id("BL-001").client.client_id == first.id
+
+        booking.update_client(ClientInfo(client_id=second.id, name=second.name, nif=second.nif))
+        repo.update(booking)
+
+        retrieved = repo.find_by_id("BL-001")
+
+        assert retrieved is not None
+        assert retrieved.client == ClientInfo(
+            client_id=second.id, name="Second Client", nif="B00000002"
+        )
+
+    def test_update_missing_booking_raises(self, db_session):
+        """Test update rejects a booking that was never saved."""
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        with pytest.raises(ValueError, match="BL-404"):
+            repo.update(Booking.create("BL-404"))
+
+    def test_list_rows_returns_flat_summaries(self, db_session):
+        """Test list_rows reads client name, ports and charge totals in one pass."""
+        client_repo = SqlAlchemyClientRepository(db_session)
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        client = Client.create(nif="B12345678", name="Test Client SA")
+        client_repo.save(client)
+
+        booking = Booking.create("BL-001")
+        booking.update_client(ClientInfo(client_id=client.id, name=client.name, nif=client.nif))
+        booking.pol = Port(code="ESVAL", name="Valencia")
+        booking.add_revenue_charge(_revenue_charge("BL-001", 500.10))
+        booking.add_revenue_charge(_revenue_charge("BL-001", 250.05))
+        repo.save(booking)
+        repo.save(Booking.create("BL-002"))
+
+        rows = {row.id: row for row in repo.list_rows()}
+
+        assert rows["BL-001"].client_name == "Test Client SA"
+        assert rows["BL-001"].pol_code == "ESVAL"
+        assert rows["BL-001"].pod_code is None
+        assert rows["BL-001"].total_revenue == Money.from_float(750.15)
+        assert rows["BL-001"].total_costs == Money.zero()
+        assert rows["BL-001"].charge_count == 2
+        assert rows["BL-002"].client_name is None
+        assert rows["BL-002"].status == BookingStatus.PENDING
+
+    def test_list_rows_sorts_by_persisted_margin(self, db_session):
+        """Test margin sorting uses the stored margin, including after updates."""
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        low = Booking.create("BL-001")
+        low.add_revenue_charge(_revenue_charge("BL-001", 100.00))
+        high = Booking.create("BL-002")
+        high.add_revenue_charge(_revenue_charge("BL-002", 300.00))
+        repo.save(low)
+        repo.save(high)
+        low.add_revenue_charge(_revenue_charge("BL-001", 500.00))
+        repo.update(low)
+
+        rows = repo.list_rows(sort=BookingSort(field="margin", descending=True))
+
+        assert [row.id for row in rows] == ["BL-001", "BL-002"]
+
+    def test_update_many_writes_batch_in_one_statement(self, db_session, executed_statements):
+        """Test update_many persists every booking with a single UPDATE."""
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        first = Booking.create("BL-001")
+        second = Booking.create("BL-002")
+        repo.save(first)
+        repo.save(second)
+        first.vessel = "MSC Aurora"
+        second.add_revenue_charge(_revenue_charge("BL-002", 300.00))
+        executed_statements.clear()
+
+        repo.update_many([first, second])
+
+        assert len(executed_statements) == 1
+        assert repo.find_by_id("BL-001").vessel == "MSC Aurora"
+        assert repo.find_by_id("BL-002").total_revenue == Money.from_float(300.00)
+
+    def test_update_many_missing_booking_raises(self, db_session):
+        """Test update_many rejects a batch containing an unsaved booking."""
+        repo = SqlAlchemyBookingRepository(db_session)
+        repo.save(Booking.create("BL-001"))
+
+        with pytest.raises(ValueError, match="not found"):
+            repo.update_many([Booking.create("BL-001"), Booking.create("BL-404")])
+
+    def test_find_by_invoice_ids_returns_only_referencing_bookings(self, db_session):
+        """Test find_by_invoice_ids matches revenue and cost charges by invoice."""
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        revenue = Booking.create("BL-001")
+        revenue_charge = _revenue_charge("BL-001", 100.00)
+        revenue.add_revenue_charge(revenue_charge)
+        cost = Booking.create("BL-002")
+        cost_charge = _revenue_charge("BL-002", 40.00)
+        cost.add_cost_charge(cost_charge)
+        untouched = Booking.create("BL-003")
+        untouched.add_revenue_charge(_revenue_charge("BL-003", 75.00))
+        for booking in (revenue, cost, untouched):
+            repo.save(booking)
+
+        found = repo.find_by_invoice_ids([revenue_charge.invoice_id, cost_charge.invoice_id])
+
+        assert sorted(booking.id for booking in found) == ["BL-001", "BL-002"]
+        assert repo.find_by_invoice_ids([uuid4()]) == []
+
+    def test_find_or_create_many_batches_lookup_and_insert(self, db_session, executed_statements):
+        """Test find_or_create_many reads existing bookings and inserts the rest in batch."""
+        client_repo = SqlAlchemyClientRepository(db_session)
+        repo = SqlAlchemyBookingRepository(db_session)
+
+        client = Client.create(nif="B12345678", name="Test Client SA")
+        client_repo.save(client)
+        existing = Booking.create("BL-001")
+        existing.update_client(ClientInfo(client_id=client.id, name=client.name, nif=client.nif))
+        repo.save(existing)
+        executed_statements.clear()
+
+        found = repo.find_or_create_many(["BL-001", "BL-002", "BL-003", "BL-002"])
+
+        assert len(executed_statements) == 2
+        assert sorted(found) == ["BL-001", "BL-002", "BL-003"]
+        assert found["BL-001"]._uuid == existing._uuid
+        assert found["BL-001"].client == existing.client
+        assert repo.find_by_id("BL-003") is not None
+        assert repo.find_or_create_many([]) == {}
@@ -62,6 +62,21 @@ class TestCompanyRepository:
         assert retrieved.contact_info == "finance@company2.com"
         assert retrieved.agent_commission_rate == Decimal("0.45")
 
+    def test_save_emits_single_upsert(self, db_session, executed_statements):
+        """Test that saving over an existing company is one INSERT ... ON CONFLICT."""
+        repo = SqlAlchemyCompanyRepository(db_session)
+
+        company = Company.create(name="Company 1", nif="B11111111")
+        repo.save(company)
+        company.update(name="Company 1 Renamed")
+        executed_statements.clear()
+
+        repo.save(company)
+
+        assert len(executed_statements) == 1
+        assert "ON CONFLICT" in executed_statements[0]
+        assert repo.get().name == "Company 1 Renamed"
+
     def test_get_empty_returns_none(self, db_session):
         """Test that get returns None when no company exists."""
         repo = SqlAlchemyCompanyRepository(db_session)
@@ -159,8 +174,8 @@ class TestSettingsRepository:
 
         assert result is None
 
-    def test_get_migrates_legacy_plaintext_outlook_token_to_keychain_reference(self, db_session):
-        """Test legacy plaintext refresh token gets migrated to keychain reference on read."""
+    def test_migrate_moves_legacy_plaintext_outlook_token_to_keychain_reference(self, db_session):
+        """Test legacy plaintext refresh token gets migrated to keychain reference."""
         legacy_model = SettingsModel(
             id=uuid4(),
             gemini_api_key="",
@@ -198,12 +213,17 @@ class TestSettingsRepository:
         retrieved = repo.get()
         assert retrieved is not None
         assert retrieved.outlook_refresh_token == "legacy-refresh-token"
+        assert fake_vault.saved == []
+
+        assert repo.migrate_refresh_token() is True
         assert fake_vault.saved == [(legacy_model.id, "legacy-refresh-token")]
 
         stored = db_session.query(SettingsModel).first()
         assert stored is not None
         assert stored.outlook_refresh_token.startswith("keychain://ai-bookkeeper/outlook-refresh-token/")
-    def test_get_keeps_legacy_plaintext_when_keychain_migration_fails(self, db_session):
+        assert repo.migrate_refresh_token() is False
+
+    def test_migrate_keeps_legacy_plaintext_when_keychain_migration_fails(self, db_session):
         """Test plaintext token remains usable if migration to keychain fails."""
         legacy_model = SettingsModel(
             id=uuid4(),
@@ -234,6 +254,7 @@ class TestSettingsRepository:
 
         repo._token_vault = FailingMigrationTokenVault()
 
+        assert repo.migrate_refresh_token() is False
         retrieved = repo.get()
         assert retrieved is not None
         assert retrieved.outlook_refresh_token == "legacy-refresh-token"
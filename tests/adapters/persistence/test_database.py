@@ -0,0 +1,20 @@
+"""Tests for database engine configuration."""
+
+from sqlalchemy import create_engine, event, text
+
+from backend.adapters.persistence.database import apply_sqlite_pragmas
+
+
+def test_sqlite_connections_use_wal_journal(tmp_path):
+    """Test new SQLite connections are switched to WAL with relaxed sync."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'bookkeeper.db'}")
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+
+    with engine.connect() as connection:
+        journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar_one()
+        synchronous = connection.execute(text("PRAGMA synchronous")).scalar_one()
+
+    engine.dispose()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
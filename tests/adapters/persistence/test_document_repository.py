@@ -3,6 +3,8 @@
 from datetime import datetime, timedelta
 from uuid import uuid4
 
+import pytest
+
 from backend.adapters.persistence.repositories import SqlAlchemyDocumentRepository
 from backend.domain.entities.document import Document
 from backend.domain.enums import DocumentType, ErrorType, ProcessingStatus
@@ -40,6 +42,36 @@ class TestDocumentRepository:
         assert retrieved.email_reference is not None
         assert retrieved.email_reference.message_id == "msg-123"
 
+    def test_save_many_documents(self, db_session):
+        """Test saving a batch of documents in one call."""
+        repo = SqlAlchemyDocumentRepository(db_session)
+
+        docs = [
+            Document.create(filename=f"invoice-{index}.pdf", file_hash=FileHash.sha256(f"h{index}"))
+            for index in range(3)
+        ]
+        repo.save_many(docs)
+        repo.save_many([])
+
+        assert len(repo.list_by_status(ProcessingStatus.PENDING)) == 3
+        assert repo.find_by_id(docs[1].id) is not None
+
+    def test_save_many_uses_single_insert(self, db_session, executed_statements):
+        """Test a batch is written with one multi-row INSERT."""
+        repo = SqlAlchemyDocumentRepository(db_session)
+
+        repo.save_many(
+            [
+                Document.create(
+                    filename=f"invoice-{index}.pdf", file_hash=FileHash.sha256(f"h{index}")
+                )
+                for index in range(5)
+            ]
+        )
+
+        inserts = [sql for sql in executed_statements if sql.startswith("INSERT INTO documents")]
+        assert len(inserts) == 1
+
     def test_find_by_file_hash(self, db_session):
         """Test finding document by file hash (duplicate detection)."""
         repo = SqlAlchemyDocumentRepository(db_session)
@@ -64,6 +96,16 @@ class TestDocumentRepository:
 
         assert result is None
 
+    def test_exists_by_file_hash(self, db_session):
+        """Test the duplicate check answers from the hash index alone."""
+        repo = SqlAlchemyDocumentRepository(db_session)
+
+        file_hash = FileHash.sha256("duplicate_hash")
+        repo.save(Document.create(filename="test.pdf", file_hash=file_hash))
+
+        assert repo.exists_by_file_hash(file_hash) is True
+        assert repo.exists_by_file_hash(FileHash.sha256("nonexistent")) is False
+
     def test_list_by_status(self, db_session):
         """Test listing documents by status."""
         repo = SqlAlchemyDocumentRepository(db_session)
@@ -91,6 +133,40 @@ class TestDocumentRepository:
         assert len(processed) == 1
         assert processed[0].status == ProcessingStatus.PROCESSED
 
+    def test_list_rows_returns_flat_summaries(self, db_session):
+        """Test list_rows returns newest-first summaries with email and error fields."""
+        repo = SqlAlchemyDocumentRepository(db_session)
+
+        older = Document.create(
+            filename="older.pdf",
+            file_hash=FileHash.sha256("o1"),
+            email_reference=EmailReference(
+                message_id="msg-1",
+                subject="Invoice",
+                sender="ops@example.com",
+                received_at=datetime.now(),
+            ),
+            storage_path="/tmp/older.pdf",
+        )
+        older.created_at = datetime.now() - timedelta(hours=1)
+        newer = Document.create(filename="newer.pdf", file_hash=FileHash.sha256("n1"))
+        newer.mark_error(ErrorInfo(error_type=ErrorType.AI_TIMEOUT, error_message="Timed out"))
+        repo.save_many([older, newer])
+
+        rows = repo.list_rows()
+        errored = repo.list_rows(ProcessingStatus.ERROR)
+
+        assert [row.id for row in rows] == [newer.id, older.id]
+        assert rows[1].email_message_id == "msg-1"
+        assert rows[1].email_sender == "ops@example.com"
+        assert rows[1].has_file is True
+        assert rows[1].error_message is None
+        assert rows[0].email_sender is None
+        assert rows[0].has_file is False
+        assert rows[0].error_message == "Timed out"
+        assert rows[0].error_retryable is True
+        assert [row.id for row in errored] == [newer.id]
+
     def test_find_stuck_processing(self, db_session):
         """Test finding documents stuck in PROCESSING status."""
         repo = SqlAlchemyDocumentRepository(db_session)
@@ -164,3 +240,11 @@ class TestDocumentRepository:
         assert retrieved.error_info is not None
         assert retrieved.error_info.error_type == ErrorType.AI_TIMEOUT
         assert retrieved.error_info.is_retryable is True
+
+    def test_update_missing_document_raises(self, db_session):
+        """Test updating a document that was never saved raises ValueError."""
+        repo = SqlAlchemyDocumentRepository(db_session)
+        doc = Document.create(filename="missing.pdf", file_hash=FileHash.sha256("m1"))
+
+        with pytest.raises(ValueError, match=str(doc.id)):
+            repo.update(doc)
@@ -0,0 +1,233 @@
+"""Integration tests for Invoice repository."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from backend.adapters.persistence.mappers.invoice_mapper import deserialize_extraction_metadata
+from backend.adapters.persistence.models.invoice import ClientInvoiceModel
+from backend.adapters.persistence.repositories import (
+    SqlAlchemyBookingRepository,
+    SqlAlchemyClientRepository,
+    SqlAlchemyInvoiceRepository,
+    SqlAlchemyProviderRepository,
+)
+from backend.domain.entities.booking import Booking
+from backend.domain.entities.invoice import ClientInvoice, ProviderInvoice
+from backend.domain.entities.party import Client, Provider
+from backend.domain.enums import ChargeCategory, ConfidenceLevel, DocumentType, ProviderType
+from backend.domain.value_objects import (
+    BookingCharge,
+    DocumentReference,
+    ExtractionMetadata,
+    FieldConfidence,
+    FileHash,
+    Money,
+)
+from backend.ports.output.repositories import InvoiceFilters
+
+
+def _create_client_invoice(db_session, bl_reference: str = "BL-001") -> ClientInvoice:
+    client = Client.create(nif="B12345678", name="Test Client SA")
+    SqlAlchemyClientRepository(db_session).save(client)
+    SqlAlchemyBookingRepository(db_session).save(Booking.create(bl_reference))
+
+    invoice = ClientInvoice.create(
+        invoice_number="INV-001",
+        client_id=client.id,
+        invoice_date=date(2026, 1, 15),
+        bl_reference=bl_reference,
+        total_amount=Money.from_float(1210.00),
+        tax_amount=Money.from_float(210.00),
+    )
+    invoice.add_charge(
+        BookingCharge(
+            booking_id=bl_reference,
+            invoice_id=invoice.id,
+            charge_category=ChargeCategory.FREIGHT,
+            provider_type=None,
+            container="MSCU1234567",
+            description="Ocean Freight",
+            amount=Money.from_float(1000.00),
+        )
+    )
+    return invoice
+
+
+def _create_provider_invoice(db_session, bl_references: list[str]) -> ProviderInvoice:
+    provider = Provider.create(nif="A87654321", provider_type=ProviderType.SHIPPING)
+    SqlAlchemyProviderRepository(db_session).save(provider)
+
+    return ProviderInvoice.create(
+        invoice_number="PINV-001",
+        provider_id=provider.id,
+        provider_type=ProviderType.SHIPPING,
+        invoice_date=date(2026, 1, 20),
+        bl_references=bl_references,
+        total_amount=Money.from_float(500.00),
+        tax_amount=Money.zero(),
+    )
+
+
+class TestInvoiceRepository:
+    """Test suite for SqlAlchemyInvoiceRepository."""
+
+    def test_client_invoice_round_trip(self, db_session):
+        """Test saving and retrieving a client invoice with metadata."""
+        repo = SqlAlchemyInvoiceRepository(db_session)
+        invoice = _create_client_invoice(db_session)
+        invoice.source_document = DocumentReference(
+            document_id=uuid4(),
+            filename="invoice.pdf",
+            file_hash=FileHash.sha256("abc123"),
+        )
+        invoice.extraction_metadata = ExtractionMetadata(
+            ai_model="gemini-3-pro",
+            overall_confidence=ConfidenceLevel.MEDIUM,
+            field_confidences=(
+                FieldConfidence(field_name="invoice_number", confidence=ConfidenceLevel.HIGH),
+                FieldConfidence(field_name="total", confidence=ConfidenceLevel.LOW),
+            ),
+            raw_json='{"invoice_number": "INV-001"}',
+            manually_edited_fields=("total",),
+            processed_at=datetime(2026, 1, 15, 10, 30),
+        )
+        repo.save_client_invoice(invoice)
+
+        retrieved = repo.find_client_invoice_by_id(invoice.id)
+
+        assert retrieved is not None
+        assert retrieved.invoice_number == "INV-001"
+        assert retrieved.total_amount == Money.from_float(1210.00)
+        assert retrieved.charges == invoice.charges
+        assert retrieved.source_document == invoice.source_document
+        assert retrieved.extraction_metadata == invoice.extraction_metadata
+
+    def test_find_client_invoice_by_number(self, db_session):
+        """Test finding a client invoice by number and client."""
+        repo = SqlAlchemyInvoiceRepository(db_session)
+        invoice = _create_client_invoice(db_session)
+        repo.save_client_invoice(invoice)
+
+        found = repo.find_client_invoice("INV-001", invoice.client_id)
+
+        assert found is not None
+        assert found.id == invoice.id
+        assert repo.find_client_invoice("INV-999", invoice.client_id) is None
+
+    def test_save_stores_charge_summary(self, db_session):
+        """Test charge count and total are written alongside the charges JSON."""
+        repo = SqlAlchemyInvoiceRepository(db_session)
+        invoice = _create_client_invoice(db_session)
+        repo.save_client_invoice(invoice)
+
+        model = db_session.get(ClientInvoiceModel, invoice.id)
+
+        assert model.charge_count == 1
+        assert model.charges_total == Decimal("1000.00")
+
+    def test_list_provider_invoices_by_date(self, db_session):
+        """Test filtering provider invoices by invoice date range."""
+        repo = SqlAlchemyInvoiceRepository(db_session)
+        invoice = _create_provider_invoice(db_session, ["BL-001", "BL-002"])
+        repo.save_provider_invoice(invoice)
+
+        matching = repo.list_provider_invoices(InvoiceFilters(date_from=date(2026, 1, 1)))
+        missing = repo.list_provider_invoices(InvoiceFilters(date_to=date(2026, 1, 10)))
+
+        assert [found.id for found in matching] == [invoice.id]
+        assert matching[0].bl_references == ["BL-001", "BL-002"]
+        assert missing == []
+
+    def test_list_provider_invoices_by_booking(self, db_session):
+        """Test filtering provider invoices by any of their BL references."""
+        repo = SqlAlchemyInvoiceRepository(db_session)
+        invoice = _create_provider_invoice(db_session, ["BL-001", "BL-002"])
+        repo.save_provider_invoice(invoice)
+
+        matching = repo.list_provider_invoices(InvoiceFilters(booking_id="BL-002"))
+        missing = repo.list_provider_invoices(InvoiceFilters(booking_id="BL-003"))
+
+        assert [found.id for found in matching] == [invoice.id]
+        assert missing == []
+
+    def test_list_provider_invoices_loads_bl_references_in_batch(
+        self, db_session, executed_statements
+    ):
+        """Test listing provider invoices does not query BL references per row."""
+        repo = SqlAlchemyInvoiceRepository(db_session)
+        first = _create_provider_invoice(db_session, ["BL-001", "BL-002"])
+        repo.save_provider_invoice(first)
+        for index in range(2, 5):
+            invoice = ProviderInvoice.create(
+                invoice_number=f"PINV-00{index}",
+                provider_id=first.provider_id,
+                provider_type=ProviderType.SHIPPING,
+                invoice_date=date(2026, 1, 20),
+                bl_references=[f"BL-00{index}"],
+                total_amount=Money.from_float(100.00),
+                tax_amount=Money.zero(),
+            )
+            repo.save_provider_invoice(invoice)
+        db_session.expunge_all()
+        executed_statements.clear()
+
+        invoices = repo.list_provider_invoices(InvoiceFilters())
+
+        assert len(invoices) == 4
+        assert all(invoice.bl_references for invoice in invoices)
+        # One query for the invoices and one IN query for all of their BL references
+        assert len(executed_statements) == 2
+
+    def test_list_invoice_rows_join_party_names(self, db_session):
+        """Test invoice list rows carry party names and BL references in order."""
+        repo = SqlAlchemyInvoiceRepository(db_session)
+        client_invoice = _create_client_invoice(db_session)
+        repo.save_client_invoice(client_invoice)
+        provider_invoice = _create_provider_invoice(db_session, ["BL-002", "BL-001"])
+        repo.save_provider_invoice(provider_invoice)
+
+        client_rows = repo.list_client_invoice_rows()
+        provider_rows = repo.list_provider_invoice_rows(InvoiceFilters(booking_id="BL-001"))
+
+        assert [row.id for row in client_rows] == [client_invoice.id]
+        assert client_rows[0].invoice_type == DocumentType.CLIENT_INVOICE
+        assert client_rows[0].party_name == "Test Client SA"
+        assert client_rows[0].bl_references == ("BL-001",)
+        assert client_rows[0].total_amount == Money.from_float(1210.00)
+        assert client_rows[0].charge_count == 1
+        assert client_rows[0].charges_total == Money.from_float(1000.00)
+        assert [row.id for row in provider_rows] == [provider_invoice.id]
+        assert provider_rows[0].bl_references == ("BL-002", "BL-001")
+        assert provider_rows[0].charge_count == 0
+        assert provider_rows[0].charges_total == Money.zero()
+
+    def test_delete_by_source_document(self, db_session):
+        """Test deleting invoices linked to a source document."""
+        repo = SqlAlchemyInvoiceRepository(db_session)
+        document_id = uuid4()
+        invoice = _create_provider_invoice(db_session, ["BL-001"])
+        invoice.source_document = DocumentReference(
+            document_id=document_id,
+            filename="provider.pdf",
+            file_hash=FileHash.sha256("def456"),
+        )
+        repo.save_provider_invoice(invoice)
+
+        removed = repo.delete_by_source_document(document_id)
+
+        assert removed == [invoice.id]
+        assert repo.find_provider_invoice_by_id(invoice.id) is None
+
+    def test_unknown_stored_confidence_raises_value_error(self):
+        """Test a corrupt confidence value fails with the Enum's ValueError."""
+        data = {
+            "ai_model": "gemini-3-pro",
+            "overall_confidence": "VERY_HIGH",
+            "processed_at": "2026-01-15T10:30:00",
+        }
+
+        with pytest.raises(ValueError, match="VERY_HIGH"):
+            deserialize_extraction_metadata(data)
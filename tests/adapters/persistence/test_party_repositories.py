@@ -1,6 +1,7 @@
 """Integration tests for Client and Provider repositories."""
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 
 from backend.adapters.persistence.repositories import (
@@ -30,6 +31,16 @@ class TestClientRepository:
         assert retrieved.name == "Test Client SA"
         assert retrieved.nif == "B12345678"
 
+    def test_client_id_stored_as_16_bytes(self, db_session):
+        """Test UUID keys are stored as raw bytes rather than hex text."""
+        repo = SqlAlchemyClientRepository(db_session)
+        client = Client.create(nif="B12345678", name="Test Client SA")
+        repo.save(client)
+
+        stored = db_session.execute(text("SELECT id FROM clients")).scalar_one()
+
+        assert stored == client.id.bytes
+
     def test_find_by_nif(self, db_session):
         """Test finding client by NIF."""
         repo = SqlAlchemyClientRepository(db_session)
@@ -0,0 +1,44 @@
+"""Integration tests for the SQLAlchemy unit of work."""
+
+from pathlib import Path
+
+import backend.adapters.persistence.repositories as repositories_package
+from backend.adapters.persistence.repositories import SqlAlchemyClientRepository
+from backend.adapters.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from backend.domain.entities.party import Client
+
+
+class TestSqlAlchemyUnitOfWork:
+    """Test suite for SqlAlchemyUnitOfWork."""
+
+    def test_commit_persists_repository_writes(self, db_session):
+        """Test committed repository saves survive a later rollback."""
+        repo = SqlAlchemyClientRepository(db_session)
+        client = Client.create(nif="B12345678", name="Test Client SA")
+        repo.save(client)
+
+        unit_of_work = SqlAlchemyUnitOfWork(db_session)
+        unit_of_work.commit()
+        unit_of_work.rollback()
+
+        assert repo.find_by_id(client.id) is not None
+
+    def test_rollback_discards_repository_writes(self, db_session):
+        """Test rolling back drops changes staged by repositories."""
+        repo = SqlAlchemyClientRepository(db_session)
+        client = Client.create(nif="B12345678", name="Test Client SA")
+        repo.save(client)
+
+        SqlAlchemyUnitOfWork(db_session).rollback()
+
+        assert repo.find_by_id(client.id) is None
+
+    def test_repositories_do_not_commit(self):
+        """Test transaction boundaries stay with the unit of work, not repositories."""
+        package_dir = Path(repositories_package.__file__).parent
+
+        offenders = [
+            path.name for path in package_dir.glob("*.py") if ".commit()" in path.read_text()
+        ]
+
+        assert offenders == []
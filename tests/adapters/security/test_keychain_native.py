@@ -0,0 +1,195 @@
+"""Unit tests for the native Keychain helper."""
+
+import ctypes
+import subprocess
+from typing import Any
+
+import pytest
+
+from backend.adapters.security import _keychain_native
+
+ITEM_REF = 0x1234
+
+
+class FakeSecurity:
+    """Stand-in for Security.framework returning configurable statuses."""
+
+    def __init__(self, password: bytes = b"secret") -> None:
+        self.password = password
+        self.add_status = _keychain_native._ERR_SEC_SUCCESS
+        self.find_status = _keychain_native._ERR_SEC_SUCCESS
+        self.modify_status = _keychain_native._ERR_SEC_SUCCESS
+        self.delete_status = _keychain_native._ERR_SEC_SUCCESS
+        self.modified: list[bytes] = []
+        self.deleted: list[int] = []
+        self.freed = 0
+        self._buffer = ctypes.create_string_buffer(password)
+
+    def SecKeychainAddGenericPassword(self, *_args: object) -> int:  # noqa: N802
+        return self.add_status
+
+    def SecKeychainFindGenericPassword(  # noqa: N802
+        self,
+        _keychain: object,
+        _service_length: int,
+        _service: bytes,
+        _account_length: int,
+        _account: bytes,
+        length_ref: Any,
+        data_ref: Any,
+        item_ref: Any,
+    ) -> int:
+        if self.find_status != _keychain_native._ERR_SEC_SUCCESS:
+            return self.find_status
+        if length_ref is not None:
+            length_ref._obj.value = len(self.password)
+            data_ref._obj.value = ctypes.addressof(self._buffer)
+        if item_ref is not None:
+            item_ref._obj.value = ITEM_REF
+        return self.find_status
+
+    def SecKeychainItemFreeContent(self, _attributes: object, _data: object) -> int:  # noqa: N802
+        self.freed += 1
+        return _keychain_native._ERR_SEC_SUCCESS
+
+    def SecKeychainItemModifyAttributesAndData(  # noqa: N802
+        self, _item: int, _attributes: object, _length: int, data: bytes
+    ) -> int:
+        self.modified.append(data)
+        return self.modify_status
+
+    def SecKeychainItemDelete(self, item: int) -> int:  # noqa: N802
+        self.deleted.append(item)
+        return self.delete_status
+
+
+class FakeCoreFoundation:
+    """Records released references."""
+
+    def __init__(self) -> None:
+        self.released: list[int] = []
+
+    def CFRelease(self, ref: int) -> None:  # noqa: N802
+        self.released.append(ref)
+
+
+@pytest.fixture
+def security(monkeypatch: pytest.MonkeyPatch) -> FakeSecurity:
+    """Install fake frameworks in place of the real ones."""
+    fake = FakeSecurity()
+    monkeypatch.setattr(_keychain_native, "_FRAMEWORKS", (fake, FakeCoreFoundation()))
+    return fake
+
+
+@pytest.fixture
+def cli_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Stub the `security` CLI and record its invocations."""
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], **_kwargs: object) -> subprocess.CompletedProcess[str]:
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="from-cli\n", stderr="")
+
+    monkeypatch.setattr(_keychain_native.subprocess, "run", fake_run)
+    return calls
+
+
+def test_cli_is_used_when_frameworks_are_unavailable(
+    monkeypatch: pytest.MonkeyPatch, cli_calls: list[list[str]]
+) -> None:
+    """Test every operation goes through the CLI without Security.framework."""
+    monkeypatch.setattr(_keychain_native, "_FRAMEWORKS", None)
+
+    assert _keychain_native.save_password("svc", "acct", "pw") is True
+    assert _keychain_native.find_password("svc", "acct") == "from-cli"
+    _keychain_native.delete_password("svc", "acct")
+
+    assert [call[1] for call in cli_calls] == [
+        "add-generic-password",
+        "find-generic-password",
+        "delete-generic-password",
+    ]
+
+
+def test_find_password_reads_item_data(security: FakeSecurity, cli_calls: list[list[str]]) -> None:
+    """Test a successful lookup returns the data and frees it."""
+    assert _keychain_native.find_password("svc", "acct") == "secret"
+    assert security.freed == 1
+    assert cli_calls == []
+
+
+def test_find_password_returns_none_when_item_is_missing(
+    security: FakeSecurity, cli_calls: list[list[str]]
+) -> None:
+    """Test errSecItemNotFound is the only status that means missing."""
+    security.find_status = _keychain_native._ERR_SEC_ITEM_NOT_FOUND
+
+    assert _keychain_native.find_password("svc", "acct") is None
+    assert cli_calls == []
+
+
+def test_find_password_falls_back_to_cli_on_other_failures(
+    security: FakeSecurity, cli_calls: list[list[str]]
+) -> None:
+    """Test an access failure on a legacy item retries through the CLI."""
+    security.find_status = -128  # errSecUserCanceled
+
+    assert _keychain_native.find_password("svc", "acct") == "from-cli"
+    assert cli_calls[0][1] == "find-generic-password"
+
+
+def test_save_password_overwrites_duplicate_item(
+    security: FakeSecurity, cli_calls: list[list[str]]
+) -> None:
+    """Test an existing item has its data replaced and its reference released."""
+    security.add_status = _keychain_native._ERR_SEC_DUPLICATE_ITEM
+
+    assert _keychain_native.save_password("svc", "acct", "new-pw") is True
+    assert security.modified == [b"new-pw"]
+    assert _keychain_native._FRAMEWORKS[1].released == [ITEM_REF]  # type: ignore[index]
+    assert cli_calls == []
+
+
+def test_save_password_falls_back_to_cli_when_overwrite_fails(
+    security: FakeSecurity, cli_calls: list[list[str]]
+) -> None:
+    """Test a duplicate item this process cannot modify is updated by the CLI."""
+    security.add_status = _keychain_native._ERR_SEC_DUPLICATE_ITEM
+    security.modify_status = -25293  # errSecAuthFailed
+
+    assert _keychain_native.save_password("svc", "acct", "new-pw") is True
+    assert cli_calls[0][1] == "add-generic-password"
+
+
+def test_delete_password_ignores_missing_item(
+    security: FakeSecurity, cli_calls: list[list[str]]
+) -> None:
+    """Test deleting a missing item is a no-op."""
+    security.find_status = _keychain_native._ERR_SEC_ITEM_NOT_FOUND
+
+    _keychain_native.delete_password("svc", "acct")
+
+    assert security.deleted == []
+    assert cli_calls == []
+
+
+def test_delete_password_deletes_found_item(
+    security: FakeSecurity, cli_calls: list[list[str]]
+) -> None:
+    """Test a found item is deleted in-process."""
+    _keychain_native.delete_password("svc", "acct")
+
+    assert security.deleted == [ITEM_REF]
+    assert cli_calls == []
+
+
+def test_delete_password_falls_back_to_cli_on_other_failures(
+    security: FakeSecurity, cli_calls: list[list[str]]
+) -> None:
+    """Test a lookup failure other than not-found deletes through the CLI."""
+    security.find_status = -25293  # errSecAuthFailed
+
+    _keychain_native.delete_password("svc", "acct")
+
+    assert security.deleted == []
+    assert cli_calls[0][1] == "delete-generic-password"
@@ -0,0 +1,113 @@
+"""Unit tests for the Outlook refresh token vault."""
+
+from collections.abc import Callable
+from uuid import uuid4
+
+import pytest
+
+from backend.adapters.security import outlook_token_vault
+from backend.adapters.security.outlook_token_vault import (
+    KEYCHAIN_REF_PREFIX,
+    OutlookRefreshTokenVault,
+)
+
+
+class FakeKeychain:
+    """In-memory stand-in for the native keychain helper."""
+
+    def __init__(self) -> None:
+        self.passwords: dict[str, str] = {}
+        self.lookups: list[str] = []
+        # Hooks that let a test run another vault call in the middle of this one
+        self.before_save: Callable[[], None] | None = None
+        self.after_find: Callable[[], None] | None = None
+
+    def save_password(self, _service: str, account: str, password: str) -> bool:
+        if self.before_save is not None:
+            hook, self.before_save = self.before_save, None
+            hook()
+        self.passwords[account] = password
+        return True
+
+    def find_password(self, _service: str, account: str) -> str | None:
+        self.lookups.append(account)
+        password = self.passwords.get(account)
+        if self.after_find is not None:
+            hook, self.after_find = self.after_find, None
+            hook()
+        return password
+
+    def delete_password(self, _service: str, account: str) -> None:
+        self.passwords.pop(account, None)
+
+
+@pytest.fixture
+def keychain(monkeypatch: pytest.MonkeyPatch) -> FakeKeychain:
+    """Enable the keychain path against an in-memory password store."""
+    fake = FakeKeychain()
+    monkeypatch.setattr(outlook_token_vault, "_USE_KEYCHAIN", True)
+    monkeypatch.setattr(outlook_token_vault, "_token_cache", {})
+    monkeypatch.setattr(outlook_token_vault, "_keychain_native", fake)
+    return fake
+
+
+def test_load_token_reuses_cached_keychain_value(keychain) -> None:
+    """Repeated loads across vault instances hit the keychain once."""
+    settings_id = uuid4()
+    reference = OutlookRefreshTokenVault().save_token(settings_id, "refresh-1")
+
+    first = OutlookRefreshTokenVault().load_token(settings_id, reference)
+    second = OutlookRefreshTokenVault().load_token(settings_id, reference)
+
+    assert reference.startswith(KEYCHAIN_REF_PREFIX)
+    assert first == second == "refresh-1"
+    assert keychain.lookups == [f"settings-{settings_id}"]
+
+
+@pytest.mark.usefixtures("keychain")
+def test_save_token_invalidates_cached_value() -> None:
+    """Saving a new token replaces the cached one."""
+    settings_id = uuid4()
+    vault = OutlookRefreshTokenVault()
+    reference = vault.save_token(settings_id, "refresh-1")
+    vault.load_token(settings_id, reference)
+
+    vault.save_token(settings_id, "refresh-2")
+
+    assert vault.load_token(settings_id, reference) == "refresh-2"
+
+
+@pytest.mark.usefixtures("keychain")
+def test_delete_token_invalidates_cached_value() -> None:
+    """Deleted tokens are not served from the cache."""
+    settings_id = uuid4()
+    vault = OutlookRefreshTokenVault()
+    reference = vault.save_token(settings_id, "refresh-1")
+    vault.load_token(settings_id, reference)
+
+    vault.delete_token(settings_id, reference)
+
+    assert vault.load_token(settings_id, reference) == ""
+
+
+def test_load_during_save_does_not_keep_stale_token(keychain) -> None:
+    """A load that runs while a new token is being written is not served afterwards."""
+    settings_id = uuid4()
+    vault = OutlookRefreshTokenVault()
+    reference = vault.save_token(settings_id, "refresh-1")
+    keychain.before_save = lambda: vault.load_token(settings_id, reference)
+
+    vault.save_token(settings_id, "refresh-2")
+
+    assert vault.load_token(settings_id, reference) == "refresh-2"
+
+
+def test_load_read_before_save_is_not_cached(keychain) -> None:
+    """A Keychain read that a concurrent save overtakes does not populate the cache."""
+    settings_id = uuid4()
+    vault = OutlookRefreshTokenVault()
+    reference = vault.save_token(settings_id, "refresh-1")
+    keychain.after_find = lambda: vault.save_token(settings_id, "refresh-2")
+
+    assert vault.load_token(settings_id, reference) == "refresh-1"
+    assert vault.load_token(settings_id, reference) == "refresh-2"
@@ -1,5 +1,6 @@
 """Tests for ConfirmInvoiceUseCase."""
 from dataclasses import replace
+from decimal import Decimal, InvalidOperation
 from unittest.mock import MagicMock
 from uuid import uuid4
 
@@ -12,7 +13,7 @@ from backend.domain.entities.document import Document
 from backend.domain.entities.invoice import ClientInvoice, ProviderInvoice
 from backend.domain.entities.party import Client, Provider
 from backend.domain.enums import ChargeCategory, DocumentType, ProcessingStatus, ProviderType
-from backend.domain.value_objects import BookingCharge, FileHash, Money
+from backend.domain.value_objects import BookingCharge, FileHash, Money, Port
 
 
 def _make_document() -> Document:
@@ -57,8 +58,9 @@ def test_confirm_client_invoice_persists_invoice_booking_and_document() -> None:
     document_repo = MagicMock()
     document_repo.find_by_id.return_value = document
     booking_repo = MagicMock()
-    booking_repo.find_or_create.return_value = Booking.create("BL-001")
+    booking_repo.find_or_create_many.return_value = {"BL-001": Booking.create("BL-001")}
     invoice_repo = MagicMock()
+    invoice_repo.delete_by_source_document.return_value = []
     invoice_repo.find_client_invoice.return_value = None
     client_repo = MagicMock()
     client_repo.find_by_nif.return_value = None
@@ -70,6 +72,7 @@ def test_confirm_client_invoice_persists_invoice_booking_and_document() -> None:
         invoice_repo=invoice_repo,
         client_repo=client_repo,
         provider_repo=provider_repo,
+        unit_of_work=MagicMock(),
     )
 
     request = _base_request(document.id, "CLIENT_INVOICE")
@@ -79,11 +82,12 @@ def test_confirm_client_invoice_persists_invoice_booking_and_document() -> None:
     assert response.document_type == "CLIENT_INVOICE"
     assert response.status == "PROCESSED"
     assert response.invoice_id is not None
-    assert response.booking_ids == ["BL-001"]
+    assert response.booking_ids == ("BL-001",)
 
     client_repo.save.assert_called_once()
     invoice_repo.save_client_invoice.assert_called_once()
-    booking_repo.save.assert_called_once()
+    booking_repo.update_many.assert_called_once()
+    assert len(booking_repo.update_many.call_args[0][0]) == 1
     document_repo.update.assert_called()
     assert document.status == ProcessingStatus.PROCESSED
     assert document.document_type == DocumentType.CLIENT_INVOICE
@@ -106,8 +110,9 @@ def test_confirm_provider_invoice_multi_booking_persists_costs() -> None:
     }
 
     booking_repo = MagicMock()
-    booking_repo.find_or_create.side_effect = lambda bl: booking_map[bl]
+    booking_repo.find_or_create_many.return_value = booking_map
     invoice_repo = MagicMock()
+    invoice_repo.delete_by_source_document.return_value = []
     invoice_repo.find_provider_invoice.return_value = None
     client_repo = MagicMock()
     provider_repo = MagicMock()
@@ -123,6 +128,7 @@ def test_confirm_provider_invoice_multi_booking_persists_costs() -> None:
         invoice_repo=invoice_repo,
         client_repo=client_repo,
         provider_repo=provider_repo,
+        unit_of_work=MagicMock(),
     )
 
     request = ConfirmInvoiceRequest(
@@ -159,16 +165,131 @@ def test_confirm_provider_invoice_multi_booking_persists_costs() -> None:
     response = use_case.execute(request)
 
     assert response.document_type == "PROVIDER_INVOICE"
-    assert response.booking_ids == ["BL-001", "BL-002"]
+    assert response.booking_ids == ("BL-001", "BL-002")
     assert response.invoice_id is not None
     invoice_repo.save_provider_invoice.assert_called_once()
-    assert booking_repo.save.call_count == 2
+    booking_repo.update_many.assert_called_once()
+    assert len(booking_repo.update_many.call_args[0][0]) == 2
 
     saved_invoice = invoice_repo.save_provider_invoice.call_args[0][0]
     assert isinstance(saved_invoice, ProviderInvoice)
     assert len(saved_invoice.charges) == 2
 
 
+def test_confirm_applies_shipping_details_to_every_booking() -> None:
+    document = _make_document()
+
+    document_repo = MagicMock()
+    document_repo.find_by_id.return_value = document
+    booking_map = {
+        "BL-001": Booking.create("BL-001"),
+        "BL-002": Booking.create("BL-002"),
+    }
+    booking_repo = MagicMock()
+    booking_repo.find_or_create_many.return_value = booking_map
+    invoice_repo = MagicMock()
+    invoice_repo.delete_by_source_document.return_value = []
+    invoice_repo.find_client_invoice.return_value = None
+    client_repo = MagicMock()
+    client_repo.find_by_nif.return_value = None
+
+    use_case = ConfirmInvoiceUseCase(
+        document_repo=document_repo,
+        booking_repo=booking_repo,
+        invoice_repo=invoice_repo,
+        client_repo=client_repo,
+        provider_repo=MagicMock(),
+        unit_of_work=MagicMock(),
+    )
+
+    request = replace(
+        _base_request(document.id, "CLIENT_INVOICE"),
+        bl_references=["BL-001", "BL-002"],
+        charges=[
+            SaveChargeInput(
+                bl_reference=bl_reference,
+                description="Ocean Freight",
+                category="FREIGHT",
+                amount="500.00",
+            )
+            for bl_reference in ("BL-001", "BL-002")
+        ],
+        shipping_details={
+            "pol": {"code": "ESVAL", "name": "Valencia"},
+            "vessel": "MSC Aurora",
+            "containers": ["MSCU1234567", ""],
+        },
+    )
+
+    use_case.execute(request)
+
+    for booking in booking_map.values():
+        assert booking.pol == Port(code="ESVAL", name="Valencia")
+        assert booking.vessel == "MSC Aurora"
+        assert booking.containers == ["MSCU1234567"]
+    assert booking_map["BL-001"].containers is not booking_map["BL-002"].containers
+
+
+def test_confirm_accepts_numeric_totals() -> None:
+    document = _make_document()
+
+    document_repo = MagicMock()
+    document_repo.find_by_id.return_value = document
+    booking_repo = MagicMock()
+    booking_repo.find_or_create_many.return_value = {"BL-001": Booking.create("BL-001")}
+    invoice_repo = MagicMock()
+    invoice_repo.delete_by_source_document.return_value = []
+    invoice_repo.find_client_invoice.return_value = None
+    client_repo = MagicMock()
+    client_repo.find_by_nif.return_value = None
+
+    use_case = ConfirmInvoiceUseCase(
+        document_repo=document_repo,
+        booking_repo=booking_repo,
+        invoice_repo=invoice_repo,
+        client_repo=client_repo,
+        provider_repo=MagicMock(),
+        unit_of_work=MagicMock(),
+    )
+
+    request = replace(
+        _base_request(document.id),
+        totals={"tax_amount": 210, "total": Decimal("1210.005")},
+    )
+    use_case.execute(request)
+
+    saved_invoice = invoice_repo.save_client_invoice.call_args[0][0]
+    assert saved_invoice.tax_amount == Money.from_float(210.00)
+    assert saved_invoice.total_amount == Money.from_float(1210.01)
+
+
+def test_confirm_rejects_boolean_total() -> None:
+    document = _make_document()
+
+    document_repo = MagicMock()
+    document_repo.find_by_id.return_value = document
+    invoice_repo = MagicMock()
+    invoice_repo.find_client_invoice.return_value = None
+    client_repo = MagicMock()
+    client_repo.find_by_nif.return_value = None
+
+    use_case = ConfirmInvoiceUseCase(
+        document_repo=document_repo,
+        booking_repo=MagicMock(),
+        invoice_repo=invoice_repo,
+        client_repo=client_repo,
+        provider_repo=MagicMock(),
+        unit_of_work=MagicMock(),
+    )
+
+    # bool subclasses int, but True must not be booked as 1.00
+    request = replace(_base_request(document.id), totals={"total": True})
+    with pytest.raises(InvalidOperation):
+        use_case.execute(request)
+
+    invoice_repo.save_client_invoice.assert_not_called()
+
+
 def test_confirm_other_document_marks_processed_without_invoice() -> None:
     document = _make_document()
 
@@ -181,6 +302,7 @@ def test_confirm_other_document_marks_processed_without_invoice() -> None:
         invoice_repo=MagicMock(),
         client_repo=MagicMock(),
         provider_repo=MagicMock(),
+        unit_of_work=MagicMock(),
     )
 
     request = ConfirmInvoiceRequest(
@@ -194,7 +316,7 @@ def test_confirm_other_document_marks_processed_without_invoice() -> None:
 
     assert response.document_type == "OTHER"
     assert response.invoice_id is None
-    assert response.booking_ids == []
+    assert response.booking_ids == ()
     assert document.status == ProcessingStatus.PROCESSED
     document_repo.update.assert_called_once()
 
@@ -220,17 +342,20 @@ def test_confirm_duplicate_client_invoice_raises_error() -> None:
         tax_amount=Money.from_float(210.0),
     )
 
+    unit_of_work = MagicMock()
     use_case = ConfirmInvoiceUseCase(
         document_repo=document_repo,
         booking_repo=booking_repo,
         invoice_repo=invoice_repo,
         client_repo=client_repo,
         provider_repo=provider_repo,
+        unit_of_work=unit_of_work,
     )
 
     request = _base_request(document.id, "CLIENT_INVOICE")
     with pytest.raises(ValueError, match="already exists"):
         use_case.execute(request)
+    unit_of_work.commit.assert_not_called()
 
 
 def test_confirm_reprocess_cleans_previous_projection_before_duplicate_check() -> None:
@@ -241,8 +366,8 @@ def test_confirm_reprocess_cleans_previous_projection_before_duplicate_check() -
     document_repo = MagicMock()
     document_repo.find_by_id.return_value = document
     booking_repo = MagicMock()
-    booking_repo.list_all.return_value = []
-    booking_repo.find_or_create.return_value = Booking.create("BL-001")
+    booking_repo.find_by_invoice_ids.return_value = []
+    booking_repo.find_or_create_many.return_value = {"BL-001": Booking.create("BL-001")}
     invoice_repo = MagicMock()
     client_repo = MagicMock()
     provider_repo = MagicMock()
@@ -267,6 +392,7 @@ def test_confirm_reprocess_cleans_previous_projection_before_duplicate_check() -
         invoice_repo=invoice_repo,
         client_repo=client_repo,
         provider_repo=provider_repo,
+        unit_of_work=MagicMock(),
     )
 
     request = _base_request(document.id, "CLIENT_INVOICE")
@@ -297,8 +423,8 @@ def test_confirm_reprocess_replaces_old_booking_charges() -> None:
     document_repo = MagicMock()
     document_repo.find_by_id.return_value = document
     booking_repo = MagicMock()
-    booking_repo.list_all.return_value = [existing_booking]
-    booking_repo.find_or_create.return_value = existing_booking
+    booking_repo.find_by_invoice_ids.return_value = [existing_booking]
+    booking_repo.find_or_create_many.return_value = {"BL-001": existing_booking}
     invoice_repo = MagicMock()
     invoice_repo.delete_by_source_document.return_value = [old_invoice_id]
     invoice_repo.find_client_invoice.return_value = None
@@ -312,6 +438,7 @@ def test_confirm_reprocess_replaces_old_booking_charges() -> None:
         invoice_repo=invoice_repo,
         client_repo=client_repo,
         provider_repo=provider_repo,
+        unit_of_work=MagicMock(),
     )
 
     request = _base_request(document.id, "CLIENT_INVOICE")
@@ -320,7 +447,7 @@ def test_confirm_reprocess_replaces_old_booking_charges() -> None:
     assert response.status == "PROCESSED"
     assert all(charge.invoice_id != old_invoice_id for charge in existing_booking.revenue_charges)
     assert len(existing_booking.revenue_charges) == 1
-    assert booking_repo.update.call_count >= 1
+    assert booking_repo.update_many.call_count >= 1
 
 
 def test_confirm_reprocess_invalid_payload_keeps_existing_projection() -> None:
@@ -331,7 +458,7 @@ def test_confirm_reprocess_invalid_payload_keeps_existing_projection() -> None:
     document_repo = MagicMock()
     document_repo.find_by_id.return_value = document
     booking_repo = MagicMock()
-    booking_repo.list_all.return_value = []
+    booking_repo.find_by_invoice_ids.return_value = []
     invoice_repo = MagicMock()
     client_repo = MagicMock()
     provider_repo = MagicMock()
@@ -342,6 +469,7 @@ def test_confirm_reprocess_invalid_payload_keeps_existing_projection() -> None:
         invoice_repo=invoice_repo,
         client_repo=client_repo,
         provider_repo=provider_repo,
+        unit_of_work=MagicMock(),
     )
 
     request = replace(_base_request(document.id, "CLIENT_INVOICE"), charges=[])
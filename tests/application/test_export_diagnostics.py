@@ -6,6 +6,7 @@ import json
 import zipfile
 from unittest.mock import MagicMock
 
+from backend.application.use_cases import export_diagnostics
 from backend.application.use_cases.export_diagnostics import ExportDiagnosticsUseCase
 from backend.domain.entities.configuration import Settings
 from backend.domain.enums import ProcessingStatus
@@ -142,3 +143,55 @@ def test_export_diagnostics_handles_missing_logs(tmp_path) -> None:
     with zipfile.ZipFile(result.bundle_path) as archive:
         error_report = archive.read("error-report.txt").decode("utf-8")
         assert "No ERROR entries found" in error_report
+
+
+def test_export_diagnostics_error_report_matches_level_only(tmp_path) -> None:
+    logs_dir = tmp_path / "logs"
+    diagnostics_dir = tmp_path / "diagnostics"
+    logs_dir.mkdir(parents=True)
+    diagnostics_dir.mkdir(parents=True)
+
+    (logs_dir / "app-2026-03-02.log").write_text(
+        "\n".join(
+            [
+                json.dumps(
+                    {"level": "INFO", "component": "tests", "message": "retrying after error"}
+                ),
+                json.dumps(
+                    {"level": "error", "component": "tests", "message": "compact failure"},
+                    separators=(",", ":"),
+                ),
+                "plain text line with level ERROR",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    use_case = _build_use_case(logs_dir=logs_dir, diagnostics_dir=diagnostics_dir)
+    result = use_case.execute()
+
+    with zipfile.ZipFile(result.bundle_path) as archive:
+        error_report = archive.read("error-report.txt").decode("utf-8")
+        assert "compact failure" in error_report
+        assert "retrying after error" not in error_report
+        assert "plain text line" not in error_report
+
+
+def test_export_diagnostics_truncates_log_to_whole_tail_lines(tmp_path, monkeypatch) -> None:
+    logs_dir = tmp_path / "logs"
+    diagnostics_dir = tmp_path / "diagnostics"
+    logs_dir.mkdir(parents=True)
+    diagnostics_dir.mkdir(parents=True)
+    monkeypatch.setattr(export_diagnostics, "MAX_BYTES_PER_LOG_FILE", 20)
+
+    (logs_dir / "app-2026-03-03.log").write_text(
+        "first line that is dropped\nsecond line\nthird line", encoding="utf-8"
+    )
+
+    use_case = _build_use_case(logs_dir=logs_dir, diagnostics_dir=diagnostics_dir)
+    result = use_case.execute()
+
+    assert result.warnings == ["One or more large log files were truncated for export."]
+    with zipfile.ZipFile(result.bundle_path) as archive:
+        assert archive.read("logs/app-2026-03-03.log").decode("utf-8") == "third line"
+        assert "app-2026-03-03.log" in archive.read("logs/TRUNCATION_NOTES.txt").decode("utf-8")
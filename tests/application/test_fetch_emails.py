@@ -9,8 +9,6 @@ import pytest
 from backend.application.dtos.document_dtos import FetchEmailsRequest
 from backend.application.use_cases.fetch_emails import FetchEmailsUseCase
 from backend.domain.entities.configuration import Settings
-from backend.domain.entities.document import Document
-from backend.domain.value_objects import FileHash
 from backend.ports.output.email_client import (
     EmailAttachment,
     EmailAuthError,
@@ -35,6 +33,7 @@ def test_fetch_emails_requires_connected_outlook(tmp_path: Path) -> None:
         settings_repo=settings_repo,
         email_client=email_client,
         storage_root=tmp_path,
+        unit_of_work=MagicMock(),
     )
 
     with pytest.raises(ValueError, match="Outlook is not connected"):
@@ -67,17 +66,14 @@ def test_fetch_emails_imports_new_pdfs_and_skips_duplicates(tmp_path: Path) -> N
     email_client = MagicMock()
     email_client.fetch_messages_with_pdf_attachments.return_value = [message]
 
-    existing = Document.create(
-        filename="existing.pdf",
-        file_hash=FileHash.sha256("existing-hash"),
-    )
-    document_repo.find_by_file_hash.side_effect = [None, existing]
+    document_repo.exists_by_file_hash.side_effect = [False, True]
 
     use_case = FetchEmailsUseCase(
         document_repo=document_repo,
         settings_repo=settings_repo,
         email_client=email_client,
         storage_root=tmp_path,
+        unit_of_work=MagicMock(),
     )
     result = use_case.execute(FetchEmailsRequest(max_messages=10))
 
@@ -85,15 +81,57 @@ def test_fetch_emails_imports_new_pdfs_and_skips_duplicates(tmp_path: Path) -> N
     assert result.pdf_attachments_found == 2
     assert result.imported_documents == 1
     assert result.duplicate_documents == 1
-    document_repo.save.assert_called_once()
+    document_repo.save_many.assert_called_once()
 
-    saved_document = document_repo.save.call_args[0][0]
+    saved_documents = document_repo.save_many.call_args[0][0]
+    assert len(saved_documents) == 1
+    saved_document = saved_documents[0]
     assert saved_document.storage_path is not None
     stored_path = Path(saved_document.storage_path)
     assert stored_path.exists()
     assert stored_path.read_bytes() == b"pdf-content-a"
 
 
+def test_fetch_emails_skips_duplicates_within_batch(tmp_path: Path) -> None:
+    document_repo = MagicMock()
+    document_repo.exists_by_file_hash.return_value = False
+    settings_repo = MagicMock()
+    settings_repo.get.return_value = _connected_settings()
+
+    attachment = EmailAttachment(
+        filename="invoice.pdf",
+        content_type="application/pdf",
+        content=b"same-content",
+    )
+    messages = [
+        EmailMessage(
+            message_id=f"msg-00{index}",
+            subject="Invoice",
+            sender="ops@example.com",
+            received_at=datetime.now(),
+            attachments=(attachment,),
+        )
+        for index in range(2)
+    ]
+    email_client = MagicMock()
+    email_client.fetch_messages_with_pdf_attachments.return_value = messages
+
+    unit_of_work = MagicMock()
+    use_case = FetchEmailsUseCase(
+        document_repo=document_repo,
+        settings_repo=settings_repo,
+        email_client=email_client,
+        storage_root=tmp_path,
+        unit_of_work=unit_of_work,
+    )
+    result = use_case.execute(FetchEmailsRequest(max_messages=10))
+
+    assert result.imported_documents == 1
+    assert result.duplicate_documents == 1
+    assert len(document_repo.save_many.call_args[0][0]) == 1
+    unit_of_work.commit.assert_called_once()
+
+
 def test_fetch_emails_maps_auth_errors(tmp_path: Path) -> None:
     document_repo = MagicMock()
     settings_repo = MagicMock()
@@ -109,6 +147,7 @@ def test_fetch_emails_maps_auth_errors(tmp_path: Path) -> None:
         settings_repo=settings_repo,
         email_client=email_client,
         storage_root=tmp_path,
+        unit_of_work=MagicMock(),
     )
 
     with pytest.raises(ValueError, match="authentication failed"):
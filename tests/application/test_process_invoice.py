@@ -156,6 +156,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         request = ProcessInvoiceRequest(document_id=doc.id)
@@ -197,6 +198,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         with pytest.raises(ValueError, match="API key not configured"):
@@ -216,6 +218,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         with pytest.raises(ValueError, match="Company NIF not configured"):
@@ -236,6 +239,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         with pytest.raises(ValueError, match="Document not found"):
@@ -259,6 +263,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         with pytest.raises(ValueError, match="cannot be processed"):
@@ -285,6 +290,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         result = use_case.execute(
@@ -316,6 +322,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         with pytest.raises(ValueError, match="timed out"):
@@ -345,6 +352,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         with pytest.raises(ValueError, match="invalid"):
@@ -375,6 +383,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         with pytest.raises(ValueError, match="rate limit"):
@@ -408,6 +417,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         response = use_case.execute(ProcessInvoiceRequest(document_id=doc.id))
@@ -444,6 +454,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         response = use_case.execute(ProcessInvoiceRequest(document_id=doc.id))
@@ -500,6 +511,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         use_case.execute(ProcessInvoiceRequest(document_id=doc.id))
@@ -550,6 +562,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         use_case.execute(ProcessInvoiceRequest(document_id=doc.id))
@@ -580,6 +593,7 @@ class TestProcessInvoiceUseCase:
             settings_repo=settings_repo,
             company_repo=company_repo,
             ai_extractor=ai_extractor,
+            unit_of_work=MagicMock(),
         )
 
         with pytest.raises(ValueError, match="AI extraction failed"):
@@ -3,9 +3,16 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.adapters.security import outlook_token_vault
 from backend.main import app
 
 
+@pytest.fixture(autouse=True)
+def _disable_keychain(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tests off the real macOS Keychain; vault tests opt back in explicitly."""
+    monkeypatch.setattr(outlook_token_vault, "_USE_KEYCHAIN", False)
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Create a test client for the FastAPI app."""
@@ -3,6 +3,8 @@
 from datetime import datetime
 from uuid import uuid4
 
+import pytest
+
 from backend.domain.enums import ChargeCategory, ConfidenceLevel, ErrorType, ProviderType
 from backend.domain.value_objects import (
     BookingCharge,
@@ -339,3 +341,27 @@ class TestErrorInfo:
         # Non-retryable errors
         assert not ErrorInfo.duplicate_document().is_retryable
         assert not ErrorInfo.invalid_currency("USD").is_retryable
+
+
+class TestValueObjectLayout:
+    """Tests for value object memory layout."""
+
+    @pytest.mark.parametrize(
+        "value_object_type",
+        [
+            BookingCharge,
+            ClientInfo,
+            DocumentReference,
+            EmailReference,
+            ErrorInfo,
+            ExtractionMetadata,
+            FieldConfidence,
+            FileHash,
+            Money,
+            Port,
+        ],
+    )
+    def test_value_objects_are_slotted(self, value_object_type: type) -> None:
+        """Value objects are hydrated in bulk by mappers and must not carry a __dict__."""
+        assert "__slots__" in vars(value_object_type)
+        assert "__dict__" not in vars(value_object_type)
@@ -0,0 +1,25 @@
+"""Application startup tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+
+
+def test_startup_survives_missing_schema(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the app still boots when the settings table has not been migrated."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=engine))
+
+    with TestClient(main.app) as client:
+        response = client.get("/health")
+
+    assert response.status_code == 200
+    engine.dispose()